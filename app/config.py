@@ -21,6 +21,10 @@ Optional environment variables:
 - OPENAI_MODEL: Model for greeting generation (default: gpt-4o-mini)
 - OPENAI_MAX_TOKENS: Max tokens for greeting response (default: 150)
 - OPENAI_TEMPERATURE: Creativity level (default: 0.7)
+- OPENAI_MAX_CONNECTIONS: Connection pool size for OpenAI calls (default: 200)
+- OPENAI_MAX_KEEPALIVE: Idle keep-alive connections kept for OpenAI (default: 100)
+- TRUST_SIGNED_PAYLOAD: Validate transcript entries of HMAC-verified post-call
+  payloads with msgspec instead of Pydantic (default: false)
 """
 
 import os
@@ -65,6 +69,11 @@ class Settings:
     OPENAI_MAX_TOKENS: int = field(default=150)
     OPENAI_TEMPERATURE: float = field(default=0.7)
     OPENAI_TIMEOUT: int = field(default=30)  # seconds
+    OPENAI_MAX_CONNECTIONS: int = field(default=200)
+    OPENAI_MAX_KEEPALIVE: int = field(default=100)
+
+    # Webhook Processing Configuration
+    TRUST_SIGNED_PAYLOAD: bool = field(default=False)
 
     def __post_init__(self) -> None:
         """Load environment variables after initialization."""
@@ -155,6 +164,17 @@ class Settings:
         self.OPENAI_TIMEOUT = self._validate_int_range(
             os.getenv("OPENAI_TIMEOUT", "30"), 5, 120, "OPENAI_TIMEOUT", 30
         )
+        self.OPENAI_MAX_CONNECTIONS = self._validate_int_range(
+            os.getenv("OPENAI_MAX_CONNECTIONS", "200"), 1, 1000, "OPENAI_MAX_CONNECTIONS", 200
+        )
+        self.OPENAI_MAX_KEEPALIVE = self._validate_int_range(
+            os.getenv("OPENAI_MAX_KEEPALIVE", "100"), 1, 1000, "OPENAI_MAX_KEEPALIVE", 100
+        )
+
+        # Webhook Processing Configuration
+        self.TRUST_SIGNED_PAYLOAD = os.getenv(
+            "TRUST_SIGNED_PAYLOAD", "false"
+        ).strip().lower() in ("1", "true", "yes")
 
     def validate(self) -> None:
         """Validate that all required environment variables are set.
@@ -8,6 +8,7 @@ This module initializes the FastAPI application with:
 - CORS configuration for development
 """
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
@@ -17,6 +18,12 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import settings, validate_startup_configuration, ConfigurationError
+from app.memory.http_client import (
+    close_openmemory_http_client,
+    warm_up_openmemory_http_client,
+)
+from app.services.agent_cache import close_elevenlabs_client, warm_up_elevenlabs_client
+from app.services.openai_service import close_openai_client, warm_up_openai_client
 from app.webhooks.client_data import router as client_data_router
 from app.webhooks.search_data import router as search_data_router
 from app.webhooks.post_call import router as post_call_router
@@ -34,14 +41,19 @@ async def lifespan(app: FastAPI):
     """Application lifespan manager.
 
     Handles startup and shutdown events:
-    - Startup: Validates configuration
-    - Shutdown: Cleanup resources
+    - Startup: Validates configuration and pre-warms upstream connections
+    - Shutdown: Cleanup resources (shared HTTP clients)
     """
     # Startup
     logger.info("Starting ElevenLabs OpenMemory Integration...")
+    warm_up_task = None
     try:
         validate_startup_configuration()
         logger.info("Configuration validated successfully")
+
+        # Open keep-alive connections in the background so the first webhook
+        # doesn't pay the TCP/TLS handshake, without delaying startup on them
+        warm_up_task = asyncio.create_task(_warm_up_connections())
     except ConfigurationError as e:
         logger.warning(f"Configuration validation skipped in dev mode: {e}")
 
@@ -49,6 +61,22 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down ElevenLabs OpenMemory Integration...")
+    if warm_up_task is not None:
+        warm_up_task.cancel()
+        await asyncio.gather(warm_up_task, return_exceptions=True)
+    await close_elevenlabs_client()
+    await close_openai_client()
+    await close_openmemory_http_client()
+
+
+async def _warm_up_connections() -> None:
+    """Pre-warm the upstream HTTP clients; each warm-up ignores its failures."""
+    await asyncio.gather(
+        warm_up_openmemory_http_client(),
+        warm_up_elevenlabs_client(),
+        warm_up_openai_client(),
+        return_exceptions=True,
+    )
 
 
 # Create FastAPI application
@@ -5,9 +5,10 @@ integration. It includes:
 
 - Profiles: Caller profile management and dynamic variable building
 - Extraction: Transcript processing and memory storage
+- Caller cache: Short-lived cache of per-caller profile and agent state lookups
 
-All memory operations use direct HTTP calls via httpx.AsyncClient to avoid
-async event loop conflicts. Phone numbers are used as userId for multi-tenant
+All memory operations use direct HTTP calls over a shared, pooled
+httpx.AsyncClient (app.memory.http_client) to avoid async event loop conflicts. Phone numbers are used as userId for multi-tenant
 isolation, and memories are stored with decayLambda=0 for permanent retention.
 """
 
@@ -24,6 +25,7 @@ from app.memory.extraction import (
     extract_user_messages,
     create_profile_memories,
     store_conversation_memories,
+    store_memories_bulk,
     search_memories,
 )
 
@@ -39,5 +41,6 @@ __all__ = [
     "extract_user_messages",
     "create_profile_memories",
     "store_conversation_memories",
+    "store_memories_bulk",
     "search_memories",
 ]
@@ -0,0 +1,238 @@
+"""Short-lived cache for per-caller memory lookups.
+
+This module provides:
+- In-memory cache of Tier 1 (universal profile) and Tier 2 (agent state)
+  lookups, keyed by phone number and (phone number, agent_id)
+- TTL expiry and LRU eviction so the cache stays bounded
+- Single-flight fetching so concurrent misses share one OpenMemory query
+- Negative cache of new callers (no profile, no agent state) so repeat
+  calls from unknown numbers skip both lookups. Only lookups that
+  completed and found nothing mark a caller new; a failed lookup never does
+- invalidate_caller(): Drop a caller's entries once post-call processing
+  has written new memories
+
+The TTL is deliberately short: the cache only absorbs retries, warm
+transfers and webhook bursts for the same caller, it is not a second
+source of truth for OpenMemory. invalidate_caller() only reaches the
+worker process that ran post-call processing, so entries in other workers
+live until their TTL expires.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, Optional
+
+from app.memory.profiles import (
+    OpenMemoryLookupError,
+    get_agent_conversation_state,
+    get_universal_user_profile,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class CallerLookupCache:
+    """In-memory TTL/LRU cache for caller profile and agent state lookups.
+
+    Only found results are cached; a None lookup (nothing stored) is passed
+    through so the next call queries again, and a failed lookup raises
+    OpenMemoryLookupError. Callers the client-data webhook found nothing for
+    at all are remembered separately via mark_new_caller().
+
+    Attributes:
+        _cache: Internal cache mapping lookup key to (expires_at, result),
+            where expires_at is a time.monotonic() deadline
+        _ttl_seconds: Time-to-live for cache entries in seconds
+        _max_size: Maximum number of cached lookups
+        _inflight: In-progress lookup tasks keyed by lookup key
+        _new_callers: Phone numbers with no memories, mapped to their
+            time.monotonic() expiry deadline
+        _new_caller_ttl_seconds: Time-to-live for new caller entries in seconds
+        _max_new_callers: Maximum number of remembered new callers
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 30.0,
+        max_size: int = 10_000,
+        new_caller_ttl_seconds: float = 60.0,
+        max_new_callers: int = 50_000,
+    ):
+        """Initialize the cache with specified TTLs and size bounds.
+
+        Args:
+            ttl_seconds: Seconds before cache entries expire. Default: 30
+            max_size: Maximum number of cached lookups. Default: 10000
+            new_caller_ttl_seconds: Seconds a caller with no memories is
+                remembered before OpenMemory is asked again. Default: 60
+            max_new_callers: Maximum number of remembered new callers.
+                Default: 50000
+        """
+        self._cache: OrderedDict[Hashable, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._ttl_seconds = ttl_seconds
+        self._max_size = max_size
+        self._inflight: dict[Hashable, asyncio.Task[Optional[dict[str, Any]]]] = {}
+        self._new_callers: OrderedDict[str, float] = OrderedDict()
+        self._new_caller_ttl_seconds = new_caller_ttl_seconds
+        self._max_new_callers = max_new_callers
+
+    def is_new_caller(self, phone_number: str) -> bool:
+        """Check whether a caller recently had no memories at all.
+
+        Args:
+            phone_number: The user's phone number in E.164 format.
+
+        Returns:
+            True if mark_new_caller() was called for this number within the
+            new caller TTL and it has not been invalidated since.
+        """
+        expires_at = self._new_callers.get(phone_number)
+        if expires_at is None:
+            return False
+        if expires_at <= time.monotonic():
+            del self._new_callers[phone_number]
+            return False
+        return True
+
+    def mark_new_caller(self, phone_number: str) -> None:
+        """Remember that a caller has no profile and no agent state.
+
+        Args:
+            phone_number: The user's phone number in E.164 format.
+        """
+        self._new_callers[phone_number] = time.monotonic() + self._new_caller_ttl_seconds
+        self._new_callers.move_to_end(phone_number)
+        while len(self._new_callers) > self._max_new_callers:
+            self._new_callers.popitem(last=False)
+
+    async def get_universal_profile(self, phone_number: str) -> Optional[dict[str, Any]]:
+        """Get a caller's Tier 1 universal profile, from cache if fresh.
+
+        Args:
+            phone_number: The user's phone number in E.164 format.
+
+        Returns:
+            The universal profile, or None if the caller has none.
+
+        Raises:
+            OpenMemoryLookupError: If the OpenMemory query failed.
+        """
+        return await self._get(
+            ("profile", phone_number),
+            lambda: get_universal_user_profile(phone_number, raise_errors=True),
+        )
+
+    async def get_agent_state(
+        self,
+        phone_number: str,
+        agent_id: str
+    ) -> Optional[dict[str, Any]]:
+        """Get a caller's Tier 2 state for an agent, from cache if fresh.
+
+        Args:
+            phone_number: The user's phone number in E.164 format.
+            agent_id: The unique identifier of the ElevenLabs agent.
+
+        Returns:
+            The agent conversation state, or None if there is none.
+
+        Raises:
+            OpenMemoryLookupError: If the OpenMemory query failed.
+        """
+        return await self._get(
+            ("agent_state", phone_number, agent_id),
+            lambda: get_agent_conversation_state(phone_number, agent_id, raise_errors=True),
+        )
+
+    async def _get(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Optional[dict[str, Any]]]],
+    ) -> Optional[dict[str, Any]]:
+        """Return a fresh cached lookup, or run (or join) the fetch for it.
+
+        Args:
+            key: Cache key for the lookup.
+            fetch: Zero-argument coroutine function performing the lookup.
+
+        Returns:
+            The lookup result.
+        """
+        entry = self._cache.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                self._cache.move_to_end(key)
+                return entry[1]
+            del self._cache[key]
+
+        # Join an in-progress lookup, or start one. shield() keeps a cancelled
+        # caller from cancelling the lookup other callers are waiting on.
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_and_store(key, fetch))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        return await asyncio.shield(task)
+
+    async def _fetch_and_store(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Optional[dict[str, Any]]]],
+    ) -> Optional[dict[str, Any]]:
+        """Run a lookup and cache a found result.
+
+        Args:
+            key: Cache key for the lookup.
+            fetch: Zero-argument coroutine function performing the lookup.
+
+        Returns:
+            The lookup result.
+        """
+        result = await fetch()
+        if result is not None:
+            self._cache[key] = (time.monotonic() + self._ttl_seconds, result)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._max_size:
+                self._cache.popitem(last=False)
+        return result
+
+    def invalidate_caller(self, phone_number: str, agent_id: Optional[str] = None) -> None:
+        """Drop a caller's cached lookups after their memories change.
+
+        Args:
+            phone_number: The user's phone number in E.164 format.
+            agent_id: Agent whose state changed. If None, only the
+                universal profile and new caller entries are dropped.
+        """
+        self._new_callers.pop(phone_number, None)
+        self._cache.pop(("profile", phone_number), None)
+        if agent_id is not None:
+            self._cache.pop(("agent_state", phone_number, agent_id), None)
+        logger.debug("Invalidated cached lookups for %s", phone_number)
+
+    def clear(self) -> None:
+        """Remove all cached lookups and new caller entries."""
+        self._cache.clear()
+        self._new_callers.clear()
+
+
+# Module-level singleton instance
+_cache_instance: Optional[CallerLookupCache] = None
+
+
+def get_caller_lookup_cache() -> CallerLookupCache:
+    """Get the singleton CallerLookupCache instance.
+
+    Creates the instance on first call (lazy initialization).
+
+    Returns:
+        The singleton CallerLookupCache instance.
+    """
+    global _cache_instance
+    if _cache_instance is None:
+        _cache_instance = CallerLookupCache()
+    return _cache_instance
@@ -5,6 +5,7 @@ This module provides functions for:
 - Filtering transcript for user messages
 - Creating profile memories with high salience
 - Storing conversation memories
+- Storing a mixed batch of memories concurrently (store_memories_bulk)
 - Searching memories for search-data webhook
 
 All memories are stored with:
@@ -13,12 +14,14 @@ All memories are stored with:
 - Appropriate salience values
 """
 
+import asyncio
 import logging
 from typing import Any, Optional
 
 import httpx
 
 from app.config import settings
+from app.memory.http_client import get_openmemory_http_client
 from app.models.requests import TranscriptEntry, DataCollectionResult
 
 logger = logging.getLogger(__name__)
@@ -28,6 +31,9 @@ PERMANENT_DECAY = 0  # decayLambda=0 for permanent retention
 HIGH_SALIENCE = 0.9  # High importance for profile facts
 MEDIUM_SALIENCE = 0.7  # Medium importance for conversation messages
 
+# Maximum /memory/add requests in flight for one store_memories_bulk() call
+MAX_CONCURRENT_MEMORY_WRITES = 10
+
 
 def extract_user_info(
     data_collection_results: dict[str, DataCollectionResult]
@@ -83,16 +89,15 @@ def extract_user_messages(transcript: list[TranscriptEntry]) -> list[dict[str, A
     return user_messages
 
 
-async def create_profile_memories(
+def build_profile_memory_payloads(
     user_info: dict[str, Any],
     phone_number: str,
     conversation_context: dict[str, Any] | None = None
 ) -> list[dict[str, Any]]:
-    """Store profile facts as memories with high salience.
+    """Build OpenMemory add payloads for profile facts.
 
-    Creates permanent memories for extracted user profile information.
-    Each piece of information is stored as a separate memory for
-    better retrieval and granularity.
+    Each piece of information becomes a separate permanent memory with
+    high salience, for better retrieval and granularity.
 
     Args:
         user_info: Dictionary of user information (e.g., {"first_name": "Stefan"}).
@@ -101,10 +106,114 @@ async def create_profile_memories(
             and event_timestamp for grouping memories together.
 
     Returns:
-        A list of memory creation results from OpenMemory.
+        A list of /memory/add payloads.
     """
-    if not user_info:
-        logger.info("No user info to store")
+    payloads = []
+
+    for key, value in user_info.items():
+        if value is None:
+            continue
+
+        # Create human-readable content
+        content = _format_profile_content(key, value)
+
+        if not content:
+            continue
+
+        # Build metadata with conversation context for grouping
+        metadata = {
+            "field": key,
+            "value": str(value),
+        }
+        if conversation_context:
+            metadata["conversation_id"] = conversation_context.get("conversation_id")
+            metadata["timestamp_utc"] = conversation_context.get("timestamp_utc")
+            metadata["event_timestamp"] = conversation_context.get("event_timestamp")
+
+        payloads.append({
+            "content": content,
+            "tags": ["profile", key],
+            "metadata": metadata,
+            "user_id": phone_number,
+            "salience": HIGH_SALIENCE,
+            "decay_lambda": PERMANENT_DECAY
+        })
+
+    return payloads
+
+
+def build_conversation_memory_payloads(
+    messages: list[dict[str, Any]],
+    phone_number: str,
+    conversation_context: dict[str, Any] | None = None
+) -> list[dict[str, Any]]:
+    """Build OpenMemory add payloads for individual user messages.
+
+    Each user message becomes a separate permanent memory with medium
+    salience. Messages shorter than 3 characters are skipped.
+
+    Args:
+        messages: List of dicts with 'message' and 'time_in_call_secs' keys.
+        phone_number: The user's phone number for userId isolation.
+        conversation_context: Optional dict with conversation_id, timestamp_utc,
+            and event_timestamp for grouping memories together.
+
+    Returns:
+        A list of /memory/add payloads.
+    """
+    payloads = []
+
+    for idx, msg_data in enumerate(messages):
+        message = msg_data.get("message", "")
+        time_in_call_secs = msg_data.get("time_in_call_secs")
+
+        if not message or len(message.strip()) < 3:
+            continue
+
+        # Build metadata with conversation context for grouping
+        metadata = {
+            "message_index": idx,
+            "type": "user_utterance",
+            "time_in_call_secs": time_in_call_secs,
+        }
+        if conversation_context:
+            metadata["conversation_id"] = conversation_context.get("conversation_id")
+            metadata["timestamp_utc"] = conversation_context.get("timestamp_utc")
+            metadata["event_timestamp"] = conversation_context.get("event_timestamp")
+
+        payloads.append({
+            "content": message,
+            "tags": ["conversation", "user_message"],
+            "metadata": metadata,
+            "user_id": phone_number,
+            "salience": MEDIUM_SALIENCE,
+            "decay_lambda": PERMANENT_DECAY
+        })
+
+    return payloads
+
+
+async def store_memories_bulk(
+    payloads: list[dict[str, Any]],
+    phone_number: str
+) -> list[dict[str, Any]]:
+    """Store a batch of memories in OpenMemory.
+
+    OpenMemory has no bulk add endpoint, so the /memory/add requests are
+    issued concurrently over the shared connection pool, at most
+    MAX_CONCURRENT_MEMORY_WRITES at a time; a failed item is logged and
+    skipped without affecting the rest.
+
+    Args:
+        payloads: /memory/add payloads, e.g. from build_profile_memory_payloads()
+            and build_conversation_memory_payloads().
+        phone_number: The user's phone number (for logging).
+
+    Returns:
+        A list of memory creation results from OpenMemory, in payload order.
+    """
+    if not payloads:
+        logger.info("No memories to store")
         return []
 
     openmemory_url = settings.openmemory_url
@@ -114,59 +223,62 @@ async def create_profile_memories(
     if api_key:
         headers["Authorization"] = f"Bearer {api_key}"
 
-    results = []
+    client = get_openmemory_http_client()
+    url = f"{openmemory_url}/memory/add"
 
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            for key, value in user_info.items():
-                if value is None:
-                    continue
-
-                # Create human-readable content
-                content = _format_profile_content(key, value)
-
-                if not content:
-                    continue
-
-                # Build metadata with conversation context for grouping
-                metadata = {
-                    "field": key,
-                    "value": str(value),
-                }
-                if conversation_context:
-                    metadata["conversation_id"] = conversation_context.get("conversation_id")
-                    metadata["timestamp_utc"] = conversation_context.get("timestamp_utc")
-                    metadata["event_timestamp"] = conversation_context.get("event_timestamp")
-
-                payload = {
-                    "content": content,
-                    "tags": ["profile", key],
-                    "metadata": metadata,
-                    "user_id": phone_number,
-                    "salience": HIGH_SALIENCE,
-                    "decay_lambda": PERMANENT_DECAY
-                }
-
-                response = await client.post(
-                    f"{openmemory_url}/memory/add",
-                    json=payload,
-                    headers=headers
-                )
-
-                if response.status_code == 200:
-                    results.append(response.json())
-                    logger.info(f"Stored profile memory for {phone_number}: {key}={value}")
-                else:
-                    logger.warning(f"Failed to store profile memory: {response.status_code} - {response.text}")
-
-        return results
+    # Bound the fan-out so a long transcript cannot exhaust the shared pool
+    # and have its requests fail with PoolTimeout
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_MEMORY_WRITES)
 
-    except httpx.RequestError as e:
-        logger.error(f"HTTP error storing profile memories: {e}")
-        return results
-    except Exception as e:
-        logger.error(f"Error storing profile memories: {e}")
-        return results
+    async def store_one(payload: dict[str, Any]) -> Optional[dict[str, Any]]:
+        try:
+            async with semaphore:
+                response = await client.post(url, json=payload, headers=headers)
+            if response.status_code != 200:
+                logger.warning(f"Failed to store memory: {response.status_code} - {response.text}")
+                return None
+            result = response.json()
+            logger.debug(f"Stored {payload['tags'][0]} memory for {phone_number}")
+            return result
+        except httpx.RequestError as e:
+            logger.error(f"HTTP error storing memory: {e}")
+        except Exception as e:
+            logger.error(f"Error storing memory: {e}")
+        return None
+
+    stored = await asyncio.gather(*(store_one(payload) for payload in payloads))
+    results = [result for result in stored if result is not None]
+
+    logger.info(f"Stored {len(results)}/{len(payloads)} memories for {phone_number}")
+    return results
+
+
+async def create_profile_memories(
+    user_info: dict[str, Any],
+    phone_number: str,
+    conversation_context: dict[str, Any] | None = None
+) -> list[dict[str, Any]]:
+    """Store profile facts as memories with high salience.
+
+    Creates permanent memories for extracted user profile information.
+    Each piece of information is stored as a separate memory for
+    better retrieval and granularity.
+
+    Args:
+        user_info: Dictionary of user information (e.g., {"first_name": "Stefan"}).
+        phone_number: The user's phone number for userId isolation.
+        conversation_context: Optional dict with conversation_id, timestamp_utc,
+            and event_timestamp for grouping memories together.
+
+    Returns:
+        A list of memory creation results from OpenMemory.
+    """
+    if not user_info:
+        logger.info("No user info to store")
+        return []
+
+    payloads = build_profile_memory_payloads(user_info, phone_number, conversation_context)
+    return await store_memories_bulk(payloads, phone_number)
 
 
 async def store_conversation_memories(
@@ -192,65 +304,8 @@ async def store_conversation_memories(
         logger.info("No messages to store")
         return []
 
-    openmemory_url = settings.openmemory_url
-    api_key = settings.OPENMEMORY_KEY
-
-    headers = {"Content-Type": "application/json"}
-    if api_key:
-        headers["Authorization"] = f"Bearer {api_key}"
-
-    results = []
-
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            for idx, msg_data in enumerate(messages):
-                message = msg_data.get("message", "")
-                time_in_call_secs = msg_data.get("time_in_call_secs")
-
-                if not message or len(message.strip()) < 3:
-                    continue
-
-                # Build metadata with conversation context for grouping
-                metadata = {
-                    "message_index": idx,
-                    "type": "user_utterance",
-                    "time_in_call_secs": time_in_call_secs,
-                }
-                if conversation_context:
-                    metadata["conversation_id"] = conversation_context.get("conversation_id")
-                    metadata["timestamp_utc"] = conversation_context.get("timestamp_utc")
-                    metadata["event_timestamp"] = conversation_context.get("event_timestamp")
-
-                payload = {
-                    "content": message,
-                    "tags": ["conversation", "user_message"],
-                    "metadata": metadata,
-                    "user_id": phone_number,
-                    "salience": MEDIUM_SALIENCE,
-                    "decay_lambda": PERMANENT_DECAY
-                }
-
-                response = await client.post(
-                    f"{openmemory_url}/memory/add",
-                    json=payload,
-                    headers=headers
-                )
-
-                if response.status_code == 200:
-                    results.append(response.json())
-                    logger.debug(f"Stored conversation memory {idx} for {phone_number}")
-                else:
-                    logger.warning(f"Failed to store conversation memory: {response.status_code}")
-
-        logger.info(f"Stored {len(results)} conversation memories for {phone_number}")
-        return results
-
-    except httpx.RequestError as e:
-        logger.error(f"HTTP error storing conversation memories: {e}")
-        return results
-    except Exception as e:
-        logger.error(f"Error storing conversation memories: {e}")
-        return results
+    payloads = build_conversation_memory_payloads(messages, phone_number, conversation_context)
+    return await store_memories_bulk(payloads, phone_number)
 
 
 async def search_memories(
@@ -280,24 +335,24 @@ async def search_memories(
         headers["Authorization"] = f"Bearer {api_key}"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            payload = {
-                "query": query,
-                "k": limit,
-                "filters": {"user_id": phone_number}
-            }
+        client = get_openmemory_http_client()
+        payload = {
+            "query": query,
+            "k": limit,
+            "filters": {"user_id": phone_number}
+        }
 
-            response = await client.post(
-                f"{openmemory_url}/memory/query",
-                json=payload,
-                headers=headers
-            )
+        response = await client.post(
+            f"{openmemory_url}/memory/query",
+            json=payload,
+            headers=headers
+        )
 
-            if response.status_code != 200:
-                logger.warning(f"OpenMemory query failed: {response.status_code}")
-                return {"profile": None, "memories": []}
+        if response.status_code != 200:
+            logger.warning(f"OpenMemory query failed: {response.status_code}")
+            return {"profile": None, "memories": []}
 
-            results = response.json()
+        results = response.json()
 
         # Parse results into structured format
         memories = []
@@ -0,0 +1,68 @@
+"""Shared HTTP client for OpenMemory REST calls.
+
+This module provides:
+- get_openmemory_http_client(): The process-wide pooled httpx.AsyncClient
+- warm_up_openmemory_http_client(): Open a connection before the first request
+- close_openmemory_http_client(): Close the client on application shutdown
+
+Reusing one client keeps keep-alive connections to OpenMemory open across
+webhooks instead of paying a new TCP/TLS handshake per memory call.
+"""
+
+import logging
+from typing import Optional
+
+import httpx
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Created lazily, closed on shutdown
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_openmemory_http_client() -> httpx.AsyncClient:
+    """Get the shared OpenMemory HTTP client, creating it on first use.
+
+    Returns:
+        The module-level httpx.AsyncClient.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        # The transport retries failed connection attempts itself
+        _client = httpx.AsyncClient(
+            timeout=10.0,
+            transport=httpx.AsyncHTTPTransport(
+                retries=2,
+                limits=httpx.Limits(
+                    max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0
+                ),
+            ),
+        )
+    return _client
+
+
+async def warm_up_openmemory_http_client() -> None:
+    """Open a keep-alive connection to OpenMemory ahead of the first request.
+
+    Failures are logged and ignored; the first real call just pays the
+    handshake.
+    """
+    try:
+        await get_openmemory_http_client().get(
+            f"{settings.openmemory_url}/health", timeout=5.0
+        )
+    except httpx.HTTPError as e:
+        logger.debug("OpenMemory connection warm-up failed: %s", e)
+    except Exception as e:
+        # e.g. httpx.InvalidURL from a misconfigured endpoint
+        logger.warning("OpenMemory connection warm-up failed: %s", e)
+
+
+async def close_openmemory_http_client() -> None:
+    """Close the shared OpenMemory HTTP client on application shutdown."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
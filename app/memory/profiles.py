@@ -15,14 +15,21 @@ Storage Keys:
 All operations use the phone number as the userId for multi-tenant isolation.
 """
 
+import functools
 import logging
 import re
+from collections.abc import Iterable
+from dataclasses import dataclass
 from datetime import datetime
+from types import MappingProxyType
 from typing import Any, Optional
+from urllib.parse import quote
 
 import httpx
+import orjson
 
 from app.config import settings
+from app.memory.http_client import get_openmemory_http_client
 from app.models.responses import (
     DynamicVariables,
     ConversationConfigOverride,
@@ -36,13 +43,34 @@ logger = logging.getLogger(__name__)
 PERMANENT_DECAY = 0  # decayLambda=0 for permanent retention
 HIGH_SALIENCE = 0.9  # High importance for profile facts and greetings
 
+# OpenMemory endpoint and auth headers are fixed for the process lifetime,
+# so resolve them once at import instead of on every request.
+_OPENMEMORY_URL = settings.openmemory_url
+_OPENMEMORY_HEADERS = MappingProxyType({
+    "Content-Type": "application/json",
+    **({"Authorization": f"Bearer {settings.OPENMEMORY_KEY}"} if settings.OPENMEMORY_KEY else {}),
+})
+
+# Shared activity-level strings so parsed summaries reuse one object per level
+# instead of holding freshly captured regex groups
+_ACTIVITY_LEVELS = {"low": "low", "medium": "medium", "high": "high"}
+
+
+class OpenMemoryLookupError(Exception):
+    """Raised by a profile lookup that failed, as opposed to finding nothing."""
+    pass
+
 
 # =============================================================================
 # TIER 1: Universal User Profile Functions (Cross-Agent)
 # =============================================================================
 
 
-async def get_universal_user_profile(phone_number: str) -> Optional[dict[str, Any]]:
+async def get_universal_user_profile(
+    phone_number: str,
+    *,
+    raise_errors: bool = False
+) -> Optional[dict[str, Any]]:
     """Query Tier 1: Universal user profile shared across all agents.
 
     Retrieves the universal profile that is shared across all agents,
@@ -52,6 +80,9 @@ async def get_universal_user_profile(phone_number: str) -> Optional[dict[str, An
 
     Args:
         phone_number: The user's phone number in E.164 format.
+        raise_errors: If True, raise OpenMemoryLookupError when the query
+            fails instead of returning None, so callers can tell a failed
+            lookup from a user with no profile.
 
     Returns:
         Dictionary containing:
@@ -60,74 +91,79 @@ async def get_universal_user_profile(phone_number: str) -> Optional[dict[str, An
             - first_seen: str (ISO timestamp)
             - total_interactions: int
         Returns None if user has never called any agent.
-    """
-    from urllib.parse import quote
 
+    Raises:
+        OpenMemoryLookupError: If raise_errors is True and the query fails.
+    """
     try:
-        openmemory_url = settings.openmemory_url
-        api_key = settings.OPENMEMORY_KEY
-
-        headers = {"Content-Type": "application/json"}
-        if api_key:
-            headers["Authorization"] = f"Bearer {api_key}"
+        openmemory_url = _OPENMEMORY_URL
+        headers = _OPENMEMORY_HEADERS
 
         # Query for universal profile memories
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            query_payload = {
-                "query": "universal profile user name",
-                "k": 5,
-                "filters": {
-                    "user_id": phone_number,
-                    "tags": ["universal_profile"]
-                }
+        client = get_openmemory_http_client()
+        query_payload = {
+            "query": "universal profile user name",
+            "k": 5,
+            "filters": {
+                "user_id": phone_number,
+                "tags": ["universal_profile"]
             }
-            response = await client.post(
-                f"{openmemory_url}/memory/query",
-                json=query_payload,
-                headers=headers
-            )
+        }
+        response = await client.post(
+            f"{openmemory_url}/memory/query",
+            json=query_payload,
+            headers=headers
+        )
 
-            if response.status_code != 200:
-                logger.warning(f"OpenMemory query failed: {response.status_code}")
-                return None
+        if response.status_code != 200:
+            logger.warning(f"OpenMemory query failed: {response.status_code}")
+            if raise_errors:
+                raise OpenMemoryLookupError(f"OpenMemory query failed: {response.status_code}")
+            return None
 
-            results = response.json()
-            memories = results.get("matches", [])
+        results = response.json()
+        memories = results.get("matches", [])
 
-            if not memories:
-                logger.info(f"No universal profile found for {phone_number}")
-                return None
-
-            # Parse universal profile from memories
-            name = None
-            first_seen = None
-            total_interactions = 0
-
-            for memory in memories:
-                metadata = memory.get("metadata", {})
-                if isinstance(metadata, dict):
-                    if metadata.get("field") == "name" and metadata.get("value"):
-                        name = metadata.get("value")
-                    if metadata.get("field") == "first_seen":
-                        first_seen = metadata.get("value")
-                    if metadata.get("field") == "total_interactions":
-                        try:
-                            total_interactions = int(metadata.get("value", 0))
-                        except (ValueError, TypeError):
-                            total_interactions = 0
-
-            return {
-                "name": name,
-                "phone_number": phone_number,
-                "first_seen": first_seen or datetime.utcnow().isoformat(),
-                "total_interactions": total_interactions
-            }
+        if not memories:
+            logger.info(f"No universal profile found for {phone_number}")
+            return None
 
+        # Parse universal profile from memories
+        name = None
+        first_seen = None
+        total_interactions = 0
+
+        for memory in memories:
+            metadata = memory.get("metadata", {})
+            if isinstance(metadata, dict):
+                if metadata.get("field") == "name" and metadata.get("value"):
+                    name = metadata.get("value")
+                if metadata.get("field") == "first_seen":
+                    first_seen = metadata.get("value")
+                if metadata.get("field") == "total_interactions":
+                    try:
+                        total_interactions = int(metadata.get("value", 0))
+                    except (ValueError, TypeError):
+                        total_interactions = 0
+
+        return {
+            "name": name,
+            "phone_number": phone_number,
+            "first_seen": first_seen or datetime.utcnow().isoformat(),
+            "total_interactions": total_interactions
+        }
+
+    except OpenMemoryLookupError:
+        raise
     except httpx.RequestError as e:
         logger.error(f"HTTP error querying universal profile for {phone_number}: {e}")
+        if raise_errors:
+            raise OpenMemoryLookupError(str(e)) from e
         return None
     except Exception as e:
         logger.error(f"Error retrieving universal profile for {phone_number}: {e}")
+        if raise_errors:
+            raise OpenMemoryLookupError(str(e)) from e
         return None
 
 
@@ -150,64 +186,60 @@ async def store_universal_user_profile(
         True if successful, False otherwise.
     """
     try:
-        openmemory_url = settings.openmemory_url
-        api_key = settings.OPENMEMORY_KEY
-
-        headers = {"Content-Type": "application/json"}
-        if api_key:
-            headers["Authorization"] = f"Bearer {api_key}"
+        openmemory_url = _OPENMEMORY_URL
+        headers = _OPENMEMORY_HEADERS
 
         # Get existing profile
         existing = await get_universal_user_profile(phone_number)
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            # Determine values to store
-            current_name = existing.get("name") if existing else None
-            current_interactions = existing.get("total_interactions", 0) if existing else 0
-            first_seen = existing.get("first_seen") if existing else datetime.utcnow().isoformat()
-
-            # Update name only if not already set
-            new_name = name if (name and not current_name) else current_name
-            new_interactions = current_interactions + 1 if increment_interactions else current_interactions
-
-            # Store profile fields as individual memories
-            fields = [
-                ("name", new_name),
-                ("first_seen", first_seen),
-                ("total_interactions", str(new_interactions)),
-            ]
-
-            for field_name, field_value in fields:
-                if field_value is None:
-                    continue
-
-                payload = {
-                    "content": f"Universal profile: {field_name} = {field_value}",
-                    "tags": ["universal_profile", field_name],
-                    "metadata": {
-                        "field": field_name,
-                        "value": str(field_value),
-                        "profile_type": "universal"
-                    },
-                    "user_id": phone_number,
-                    "salience": HIGH_SALIENCE,
-                    "decay_lambda": PERMANENT_DECAY
-                }
-
-                response = await client.post(
-                    f"{openmemory_url}/memory/add",
-                    json=payload,
-                    headers=headers
-                )
+        client = get_openmemory_http_client()
+        # Determine values to store
+        current_name = existing.get("name") if existing else None
+        current_interactions = existing.get("total_interactions", 0) if existing else 0
+        first_seen = existing.get("first_seen") if existing else datetime.utcnow().isoformat()
+
+        # Update name only if not already set
+        new_name = name if (name and not current_name) else current_name
+        new_interactions = current_interactions + 1 if increment_interactions else current_interactions
+
+        # Store profile fields as individual memories
+        fields = [
+            ("name", new_name),
+            ("first_seen", first_seen),
+            ("total_interactions", str(new_interactions)),
+        ]
 
-                if response.status_code != 200:
-                    logger.warning(
-                        f"Failed to store universal profile field {field_name}: "
-                        f"{response.status_code}"
-                    )
+        for field_name, field_value in fields:
+            if field_value is None:
+                continue
 
-            logger.info(f"Stored universal profile for {phone_number}")
-            return True
+            payload = {
+                "content": f"Universal profile: {field_name} = {field_value}",
+                "tags": ["universal_profile", field_name],
+                "metadata": {
+                    "field": field_name,
+                    "value": str(field_value),
+                    "profile_type": "universal"
+                },
+                "user_id": phone_number,
+                "salience": HIGH_SALIENCE,
+                "decay_lambda": PERMANENT_DECAY
+            }
+
+            response = await client.post(
+                f"{openmemory_url}/memory/add",
+                json=payload,
+                headers=headers
+            )
+
+            if response.status_code != 200:
+                logger.warning(
+                    f"Failed to store universal profile field {field_name}: "
+                    f"{response.status_code}"
+                )
+
+        logger.info(f"Stored universal profile for {phone_number}")
+        return True
 
     except httpx.RequestError as e:
         logger.error(f"HTTP error storing universal profile: {e}")
@@ -224,7 +256,9 @@ async def store_universal_user_profile(
 
 async def get_agent_conversation_state(
     phone_number: str,
-    agent_id: str
+    agent_id: str,
+    *,
+    raise_errors: bool = False
 ) -> Optional[dict[str, Any]]:
     """Query Tier 2: Agent-specific conversation state.
 
@@ -236,6 +270,8 @@ async def get_agent_conversation_state(
     Args:
         phone_number: The user's phone number in E.164 format.
         agent_id: The unique identifier of the ElevenLabs agent.
+        raise_errors: If True, raise OpenMemoryLookupError when the query
+            fails instead of returning None.
 
     Returns:
         Dictionary containing:
@@ -246,82 +282,89 @@ async def get_agent_conversation_state(
             - last_call_date: str (ISO timestamp)
             - conversation_count: int
         Returns None if user has never called this specific agent.
+
+    Raises:
+        OpenMemoryLookupError: If raise_errors is True and the query fails.
     """
     try:
-        openmemory_url = settings.openmemory_url
-        api_key = settings.OPENMEMORY_KEY
-
-        headers = {"Content-Type": "application/json"}
-        if api_key:
-            headers["Authorization"] = f"Bearer {api_key}"
+        openmemory_url = _OPENMEMORY_URL
+        headers = _OPENMEMORY_HEADERS
 
         # Query for agent-specific state
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            query_payload = {
-                "query": f"agent greeting {agent_id}",
-                "k": 3,
-                "filters": {
-                    "user_id": phone_number,
-                    "tags": ["agent_state", agent_id]
-                }
+        client = get_openmemory_http_client()
+        query_payload = {
+            "query": f"agent greeting {agent_id}",
+            "k": 3,
+            "filters": {
+                "user_id": phone_number,
+                "tags": ["agent_state", agent_id]
             }
-            response = await client.post(
-                f"{openmemory_url}/memory/query",
-                json=query_payload,
-                headers=headers
-            )
+        }
+        response = await client.post(
+            f"{openmemory_url}/memory/query",
+            json=query_payload,
+            headers=headers
+        )
 
-            if response.status_code != 200:
-                logger.warning(f"OpenMemory query failed: {response.status_code}")
-                return None
+        if response.status_code != 200:
+            logger.warning(f"OpenMemory query failed: {response.status_code}")
+            if raise_errors:
+                raise OpenMemoryLookupError(f"OpenMemory query failed: {response.status_code}")
+            return None
 
-            results = response.json()
-            memories = results.get("matches", [])
+        results = response.json()
+        memories = results.get("matches", [])
 
-            if not memories:
-                logger.info(f"No agent state found for {phone_number} with agent {agent_id}")
-                return None
-
-            # Parse agent-specific state from memories
-            state = {
-                "next_greeting": None,
-                "key_topics": [],
-                "sentiment": "neutral",
-                "conversation_summary": "",
-                "last_call_date": None,
-                "conversation_count": 0
-            }
+        if not memories:
+            logger.info(f"No agent state found for {phone_number} with agent {agent_id}")
+            return None
 
-            for memory in memories:
-                metadata = memory.get("metadata", {})
-                if isinstance(metadata, dict):
-                    if metadata.get("next_greeting"):
-                        state["next_greeting"] = metadata.get("next_greeting")
-                    if metadata.get("key_topics"):
-                        topics = metadata.get("key_topics")
-                        if isinstance(topics, list):
-                            state["key_topics"] = topics
-                        elif isinstance(topics, str):
-                            state["key_topics"] = [t.strip() for t in topics.split(",")]
-                    if metadata.get("sentiment"):
-                        state["sentiment"] = metadata.get("sentiment")
-                    if metadata.get("conversation_summary"):
-                        state["conversation_summary"] = metadata.get("conversation_summary")
-                    if metadata.get("last_call_date"):
-                        state["last_call_date"] = metadata.get("last_call_date")
-                    if metadata.get("conversation_count"):
-                        try:
-                            state["conversation_count"] = int(metadata.get("conversation_count", 0))
-                        except (ValueError, TypeError):
-                            pass
-
-            return state
+        # Parse agent-specific state from memories
+        state = {
+            "next_greeting": None,
+            "key_topics": [],
+            "sentiment": "neutral",
+            "conversation_summary": "",
+            "last_call_date": None,
+            "conversation_count": 0
+        }
 
+        for memory in memories:
+            metadata = memory.get("metadata", {})
+            if isinstance(metadata, dict):
+                if metadata.get("next_greeting"):
+                    state["next_greeting"] = metadata.get("next_greeting")
+                if metadata.get("key_topics"):
+                    topics = metadata.get("key_topics")
+                    if isinstance(topics, list):
+                        state["key_topics"] = topics
+                    elif isinstance(topics, str):
+                        state["key_topics"] = [t.strip() for t in topics.split(",")]
+                if metadata.get("sentiment"):
+                    state["sentiment"] = metadata.get("sentiment")
+                if metadata.get("conversation_summary"):
+                    state["conversation_summary"] = metadata.get("conversation_summary")
+                if metadata.get("last_call_date"):
+                    state["last_call_date"] = metadata.get("last_call_date")
+                if metadata.get("conversation_count"):
+                    try:
+                        state["conversation_count"] = int(metadata.get("conversation_count", 0))
+                    except (ValueError, TypeError):
+                        pass
+
+        return state
+
+    except OpenMemoryLookupError:
+        raise
     except httpx.RequestError as e:
         logger.error(f"HTTP error querying agent state for {phone_number}/{agent_id}: {e}")
+        if raise_errors:
+            raise OpenMemoryLookupError(str(e)) from e
         return None
     except Exception as e:
         logger.error(f"Error retrieving agent state for {phone_number}/{agent_id}: {e}")
+        if raise_errors:
+            raise OpenMemoryLookupError(str(e)) from e
         return None
 
 
@@ -348,62 +391,58 @@ async def store_agent_conversation_state(
         True if successful, False otherwise.
     """
     try:
-        openmemory_url = settings.openmemory_url
-        api_key = settings.OPENMEMORY_KEY
-
-        headers = {"Content-Type": "application/json"}
-        if api_key:
-            headers["Authorization"] = f"Bearer {api_key}"
+        openmemory_url = _OPENMEMORY_URL
+        headers = _OPENMEMORY_HEADERS
 
         # Get existing state to increment conversation count
         existing = await get_agent_conversation_state(phone_number, agent_id)
         conversation_count = (existing.get("conversation_count", 0) if existing else 0) + 1
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            # Build metadata
-            metadata = {
-                "agent_id": agent_id,
-                "next_greeting": greeting_data.get("next_greeting"),
-                "key_topics": greeting_data.get("key_topics", []),
-                "sentiment": greeting_data.get("sentiment", "neutral"),
-                "conversation_summary": greeting_data.get("conversation_summary", ""),
-                "last_call_date": datetime.utcnow().isoformat(),
-                "conversation_count": conversation_count,
-                "profile_type": "agent_specific"
-            }
+        client = get_openmemory_http_client()
+        # Build metadata
+        metadata = {
+            "agent_id": agent_id,
+            "next_greeting": greeting_data.get("next_greeting"),
+            "key_topics": greeting_data.get("key_topics", []),
+            "sentiment": greeting_data.get("sentiment", "neutral"),
+            "conversation_summary": greeting_data.get("conversation_summary", ""),
+            "last_call_date": datetime.utcnow().isoformat(),
+            "conversation_count": conversation_count,
+            "profile_type": "agent_specific"
+        }
 
-            # Build content for embedding
-            topics_str = ", ".join(greeting_data.get("key_topics", []))
-            content = (
-                f"Agent {agent_id} conversation state: "
-                f"Next greeting prepared. Topics: {topics_str}. "
-                f"Sentiment: {greeting_data.get('sentiment', 'neutral')}. "
-                f"Summary: {greeting_data.get('conversation_summary', '')}"
-            )
+        # Build content for embedding
+        topics_str = ", ".join(greeting_data.get("key_topics", []))
+        content = (
+            f"Agent {agent_id} conversation state: "
+            f"Next greeting prepared. Topics: {topics_str}. "
+            f"Sentiment: {greeting_data.get('sentiment', 'neutral')}. "
+            f"Summary: {greeting_data.get('conversation_summary', '')}"
+        )
 
-            payload = {
-                "content": content,
-                "tags": ["agent_state", agent_id, "next_greeting"],
-                "metadata": metadata,
-                "user_id": phone_number,
-                "salience": HIGH_SALIENCE,
-                "decay_lambda": PERMANENT_DECAY
-            }
+        payload = {
+            "content": content,
+            "tags": ["agent_state", agent_id, "next_greeting"],
+            "metadata": metadata,
+            "user_id": phone_number,
+            "salience": HIGH_SALIENCE,
+            "decay_lambda": PERMANENT_DECAY
+        }
 
-            response = await client.post(
-                f"{openmemory_url}/memory/add",
-                json=payload,
-                headers=headers
-            )
+        response = await client.post(
+            f"{openmemory_url}/memory/add",
+            json=payload,
+            headers=headers
+        )
 
-            if response.status_code != 200:
-                logger.warning(
-                    f"Failed to store agent state: {response.status_code} - {response.text}"
-                )
-                return False
+        if response.status_code != 200:
+            logger.warning(
+                f"Failed to store agent state: {response.status_code} - {response.text}"
+            )
+            return False
 
-            logger.info(f"Stored agent state for {phone_number} with agent {agent_id}")
-            return True
+        logger.info(f"Stored agent state for {phone_number} with agent {agent_id}")
+        return True
 
     except httpx.RequestError as e:
         logger.error(f"HTTP error storing agent state: {e}")
@@ -507,8 +546,6 @@ def _parse_user_summary(summary_response: dict[str, Any]) -> dict[str, Any]:
     Returns:
         Parsed summary data with memory_count, activity_level, top_content, has_memories.
     """
-    import re
-
     result = {
         "memory_count": 0,
         "activity_level": "none",
@@ -529,7 +566,7 @@ def _parse_user_summary(summary_response: dict[str, Any]) -> dict[str, Any]:
     # Parse activity level: "| low |" or "| medium |" or "| high |"
     activity_match = re.search(r"\|\s*(low|medium|high)\s*\|", summary_str)
     if activity_match:
-        result["activity_level"] = activity_match.group(1)
+        result["activity_level"] = _ACTIVITY_LEVELS[activity_match.group(1)]
 
     # Parse top content: everything after the colon in quotes
     # Format: top: semantic(1, sal=0.36): "Participant Details: founder of Arbez..."
@@ -566,32 +603,26 @@ async def get_user_profile(phone_number: str) -> Optional[dict[str, Any]]:
             "has_memories": bool
         }
     """
-    from urllib.parse import quote
-
     try:
-        openmemory_url = settings.openmemory_url
-        api_key = settings.OPENMEMORY_KEY
-
-        headers = {"Content-Type": "application/json"}
-        if api_key:
-            headers["Authorization"] = f"Bearer {api_key}"
+        openmemory_url = _OPENMEMORY_URL
+        headers = _OPENMEMORY_HEADERS
 
         # First, get user summary via /users/:id/summary endpoint
         encoded_user_id = quote(phone_number, safe="")
         summary_url = f"{openmemory_url}/users/{encoded_user_id}/summary"
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            summary_response = await client.get(summary_url, headers=headers)
+        client = get_openmemory_http_client()
+        summary_response = await client.get(summary_url, headers=headers)
 
-            if summary_response.status_code == 404:
-                logger.info(f"No profile found for user {phone_number}")
-                return None
+        if summary_response.status_code == 404:
+            logger.info(f"No profile found for user {phone_number}")
+            return None
 
-            if summary_response.status_code != 200:
-                logger.warning(f"OpenMemory summary returned status {summary_response.status_code}: {summary_response.text}")
-                return None
+        if summary_response.status_code != 200:
+            logger.warning(f"OpenMemory summary returned status {summary_response.status_code}: {summary_response.text}")
+            return None
 
-            summary_data = summary_response.json()
+        summary_data = orjson.loads(summary_response.content)
 
         # Parse the summary response
         parsed = _parse_user_summary(summary_data)
@@ -606,24 +637,26 @@ async def get_user_profile(phone_number: str) -> Optional[dict[str, Any]]:
 
         # Query memories to extract name (need actual memory content for name extraction)
         memories = []
+        cleaned: list[_CleanedMemory] = []
         name = None
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            query_payload = {
-                "query": "user name first_name",
-                "k": 10,
-                "filters": {"user_id": phone_number}
-            }
-            mem_response = await client.post(
-                f"{openmemory_url}/memory/query",
-                json=query_payload,
-                headers=headers
-            )
+        client = get_openmemory_http_client()
+        query_payload = {
+            "query": "user name first_name",
+            "k": 10,
+            "filters": {"user_id": phone_number}
+        }
+        mem_response = await client.post(
+            f"{openmemory_url}/memory/query",
+            json=query_payload,
+            headers=headers
+        )
 
-            if mem_response.status_code == 200:
-                results = mem_response.json()
-                memories = results.get("matches", [])
-                name = _extract_name_from_memories(memories)
+        if mem_response.status_code == 200:
+            results = orjson.loads(mem_response.content)
+            memories = results.get("matches", [])
+            cleaned = [_prepare_memory(m) for m in memories]
+            name = _extract_name_from_memories(cleaned)
 
         # If summary was initializing but we found memories, update the flags
         actual_has_memories = len(memories) > 0
@@ -638,7 +671,7 @@ async def get_user_profile(phone_number: str) -> Optional[dict[str, Any]]:
         # Build summary from memories if top_content not available
         top_content = parsed.get("top_content")
         if not top_content and memories:
-            top_content = _build_summary_from_memories(memories)
+            top_content = _build_summary_from_memories(cleaned)
 
         return {
             "name": name,
@@ -679,27 +712,22 @@ async def get_user_summary(phone_number: str) -> Optional[dict[str, Any]]:
         }
     """
     try:
-        openmemory_url = settings.openmemory_url
-        api_key = settings.OPENMEMORY_KEY
-
-        headers = {"Content-Type": "application/json"}
-        if api_key:
-            headers["Authorization"] = f"Bearer {api_key}"
+        openmemory_url = _OPENMEMORY_URL
+        headers = _OPENMEMORY_HEADERS
 
         # URL encode the phone number for the path
-        from urllib.parse import quote
         encoded_user_id = quote(phone_number, safe="")
         url = f"{openmemory_url}/users/{encoded_user_id}/summary"
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(url, headers=headers)
+        client = get_openmemory_http_client()
+        response = await client.get(url, headers=headers)
 
-            if response.status_code == 404:
-                logger.info(f"No summary found for user {phone_number}")
-                return None
+        if response.status_code == 404:
+            logger.info(f"No summary found for user {phone_number}")
+            return None
 
-            response.raise_for_status()
-            return response.json()
+        response.raise_for_status()
+        return orjson.loads(response.content)
 
     except httpx.RequestError as e:
         logger.error(f"Error fetching user summary for {phone_number}: {e}")
@@ -719,7 +747,7 @@ def build_dynamic_variables(profile: Optional[dict[str, Any]]) -> DynamicVariabl
         profile: User profile data from get_user_profile() or None for new callers.
 
     Returns:
-        DynamicVariables object with user_name, user_profile_summary, last_call_summary.
+        DynamicVariables dict with user_name, user_profile_summary, last_call_summary.
         Returns empty/None values for new callers.
     """
     if profile is None:
@@ -729,10 +757,13 @@ def build_dynamic_variables(profile: Optional[dict[str, Any]]) -> DynamicVariabl
             last_call_summary=None
         )
 
+    # Normalize lazily: the last-call summary stops at the first usable memory
+    cleaned = (_prepare_memory(m) for m in profile.get("memories", []))
+
     return DynamicVariables(
         user_name=profile.get("name"),
         user_profile_summary=profile.get("summary"),
-        last_call_summary=_get_last_call_summary(profile.get("memories", []))
+        last_call_summary=_get_last_call_summary(cleaned)
     )
 
 
@@ -831,6 +862,42 @@ def build_profile_data(profile: Optional[dict[str, Any]]) -> Optional[ProfileDat
     )
 
 
+@dataclass(slots=True)
+class _CleanedMemory:
+    """Canonical view of an OpenMemory match, normalized once per request.
+
+    Shared by the name, summary, and last-call helpers so each memory is
+    stripped, lowercased, and filler-checked a single time.
+    """
+
+    content: str
+    content_lower: str
+    is_filler: bool
+    salience: float
+    sector: Optional[str]
+    metadata: Any
+
+
+def _prepare_memory(memory: dict[str, Any]) -> _CleanedMemory:
+    """Normalize a raw OpenMemory match into a _CleanedMemory.
+
+    Args:
+        memory: Memory object from OpenMemory.
+
+    Returns:
+        The cleaned memory.
+    """
+    content = memory.get("content", "").strip()
+    return _CleanedMemory(
+        content=content,
+        content_lower=content.lower(),
+        is_filler=_is_conversational_filler(content),
+        salience=memory.get("salience", 0),
+        sector=memory.get("primary_sector"),
+        metadata=memory.get("metadata", {}),
+    )
+
+
 def _is_conversational_filler(content: str) -> bool:
     """Check if content is conversational filler that shouldn't be in summaries.
 
@@ -843,10 +910,18 @@ def _is_conversational_filler(content: str) -> bool:
     Returns:
         True if the content is conversational filler, False if it's meaningful.
     """
-    if not content or len(content.strip()) < 10:
+    if not content or len(content) < 10:
         return True
 
-    content_lower = content.lower().strip()
+    # Most callers pass already-trimmed content; only strip (and allocate)
+    # when there is actually whitespace at either edge
+    stripped = content
+    if content[0].isspace() or content[-1].isspace():
+        stripped = content.strip()
+        if len(stripped) < 10:
+            return True
+
+    content_lower = stripped.lower()
 
     # Filler patterns that indicate raw transcript content
     filler_patterns = [
@@ -884,18 +959,47 @@ def _is_conversational_filler(content: str) -> bool:
     return False
 
 
-def _extract_name_from_memories(memories: list[dict[str, Any]]) -> Optional[str]:
+def _extract_name_from_memories(memories: list[_CleanedMemory]) -> Optional[str]:
     """Extract user name from memories.
 
     Searches through memories for content that indicates the user's name.
     Uses strict patterns to avoid false positives from common phrases.
 
     Args:
-        memories: List of memory objects from OpenMemory.
+        memories: Cleaned memories from _prepare_memory().
 
     Returns:
         The user's name if found, or None.
     """
+    name = _extract_name_from_contents(tuple(m.content_lower for m in memories))
+    if name:
+        return name
+
+    # Check for explicit name in metadata
+    for memory in memories:
+        metadata = memory.metadata
+        if isinstance(metadata, dict):
+            if "name" in metadata:
+                return metadata["name"]
+            if "first_name" in metadata:
+                return metadata["first_name"]
+
+    return None
+
+
+@functools.lru_cache(maxsize=2048)
+def _extract_name_from_contents(contents: tuple[str, ...]) -> Optional[str]:
+    """Scan lowercased memory contents for a name introduction.
+
+    Memoized on the contents tuple, so repeat lookups for the same caller
+    (retries, back-to-back webhooks) skip the regex work entirely.
+
+    Args:
+        contents: Lowercased memory contents, in query order.
+
+    Returns:
+        The capitalized name if found, or None.
+    """
     # Common words that are NOT names - filter these out
     not_names = {
         # Common verbs/adjectives after "I'm" / "I am"
@@ -913,12 +1017,7 @@ def _extract_name_from_memories(memories: list[dict[str, Any]]) -> Optional[str]
 
     # More specific patterns that actually indicate a name introduction
     # Only match phrases that are explicitly introducing a name
-    import re
-
-    for memory in memories:
-        content = memory.get("content", "")
-        content_lower = content.lower()
-
+    for content_lower in contents:
         # Pattern 1: "my name is [Name]" - most reliable
         match = re.search(r"my name is\s+([a-z]+)", content_lower)
         if match:
@@ -948,19 +1047,10 @@ def _extract_name_from_memories(memories: list[dict[str, Any]]) -> Optional[str]
             if name.lower() not in not_names and len(name) > 1:
                 return name
 
-    # Check for explicit name in metadata
-    for memory in memories:
-        metadata = memory.get("metadata", {})
-        if isinstance(metadata, dict):
-            if "name" in metadata:
-                return metadata["name"]
-            if "first_name" in metadata:
-                return metadata["first_name"]
-
     return None
 
 
-def _build_summary_from_memories(memories: list[dict[str, Any]]) -> Optional[str]:
+def _build_summary_from_memories(memories: list[_CleanedMemory]) -> Optional[str]:
     """Build a summary from user memories.
 
     Creates a concise summary based on stored memories, filtering for
@@ -968,7 +1058,7 @@ def _build_summary_from_memories(memories: list[dict[str, Any]]) -> Optional[str
     raw conversational content that would sound awkward in greetings.
 
     Args:
-        memories: List of memory objects from OpenMemory.
+        memories: Cleaned memories from _prepare_memory().
 
     Returns:
         A summary string or None if no meaningful summary can be built.
@@ -980,16 +1070,12 @@ def _build_summary_from_memories(memories: list[dict[str, Any]]) -> Optional[str
     # Also filter for high-salience memories (>= 0.8)
     profile_memories = [
         m for m in memories
-        if m.get("primary_sector") == "semantic"
-        and m.get("salience", 0) >= 0.8
+        if m.sector == "semantic" and m.salience >= 0.8
     ]
 
     # If no semantic memories, try high-salience memories of any type
     if not profile_memories:
-        profile_memories = [
-            m for m in memories
-            if m.get("salience", 0) >= 0.85
-        ]
+        profile_memories = [m for m in memories if m.salience >= 0.85]
 
     if not profile_memories:
         return None
@@ -997,16 +1083,16 @@ def _build_summary_from_memories(memories: list[dict[str, Any]]) -> Optional[str
     # Sort by salience and take top 3
     sorted_memories = sorted(
         profile_memories,
-        key=lambda m: m.get("salience", 0.5),
+        key=lambda m: m.salience,
         reverse=True
     )[:3]
 
     # Build summary from clean memories only
     summary_parts = []
     for memory in sorted_memories:
-        content = memory.get("content", "").strip()
+        content = memory.content
         # Filter out conversational filler and keep reasonable length
-        if content and len(content) < 200 and not _is_conversational_filler(content):
+        if content and len(content) < 200 and not memory.is_filler:
             summary_parts.append(content)
 
     if summary_parts:
@@ -1015,43 +1101,32 @@ def _build_summary_from_memories(memories: list[dict[str, Any]]) -> Optional[str
     return None
 
 
-def _get_last_call_summary(memories: list[dict[str, Any]]) -> Optional[str]:
+def _get_last_call_summary(memories: Iterable[_CleanedMemory]) -> Optional[str]:
     """Get summary of the last call from memories.
 
     Extracts meaningful content from episodic memories, filtering out
     raw conversational filler and truncating at sentence boundaries.
 
     Args:
-        memories: List of memory objects from OpenMemory.
+        memories: Cleaned memories from _prepare_memory(); may be a lazy
+            iterable, which is consumed only up to the first match.
 
     Returns:
         A summary of the last call or None if no meaningful content found.
     """
-    if not memories:
-        return None
-
-    # Get episodic memories (conversation records)
-    episodic_memories = [
-        m for m in memories
-        if m.get("primary_sector") == "episodic"
-    ]
-
-    if not episodic_memories:
-        return None
-
-    # Try to find a meaningful episodic memory (not just filler)
-    for memory in episodic_memories:
-        content = memory.get("content", "").strip()
-
-        # Skip conversational filler
-        if _is_conversational_filler(content):
-            continue
+    # Lazily walk episodic memories (conversation records), skipping filler,
+    # so we stop at the first meaningful one without building a list
+    candidates = (
+        m.content
+        for m in memories
+        if m.sector == "episodic" and m.content and not m.is_filler
+    )
 
-        if content:
-            # Truncate at sentence boundary instead of character count
-            truncated = _truncate_at_sentence(content, max_length=150)
-            if truncated and not _is_conversational_filler(truncated):
-                return f"Last time we talked about: {truncated}"
+    for content in candidates:
+        # Truncate at sentence boundary instead of character count
+        truncated = _truncate_at_sentence(content, max_length=150)
+        if truncated and not _is_conversational_filler(truncated):
+            return f"Last time we talked about: {truncated}"
 
     return None
 
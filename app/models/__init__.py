@@ -5,7 +5,10 @@ This module exports all request and response models for ElevenLabs webhooks:
 Request Models:
 - ClientDataRequest: Conversation initiation client data request
 - SearchDataRequest: Server tool search data request
-- PostCallWebhookRequest: Post-call webhook request
+- PostCallWebhookRequest: Post-call transcription webhook request
+- PostCallAudioRequest: Post-call audio webhook request
+- PostCallFailureRequest: Call initiation failure webhook request
+- PostCallWebhook: Discriminated union of the post-call requests
 - TranscriptEntry: Individual transcript entry
 - PostCallData: Post-call data payload
 - DataCollectionResult: Collected data from conversation analysis
@@ -24,6 +27,9 @@ from app.models.requests import (
     ClientDataRequest,
     SearchDataRequest,
     PostCallWebhookRequest,
+    PostCallAudioRequest,
+    PostCallFailureRequest,
+    PostCallWebhook,
     TranscriptEntry,
     PostCallData,
     DataCollectionResult,
@@ -31,8 +37,12 @@ from app.models.requests import (
     Analysis,
     CallMetadata,
     AgentMetadata,
-    DataCollectionJsonSchema,
+    E164Str,
     validate_e164_phone_number,
+    TRANSCRIPT_ADAPTER,
+    DATA_COLLECTION_ADAPTER,
+    CALL_METADATA_ADAPTER,
+    POST_CALL_WEBHOOK_ADAPTER,
 )
 from app.models.responses import (
     DynamicVariables,
@@ -49,6 +59,9 @@ __all__ = [
     "ClientDataRequest",
     "SearchDataRequest",
     "PostCallWebhookRequest",
+    "PostCallAudioRequest",
+    "PostCallFailureRequest",
+    "PostCallWebhook",
     "TranscriptEntry",
     "PostCallData",
     "DataCollectionResult",
@@ -56,8 +69,12 @@ __all__ = [
     "Analysis",
     "CallMetadata",
     "AgentMetadata",
-    "DataCollectionJsonSchema",
+    "E164Str",
     "validate_e164_phone_number",
+    "TRANSCRIPT_ADAPTER",
+    "DATA_COLLECTION_ADAPTER",
+    "CALL_METADATA_ADAPTER",
+    "POST_CALL_WEBHOOK_ADAPTER",
     # Response models
     "DynamicVariables",
     "AgentConfig",
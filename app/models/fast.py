@@ -0,0 +1,173 @@
+"""msgspec mirrors of hot post-call transcript models.
+
+Post-call payloads are dominated by the transcript list. These structs mirror
+the Pydantic transcript models in app.models.requests and are used on the
+internal decode path, where msgspec validates and builds compact C-level
+structs far faster than BaseModel instances. The Pydantic models remain the
+source of truth for OpenAPI schema generation.
+
+Models:
+- AgentMetadata: Agent metadata for a transcript entry
+- ConversationTurnMetrics: Metrics for a conversation turn
+- TranscriptEntry: A single transcript entry
+- WebhookEnvelope: The `type` and `data.conversation_id` of a post-call payload
+- AudioWebhook: A post-call audio payload whose recording is left undecoded
+"""
+
+import re
+from collections.abc import Sequence
+from typing import Any, Literal, Optional
+
+import msgspec
+
+
+class AgentMetadata(msgspec.Struct, kw_only=True, gc=False):
+    """Metadata about the agent for a transcript entry."""
+
+    agent_id: str
+    branch_id: Optional[str] = None
+    workflow_node_id: Optional[str] = None
+
+
+class ConversationTurnMetrics(msgspec.Struct, kw_only=True):
+    """Metrics for a conversation turn."""
+
+    metrics: dict[str, Any] = {}
+
+
+class TranscriptEntry(msgspec.Struct, kw_only=True):
+    """A single entry in the conversation transcript."""
+
+    role: Literal["agent", "user"]
+    message: Optional[str] = None
+    time_in_call_secs: int
+    tool_calls: Sequence[Any] = ()
+    tool_results: Sequence[Any] = ()
+    llm_usage: Optional[dict[str, Any]] = None
+    conversation_turn_metrics: Optional[ConversationTurnMetrics] = None
+    interrupted: bool = False
+    original_message: Optional[str] = None
+    source_medium: Optional[str] = None
+    feedback: Optional[Any] = None
+    agent_metadata: Optional[AgentMetadata] = None
+    multivoice_message: Optional[Any] = None
+    llm_override: Optional[Any] = None
+    rag_retrieval_info: Optional[Any] = None
+
+
+class WebhookEnvelopeData(msgspec.Struct):
+    """The identifying part of a post-call `data` object."""
+
+    conversation_id: str = "unknown"
+
+
+class WebhookEnvelope(msgspec.Struct):
+    """The routing fields of a post-call webhook payload.
+
+    Decoding into this struct skips every other field without building it,
+    so the handler can log and acknowledge a payload without parsing the
+    transcript or audio.
+    """
+
+    type: str = "unknown"
+    data: WebhookEnvelopeData = msgspec.field(default_factory=WebhookEnvelopeData)
+
+
+_ENVELOPE_DECODER = msgspec.json.Decoder(WebhookEnvelope)
+
+
+def decode_webhook_envelope(body: bytes) -> WebhookEnvelope:
+    """Decode only the routing fields of a raw post-call payload.
+
+    Args:
+        body: The raw webhook request body.
+
+    Returns:
+        The WebhookEnvelope.
+
+    Raises:
+        msgspec.DecodeError: If the body is not valid JSON or not an object.
+    """
+    return _ENVELOPE_DECODER.decode(body)
+
+
+class AudioWebhookData(msgspec.Struct):
+    """Data payload for post-call audio webhooks.
+
+    Mirrors PostCallAudioData, except that full_audio is kept as a
+    msgspec.Raw view of the JSON string in the request body rather than
+    being copied into a str.
+    """
+
+    agent_id: str
+    conversation_id: str
+    full_audio: msgspec.Raw = msgspec.Raw()
+
+
+class AudioWebhook(msgspec.Struct):
+    """A post-call audio webhook (mirrors PostCallAudioRequest)."""
+
+    type: Literal["post_call_audio"]
+    event_timestamp: int
+    data: AudioWebhookData
+
+
+_AUDIO_WEBHOOK_DECODER = msgspec.json.Decoder(AudioWebhook)
+
+_QUOTE = ord('"')
+_JSON_ESCAPE = re.compile(rb"\\")
+
+
+def decode_audio_webhook(body: bytes) -> AudioWebhook:
+    """Decode a raw post-call audio payload without copying the recording.
+
+    Args:
+        body: The raw webhook request body.
+
+    Returns:
+        The AudioWebhook. Its data.full_audio references `body`.
+
+    Raises:
+        msgspec.DecodeError: If the body is not valid JSON.
+        msgspec.ValidationError: If the payload does not match the schema.
+    """
+    return _AUDIO_WEBHOOK_DECODER.decode(body)
+
+
+def extract_audio_base64(full_audio: msgspec.Raw) -> Optional[str | memoryview]:
+    """Get the base64 recording from an AudioWebhookData.full_audio value.
+
+    Args:
+        full_audio: The raw JSON value of the full_audio field.
+
+    Returns:
+        A zero-copy view of the base64 characters, a str if the JSON string
+        contains escapes, or None if the field is missing or null.
+
+    Raises:
+        msgspec.ValidationError: If full_audio is not a string or null.
+    """
+    view = memoryview(full_audio)
+    if not view or view == b"null":
+        return None
+    if view[0] != _QUOTE:
+        raise msgspec.ValidationError("Expected `str | null` for `full_audio`")
+    # Escaped characters (e.g. "\/") need a real JSON string decode
+    if _JSON_ESCAPE.search(view):
+        return msgspec.json.decode(view, type=str)
+    return view[1:-1]
+
+
+def decode_transcript(entries: list[dict[str, Any]]) -> list[TranscriptEntry]:
+    """Validate raw transcript entries into TranscriptEntry structs.
+
+    Args:
+        entries: Transcript entries as parsed from the webhook JSON.
+
+    Returns:
+        List of TranscriptEntry structs.
+
+    Raises:
+        msgspec.ValidationError: If an entry does not match the schema.
+    """
+    return msgspec.convert(entries, type=list[TranscriptEntry])
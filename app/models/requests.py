@@ -3,15 +3,79 @@
 This module contains Pydantic models for validating incoming webhook requests:
 - ClientDataRequest: Conversation initiation client data request
 - SearchDataRequest: Server tool search data request
-- PostCallWebhookRequest: Post-call webhook request with nested data models
+- PostCallWebhookRequest: Post-call transcription webhook request with nested data models
+- PostCallAudioRequest: Post-call audio webhook request
+- PostCallFailureRequest: Call initiation failure webhook request
+- PostCallWebhook: Union of the three post-call requests, discriminated on `type`
+
+POST_CALL_WEBHOOK_ADAPTER validates any post-call payload into the matching
+request model. The other module-level TypeAdapters (TRANSCRIPT_ADAPTER,
+DATA_COLLECTION_ADAPTER, CALL_METADATA_ADAPTER) revalidate a single portion of a post-call payload
+without rebuilding the whole PostCallData tree.
 
 All models use Pydantic v2 syntax with proper validation and documentation.
 """
 
+import functools
 import re
-from typing import Any, Literal, Optional
+from collections.abc import Sequence
+from typing import Annotated, Any, Literal, Optional, Union
+
+import msgspec
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    Field,
+    StringConstraints,
+    TypeAdapter,
+)
+
+from app.models.fast import decode_transcript
+
+# E.164 pattern: + followed by 1-15 digits
+E164_PATTERN = r"^\+[1-9]\d{1,14}$"
+_E164_RE = re.compile(E164_PATTERN)
+
 
-from pydantic import BaseModel, Field, field_validator
+def _check_nanp(phone_number: str) -> str:
+    """Reject +1 numbers that cannot exist under the NANP numbering plan.
+
+    Runs after the E.164 check. For a 10-digit +1 number, neither the area
+    code nor the central-office (exchange) code may start with 0 or 1, which
+    also rejects placeholders such as +11234567890. Catching these here keeps
+    junk caller IDs away from OpenMemory profile lookups.
+
+    Args:
+        phone_number: A phone number already in E.164 format.
+
+    Returns:
+        The phone number unchanged.
+
+    Raises:
+        ValueError: If the number is a +1 number with an invalid area or
+            exchange code.
+    """
+    if (
+        len(phone_number) == 12
+        and phone_number.startswith("+1")
+        and (phone_number[2] in "01" or phone_number[5] in "01")
+    ):
+        raise ValueError(
+            f"Invalid NANP phone number: '{phone_number}'. "
+            f"Area code and exchange must not start with 0 or 1."
+        )
+    return phone_number
+
+
+# Phone number string validated inside pydantic-core (Rust regex) rather than
+# a Python field_validator. Shared by every phone field so one compiled
+# pattern serves all of them; the NANP rule runs only once the regex passes.
+E164Str = Annotated[
+    str,
+    StringConstraints(pattern=E164_PATTERN, min_length=3, max_length=16),
+    AfterValidator(_check_nanp),
+]
 
 
 def validate_e164_phone_number(phone_number: str) -> str:
@@ -27,17 +91,26 @@ def validate_e164_phone_number(phone_number: str) -> str:
         The validated phone number.
 
     Raises:
-        ValueError: If phone number is not in valid E.164 format.
+        ValueError: If phone number is not in valid E.164 format, or is a +1
+            number with an invalid NANP area or exchange code.
     """
-    # E.164 pattern: + followed by 1-15 digits
-    e164_pattern = r"^\+[1-9]\d{1,14}$"
-    if not re.match(e164_pattern, phone_number):
+    # Fast path: plain str checks run in C without entering the regex engine
+    if (
+        phone_number.startswith("+")
+        and 3 <= len(phone_number) <= 16
+        and phone_number[1] != "0"
+        and phone_number.isascii()
+        and phone_number[1:].isdecimal()
+    ):
+        return _check_nanp(phone_number)
+
+    if not _E164_RE.match(phone_number):
         raise ValueError(
             f"Invalid phone number format: '{phone_number}'. "
             f"Expected E.164 format (e.g., +16129782029). "
             f"Phone number must start with + followed by country code and digits only."
         )
-    return phone_number
+    return _check_nanp(phone_number)
 
 
 class ClientDataRequest(BaseModel):
@@ -47,7 +120,7 @@ class ClientDataRequest(BaseModel):
     It provides caller information for profile lookup and personalization.
     """
 
-    caller_id: str = Field(
+    caller_id: E164Str = Field(
         ...,
         description="The phone number of the caller in E.164 format (e.g., +16129782029)",
         examples=["+16129782029"],
@@ -57,7 +130,7 @@ class ClientDataRequest(BaseModel):
         description="The unique identifier of the ElevenLabs agent receiving the call",
         examples=["agent_8501k9r8sbb5fjbbym8c9y1jqt9b"],
     )
-    called_number: str = Field(
+    called_number: E164Str = Field(
         ...,
         description="The Twilio phone number that was called in E.164 format",
         examples=["+16123241623"],
@@ -68,12 +141,6 @@ class ClientDataRequest(BaseModel):
         examples=["CA98d2b6a08ebed6b78880b61ffc0e3299"],
     )
 
-    @field_validator("caller_id", "called_number")
-    @classmethod
-    def validate_phone_format(cls, v: str) -> str:
-        """Validate phone numbers are in E.164 format."""
-        return validate_e164_phone_number(v)
-
 
 class SearchDataRequest(BaseModel):
     """Request model for search-data webhook.
@@ -87,7 +154,7 @@ class SearchDataRequest(BaseModel):
         description="The search query from the ElevenLabs agent",
         examples=["What is the user's name and preferences?"],
     )
-    user_id: str = Field(
+    user_id: E164Str = Field(
         ...,
         description="The user identifier (phone number) for memory isolation",
         examples=["+16129782029"],
@@ -107,15 +174,17 @@ class SearchDataRequest(BaseModel):
         description="Additional context information for the search query",
     )
 
-    @field_validator("user_id")
-    @classmethod
-    def validate_user_id_phone_format(cls, v: str) -> str:
-        """Validate user_id is in E.164 format."""
-        return validate_e164_phone_number(v)
-
 
 # --- Nested models for PostCallWebhookRequest ---
 
+# Config pinned on the post-call hot-path models: ignore unknown keys, never
+# revalidate already-built instances, and skip validation on assignment.
+_HOT_PATH_CONFIG = ConfigDict(
+    extra="ignore",
+    revalidate_instances="never",
+    validate_assignment=False,
+)
+
 
 class AgentMetadata(BaseModel):
     """Metadata about the agent for a transcript entry."""
@@ -149,6 +218,9 @@ class TranscriptEntry(BaseModel):
     Represents either an agent or user turn in the conversation.
     """
 
+    # Dump the raw-dict fields under their wire names (the aliases)
+    model_config = ConfigDict(**_HOT_PATH_CONFIG, serialize_by_alias=True)
+
     role: Literal["agent", "user"] = Field(
         ...,
         description="The role of the speaker: 'agent' or 'user'",
@@ -161,21 +233,27 @@ class TranscriptEntry(BaseModel):
         ...,
         description="Time in seconds from the start of the call when this message occurred",
     )
-    tool_calls: list[Any] = Field(
-        default_factory=list,
+    # Usually empty: default to a shared () rather than default_factory=list so
+    # turns without tool calls allocate nothing. Non-empty input stays a list.
+    tool_calls: Sequence[Any] = Field(
+        default=(),
         description="List of tool calls made during this turn",
     )
-    tool_results: list[Any] = Field(
-        default_factory=list,
+    tool_results: Sequence[Any] = Field(
+        default=(),
         description="Results from tool calls",
     )
     llm_usage: Optional[dict[str, Any]] = Field(
         default=None,
         description="LLM usage statistics for this turn",
     )
-    conversation_turn_metrics: Optional[ConversationTurnMetrics] = Field(
+    # Nested turn metrics and agent metadata are rarely read, so they are kept
+    # as raw dicts and only validated on first access (see the properties
+    # below) instead of building a nested model for every entry.
+    conversation_turn_metrics_raw: Optional[dict[str, Any]] = Field(
         default=None,
-        description="Performance metrics for this conversation turn",
+        alias="conversation_turn_metrics",
+        description="Performance metrics for this conversation turn (ConversationTurnMetrics)",
     )
     interrupted: bool = Field(
         default=False,
@@ -193,9 +271,10 @@ class TranscriptEntry(BaseModel):
         default=None,
         description="Feedback data for this turn",
     )
-    agent_metadata: Optional[AgentMetadata] = Field(
+    agent_metadata_raw: Optional[dict[str, Any]] = Field(
         default=None,
-        description="Metadata about the agent for this turn",
+        alias="agent_metadata",
+        description="Metadata about the agent for this turn (AgentMetadata)",
     )
     multivoice_message: Optional[Any] = Field(
         default=None,
@@ -210,34 +289,21 @@ class TranscriptEntry(BaseModel):
         description="RAG retrieval information",
     )
 
+    @functools.cached_property
+    def conversation_turn_metrics(self) -> Optional[ConversationTurnMetrics]:
+        """Performance metrics for this turn, validated on first access."""
+        if self.conversation_turn_metrics_raw is None:
+            return None
+        return ConversationTurnMetrics.model_validate(
+            self.conversation_turn_metrics_raw
+        )
 
-class DataCollectionJsonSchema(BaseModel):
-    """JSON schema for a data collection field."""
-
-    type: str = Field(
-        ...,
-        description="The data type (e.g., 'string', 'number')",
-    )
-    description: Optional[str] = Field(
-        default=None,
-        description="Description of the data field",
-    )
-    enum: Optional[list[str]] = Field(
-        default=None,
-        description="Enumerated allowed values",
-    )
-    is_system_provided: bool = Field(
-        default=False,
-        description="Whether this field is system-provided",
-    )
-    dynamic_variable: Optional[str] = Field(
-        default=None,
-        description="Dynamic variable name if applicable",
-    )
-    constant_value: Optional[str] = Field(
-        default=None,
-        description="Constant value if applicable",
-    )
+    @functools.cached_property
+    def agent_metadata(self) -> Optional[AgentMetadata]:
+        """Metadata about the agent for this turn, validated on first access."""
+        if not self.agent_metadata_raw:
+            return None
+        return AgentMetadata.model_validate(self.agent_metadata_raw)
 
 
 class DataCollectionResult(BaseModel):
@@ -254,9 +320,12 @@ class DataCollectionResult(BaseModel):
         default=None,
         description="The extracted value (can be null if not collected)",
     )
-    json_schema: Optional[DataCollectionJsonSchema] = Field(
+    json_schema: Optional[dict[str, Any]] = Field(
         default=None,
-        description="Schema definition for the collected data",
+        description=(
+            "Schema definition for the collected data (type, description, enum, "
+            "is_system_provided, dynamic_variable, constant_value)"
+        ),
     )
     rationale: Optional[str] = Field(
         default=None,
@@ -264,46 +333,6 @@ class DataCollectionResult(BaseModel):
     )
 
 
-class DeletionSettings(BaseModel):
-    """Settings for data deletion policies."""
-
-    deletion_time_unix_secs: Optional[int] = Field(
-        default=None,
-        description="Unix timestamp for scheduled deletion",
-    )
-    deleted_logs_at_time_unix_secs: Optional[int] = Field(
-        default=None,
-        description="Unix timestamp when logs were deleted",
-    )
-    deleted_audio_at_time_unix_secs: Optional[int] = Field(
-        default=None,
-        description="Unix timestamp when audio was deleted",
-    )
-    deleted_transcript_at_time_unix_secs: Optional[int] = Field(
-        default=None,
-        description="Unix timestamp when transcript was deleted",
-    )
-    delete_transcript_and_pii: bool = Field(
-        default=False,
-        description="Whether to delete transcript and PII",
-    )
-    delete_audio: bool = Field(
-        default=False,
-        description="Whether to delete audio",
-    )
-
-
-class MetadataFeedback(BaseModel):
-    """Feedback data from the call."""
-
-    type: Optional[str] = Field(default=None, description="Feedback type")
-    overall_score: Optional[float] = Field(default=None, description="Overall score")
-    likes: int = Field(default=0, description="Number of likes")
-    dislikes: int = Field(default=0, description="Number of dislikes")
-    rating: Optional[float] = Field(default=None, description="Rating value")
-    comment: Optional[str] = Field(default=None, description="Feedback comment")
-
-
 class PhoneCallInfo(BaseModel):
     """Information about the phone call."""
 
@@ -337,69 +366,6 @@ class PhoneCallInfo(BaseModel):
     )
 
 
-class FeatureUsageItem(BaseModel):
-    """Usage status for a feature."""
-
-    enabled: bool = Field(default=False, description="Whether the feature is enabled")
-    used: bool = Field(default=False, description="Whether the feature was used")
-
-
-class WorkflowFeatures(BaseModel):
-    """Workflow-related feature usage."""
-
-    enabled: bool = Field(default=False, description="Whether workflows are enabled")
-    tool_node: Optional[FeatureUsageItem] = Field(default=None)
-    standalone_agent_node: Optional[FeatureUsageItem] = Field(default=None)
-    phone_number_node: Optional[FeatureUsageItem] = Field(default=None)
-    end_node: Optional[FeatureUsageItem] = Field(default=None)
-
-
-class AgentTestingFeature(BaseModel):
-    """Agent testing feature status."""
-
-    enabled: bool = Field(default=False, description="Whether agent testing is enabled")
-    tests_ran_after_last_modification: bool = Field(
-        default=False, description="Whether tests ran after last modification"
-    )
-    tests_ran_in_last_7_days: bool = Field(
-        default=False, description="Whether tests ran in last 7 days"
-    )
-
-
-class FeaturesUsage(BaseModel):
-    """Usage information for various features."""
-
-    language_detection: Optional[FeatureUsageItem] = Field(default=None)
-    transfer_to_agent: Optional[FeatureUsageItem] = Field(default=None)
-    transfer_to_number: Optional[FeatureUsageItem] = Field(default=None)
-    multivoice: Optional[FeatureUsageItem] = Field(default=None)
-    dtmf_tones: Optional[FeatureUsageItem] = Field(default=None)
-    external_mcp_servers: Optional[FeatureUsageItem] = Field(default=None)
-    pii_zrm_workspace: bool = Field(default=False)
-    pii_zrm_agent: bool = Field(default=False)
-    tool_dynamic_variable_updates: Optional[FeatureUsageItem] = Field(default=None)
-    is_livekit: bool = Field(default=False)
-    voicemail_detection: Optional[FeatureUsageItem] = Field(default=None)
-    workflow: Optional[WorkflowFeatures] = Field(default=None)
-    agent_testing: Optional[AgentTestingFeature] = Field(default=None)
-
-
-class ElevenAssistant(BaseModel):
-    """Eleven Assistant status."""
-
-    is_eleven_assistant: bool = Field(
-        default=False, description="Whether this is an Eleven Assistant"
-    )
-
-
-class InitiationTrigger(BaseModel):
-    """Call initiation trigger information."""
-
-    trigger_type: str = Field(
-        default="default", description="Type of trigger that initiated the call"
-    )
-
-
 class ChargingInfo(BaseModel):
     """Charging information for the call."""
 
@@ -417,6 +383,8 @@ class ChargingInfo(BaseModel):
 class CallMetadata(BaseModel):
     """Metadata about the call."""
 
+    model_config = _HOT_PATH_CONFIG
+
     start_time_unix_secs: Optional[int] = Field(
         default=None,
         description="Unix timestamp when the call started",
@@ -437,13 +405,18 @@ class CallMetadata(BaseModel):
         default=None,
         description="Cost of the call",
     )
-    deletion_settings: Optional[DeletionSettings] = Field(
+    deletion_settings: Optional[dict[str, Any]] = Field(
         default=None,
-        description="Data deletion settings",
+        description=(
+            "Data deletion settings (deletion_time_unix_secs, deleted_*_at_time_unix_secs, "
+            "delete_transcript_and_pii, delete_audio)"
+        ),
     )
-    feedback: Optional[MetadataFeedback] = Field(
+    feedback: Optional[dict[str, Any]] = Field(
         default=None,
-        description="Call feedback data",
+        description=(
+            "Call feedback data (type, overall_score, likes, dislikes, rating, comment)"
+        ),
     )
     authorization_method: Optional[str] = Field(
         default=None,
@@ -469,8 +442,8 @@ class CallMetadata(BaseModel):
         default=None,
         description="Error message or error object if the call failed",
     )
-    warnings: list[str] = Field(
-        default_factory=list,
+    warnings: Sequence[str] = Field(
+        default=(),
         description="List of warnings during the call",
     )
     main_language: Optional[str] = Field(
@@ -485,13 +458,17 @@ class CallMetadata(BaseModel):
         default=False,
         description="Whether the call was text-only",
     )
-    features_usage: Optional[FeaturesUsage] = Field(
+    features_usage: Optional[dict[str, Any]] = Field(
         default=None,
-        description="Feature usage information",
+        description=(
+            "Feature usage information, keyed by feature name (language_detection, "
+            "transfer_to_agent, workflow, agent_testing, ...); most entries are "
+            "{enabled, used} objects"
+        ),
     )
-    eleven_assistant: Optional[ElevenAssistant] = Field(
+    eleven_assistant: Optional[dict[str, Any]] = Field(
         default=None,
-        description="Eleven Assistant status",
+        description="Eleven Assistant status ({is_eleven_assistant})",
     )
     initiator_id: Optional[str] = Field(
         default=None,
@@ -509,9 +486,9 @@ class CallMetadata(BaseModel):
         default=None,
         description="Timezone of the conversation",
     )
-    initiation_trigger: Optional[InitiationTrigger] = Field(
+    initiation_trigger: Optional[dict[str, Any]] = Field(
         default=None,
-        description="Trigger that initiated the call",
+        description="Trigger that initiated the call ({trigger_type})",
     )
     async_metadata: Optional[Any] = Field(
         default=None,
@@ -608,6 +585,8 @@ class PostCallData(BaseModel):
     Contains the full conversation data including transcript, metadata, and analysis.
     """
 
+    model_config = _HOT_PATH_CONFIG
+
     agent_id: str = Field(
         ...,
         description="The unique identifier of the agent",
@@ -659,19 +638,45 @@ class PostCallData(BaseModel):
         description="Whether response audio is available",
     )
 
+    @classmethod
+    def construct_trusted(cls, data: dict[str, Any]) -> "PostCallData":
+        """Build PostCallData without Pydantic validation of transcript entries.
+
+        Only for payloads whose authenticity is already guaranteed (HMAC
+        verified). The envelope is validated by Pydantic as usual. Transcript
+        entries are checked by the msgspec mirrors in app.models.fast, then
+        built as TranscriptEntry instances with model_construct, so the
+        result serializes exactly like a fully validated instance.
+
+        Args:
+            data: The post-call `data` object as a dictionary.
+
+        Returns:
+            The PostCallData instance.
+
+        Raises:
+            msgspec.ValidationError: If a transcript entry does not match the
+                schema.
+        """
+        envelope = {k: v for k, v in data.items() if k != "transcript"}
+        instance = cls.model_validate(envelope)
+        entries = msgspec.to_builtins(decode_transcript(data.get("transcript") or []))
+        instance.transcript = [TranscriptEntry.model_construct(**entry) for entry in entries]
+        return instance
+
 
 class PostCallWebhookRequest(BaseModel):
-    """Request model for post-call webhook.
+    """Request model for the post-call transcription webhook.
 
-    This webhook is called by ElevenLabs after a call completes.
-    It can contain transcription, audio, or failure data.
+    This webhook is called by ElevenLabs after a call completes and carries
+    the full transcript, metadata, and analysis.
     """
 
-    type: Literal[
-        "post_call_transcription", "post_call_audio", "call_initiation_failure"
-    ] = Field(
+    model_config = _HOT_PATH_CONFIG
+
+    type: Literal["post_call_transcription"] = Field(
         ...,
-        description="Type of post-call webhook: 'post_call_transcription', 'post_call_audio', or 'call_initiation_failure'",
+        description="Type of post-call webhook: 'post_call_transcription'",
     )
     event_timestamp: int = Field(
         ...,
@@ -681,3 +686,104 @@ class PostCallWebhookRequest(BaseModel):
         ...,
         description="The post-call data payload",
     )
+
+
+class PostCallAudioData(BaseModel):
+    """Data payload for post-call audio webhooks."""
+
+    model_config = _HOT_PATH_CONFIG
+
+    agent_id: str = Field(
+        ...,
+        description="The unique identifier of the agent",
+    )
+    conversation_id: str = Field(
+        ...,
+        description="The unique identifier for the conversation",
+    )
+    full_audio: Optional[str] = Field(
+        default=None,
+        description="Base64-encoded MP3 recording of the full conversation",
+    )
+
+
+class PostCallAudioRequest(BaseModel):
+    """Request model for the post-call audio webhook."""
+
+    model_config = _HOT_PATH_CONFIG
+
+    type: Literal["post_call_audio"] = Field(
+        ...,
+        description="Type of post-call webhook: 'post_call_audio'",
+    )
+    event_timestamp: int = Field(
+        ...,
+        description="Unix timestamp when the event occurred",
+    )
+    data: PostCallAudioData = Field(
+        ...,
+        description="The post-call audio payload",
+    )
+
+
+class PostCallFailureData(BaseModel):
+    """Data payload for call initiation failure webhooks."""
+
+    model_config = _HOT_PATH_CONFIG
+
+    agent_id: str = Field(
+        ...,
+        description="The unique identifier of the agent",
+    )
+    conversation_id: str = Field(
+        ...,
+        description="The unique identifier for the conversation",
+    )
+    failure_reason: Optional[str] = Field(
+        default=None,
+        description="Why the call could not be initiated (e.g., 'busy', 'no-answer')",
+    )
+    metadata: Optional[dict[str, Any]] = Field(
+        default=None,
+        description="Provider-specific failure details (e.g., Twilio or SIP status body)",
+    )
+
+
+class PostCallFailureRequest(BaseModel):
+    """Request model for the call initiation failure webhook."""
+
+    model_config = _HOT_PATH_CONFIG
+
+    type: Literal["call_initiation_failure"] = Field(
+        ...,
+        description="Type of post-call webhook: 'call_initiation_failure'",
+    )
+    event_timestamp: int = Field(
+        ...,
+        description="Unix timestamp when the event occurred",
+    )
+    data: PostCallFailureData = Field(
+        ...,
+        description="The call initiation failure payload",
+    )
+
+
+# Tagged union: pydantic-core reads `type` and validates only the matching
+# model, so audio and failure payloads never touch transcript validation.
+PostCallWebhook = Annotated[
+    Union[PostCallWebhookRequest, PostCallAudioRequest, PostCallFailureRequest],
+    Field(discriminator="type"),
+]
+
+
+# Built once at import so their core schemas are compiled a single time.
+# Prefer TRANSCRIPT_ADAPTER.validate_python(raw_entries) over
+# [TranscriptEntry(**d) for d in raw_entries].
+TRANSCRIPT_ADAPTER: TypeAdapter[list[TranscriptEntry]] = TypeAdapter(
+    list[TranscriptEntry]
+)
+DATA_COLLECTION_ADAPTER: TypeAdapter[dict[str, DataCollectionResult]] = TypeAdapter(
+    dict[str, DataCollectionResult]
+)
+CALL_METADATA_ADAPTER: TypeAdapter[CallMetadata] = TypeAdapter(CallMetadata)
+POST_CALL_WEBHOOK_ADAPTER: TypeAdapter[PostCallWebhook] = TypeAdapter(PostCallWebhook)
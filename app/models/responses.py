@@ -15,35 +15,52 @@ All models use Pydantic v2 syntax with proper validation and documentation.
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Annotated, List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, with_config
+from typing_extensions import TypedDict
 
+# Response models are built server-side, never mutated, and serialized
+# straight back out, so they are frozen.
+_RESPONSE_CONFIG = ConfigDict(frozen=True)
 
-class DynamicVariables(BaseModel):
+# Two-tier models are only built at request time (if at all), so their core
+# schemas are built on first use instead of at import.
+_DEFERRED_CONFIG = ConfigDict(frozen=True, defer_build=True)
+
+
+@with_config(ConfigDict(extra="allow"))
+class DynamicVariables(TypedDict, total=False):
     """Dynamic variables for personalized conversation.
 
     These variables are injected into the ElevenLabs agent's context
     to enable personalized greetings and context-aware responses.
-    """
 
-    model_config = ConfigDict(extra="allow")
+    Built by our own code rather than parsed from untrusted input, so this
+    is a plain dict at runtime; no model instance is constructed per response.
+    """
 
-    user_name: Optional[str] = Field(
-        default=None,
-        description="The user's name for personalized greetings",
-        examples=["Stefan"],
-    )
-    user_profile_summary: Optional[str] = Field(
-        default=None,
-        description="Summary of the user's profile and preferences",
-        examples=["Returning caller who previously discussed product inquiries."],
-    )
-    last_call_summary: Optional[str] = Field(
-        default=None,
-        description="Summary of the user's last conversation",
-        examples=["Last call was about setting up an account on Nov 28, 2025."],
-    )
+    user_name: Annotated[
+        Optional[str],
+        Field(
+            description="The user's name for personalized greetings",
+            examples=["Stefan"],
+        ),
+    ]
+    user_profile_summary: Annotated[
+        Optional[str],
+        Field(
+            description="Summary of the user's profile and preferences",
+            examples=["Returning caller who previously discussed product inquiries."],
+        ),
+    ]
+    last_call_summary: Annotated[
+        Optional[str],
+        Field(
+            description="Summary of the user's last conversation",
+            examples=["Last call was about setting up an account on Nov 28, 2025."],
+        ),
+    ]
 
 
 class AgentConfig(BaseModel):
@@ -81,6 +98,8 @@ class ClientDataResponse(BaseModel):
     for personalized conversation handling.
     """
 
+    model_config = _RESPONSE_CONFIG
+
     dynamic_variables: Optional[DynamicVariables] = Field(
         default=None,
         description="Dynamic variables for the conversation context",
@@ -97,6 +116,8 @@ class MemoryItem(BaseModel):
     Represents a single piece of information stored about the caller.
     """
 
+    model_config = _RESPONSE_CONFIG
+
     content: str = Field(
         ...,
         description="The content of the memory",
@@ -126,6 +147,8 @@ class ProfileData(BaseModel):
     Contains summarized profile information about the caller.
     """
 
+    model_config = _RESPONSE_CONFIG
+
     name: Optional[str] = Field(
         default=None,
         description="The user's name",
@@ -150,6 +173,8 @@ class SearchDataResponse(BaseModel):
     for context-aware conversation handling during the call.
     """
 
+    model_config = _RESPONSE_CONFIG
+
     profile: Optional[ProfileData] = Field(
         default=None,
         description="User profile information",
@@ -159,6 +184,26 @@ class SearchDataResponse(BaseModel):
         description="List of relevant memories matching the search query",
     )
 
+    @classmethod
+    def build(
+        cls,
+        profile: Optional[ProfileData],
+        memories: list[MemoryItem],
+    ) -> "SearchDataResponse":
+        """Build a response from already-validated parts without revalidating.
+
+        The profile and memory items are validated when they are constructed,
+        and this model has no validators of its own, so model_construct is safe.
+
+        Args:
+            profile: Profile data, or None when the caller is unknown.
+            memories: Validated memory items.
+
+        Returns:
+            The SearchDataResponse instance.
+        """
+        return cls.model_construct(profile=profile, memories=memories)
+
 
 # =============================================================================
 # Two-Tier Memory Architecture Models
@@ -172,6 +217,8 @@ class NextGreetingData(BaseModel):
     generated by OpenAI for the next call.
     """
 
+    model_config = _DEFERRED_CONFIG
+
     next_greeting: Optional[str] = Field(
         default=None,
         description="Personalized greeting text for next call (null for first-time callers)",
@@ -201,7 +248,7 @@ class UniversalUserProfile(BaseModel):
     user information that should be consistent across interactions.
     """
 
-    model_config = ConfigDict(extra="allow")
+    model_config = _DEFERRED_CONFIG
 
     name: Optional[str] = Field(
         default=None,
@@ -233,7 +280,7 @@ class AgentConversationState(BaseModel):
     the pre-generated greeting and conversation context.
     """
 
-    model_config = ConfigDict(extra="allow")
+    model_config = _DEFERRED_CONFIG
 
     next_greeting: Optional[str] = Field(
         default=None,
@@ -275,11 +322,13 @@ class ClientDataResponseV2(BaseModel):
     conversation config override and enhanced dynamic variables.
     """
 
-    dynamic_variables: Dict[str, Any] = Field(
+    model_config = _DEFERRED_CONFIG
+
+    dynamic_variables: DynamicVariables = Field(
         default_factory=dict,
         description="Variables injected into agent prompt",
     )
-    conversation_config_override: Optional[Dict[str, Any]] = Field(
+    conversation_config_override: Optional[ConversationConfigOverride] = Field(
         default=None,
         description="Override agent's first message if provided",
     )
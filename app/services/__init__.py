@@ -3,13 +3,18 @@
 This module contains service classes and functions for:
 - OpenAI integration for greeting generation
 - Agent profile caching
+- Greeting result caching
 """
 
-from app.services.openai_service import generate_next_greeting
+from app.services.openai_service import NextGreetingDict, generate_next_greeting
 from app.services.agent_cache import AgentProfileCache, get_agent_profile_cache
+from app.services.greeting_cache import GreetingCache, get_greeting_cache
 
 __all__ = [
     "generate_next_greeting",
+    "NextGreetingDict",
     "AgentProfileCache",
     "get_agent_profile_cache",
+    "GreetingCache",
+    "get_greeting_cache",
 ]
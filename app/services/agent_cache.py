@@ -3,49 +3,138 @@
 This module provides:
 - In-memory cache for ElevenLabs agent profiles
 - Automatic cache invalidation with TTL
-- Async fetching from ElevenLabs API
+- LRU eviction so the cache stays bounded as new agent IDs appear
+- Single-flight fetching so concurrent misses share one upstream request
+- Short-lived negative caching so failed lookups don't re-hit ElevenLabs
+- Async fetching from ElevenLabs API over a shared, pooled HTTP client
 """
 
+import asyncio
 import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any, Optional
 
 import httpx
+import orjson
 
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Shared client: repeat fetches reuse pooled keep-alive connections instead of
+# paying a new TCP/TLS handshake per call. Created lazily, closed on shutdown.
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Get the shared ElevenLabs HTTP client, creating it on first use.
+
+    Returns:
+        The module-level httpx.AsyncClient.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        # The transport retries failed connection attempts itself
+        _client = httpx.AsyncClient(
+            timeout=30.0,
+            transport=httpx.AsyncHTTPTransport(
+                retries=2,
+                limits=httpx.Limits(
+                    max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0
+                ),
+            ),
+        )
+    return _client
+
+
+async def warm_up_elevenlabs_client() -> None:
+    """Open a keep-alive connection to ElevenLabs ahead of the first request.
+
+    Failures are logged and ignored; the first real call just pays the
+    handshake.
+    """
+    try:
+        await _get_client().get(
+            "https://api.elevenlabs.io/v1/user",
+            headers={"xi-api-key": settings.ELEVENLABS_API_KEY},
+            timeout=5.0,
+        )
+    except httpx.HTTPError as e:
+        logger.debug("ElevenLabs connection warm-up failed: %s", e)
+    except Exception as e:
+        # e.g. httpx.InvalidURL from a misconfigured endpoint
+        logger.warning("ElevenLabs connection warm-up failed: %s", e)
+
+
+async def close_elevenlabs_client() -> None:
+    """Close the shared ElevenLabs HTTP client on application shutdown."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+@dataclass(slots=True)
+class _CacheEntry:
+    """A cached agent profile and its time.monotonic() expiry deadline.
+
+    A profile of None records a failed fetch (negative cache entry).
+    """
+
+    expires_at: float
+    profile: Optional[dict[str, Any]]
+
 
 class AgentProfileCache:
     """In-memory cache for ElevenLabs agent profiles.
 
     Caches agent profiles to reduce API calls to ElevenLabs.
-    Each cache entry has a TTL after which it will be refreshed.
+    Each cache entry has a TTL after which it will be refreshed, and the
+    least recently used entry is evicted once max_size is exceeded.
+    Failed fetches are cached as None for a short negative TTL.
 
     Note: For production deployments with multiple instances,
     consider using Redis or similar distributed cache.
 
     Attributes:
-        _cache: Internal cache dictionary
+        _cache: Internal cache mapping agent_id to its _CacheEntry
         _ttl: Time-to-live for cache entries
+        _negative_ttl_seconds: Time-to-live in seconds for failed fetches
+        _max_size: Maximum number of cached profiles
+        _inflight: In-progress fetch tasks keyed by agent_id
     """
 
-    def __init__(self, ttl_hours: int = 24):
-        """Initialize the cache with specified TTL.
+    def __init__(
+        self,
+        ttl_hours: int = 24,
+        max_size: int = 1024,
+        negative_ttl_seconds: float = 60.0,
+    ):
+        """Initialize the cache with specified TTLs and size bound.
 
         Args:
             ttl_hours: Hours before cache entries expire. Default: 24
+            max_size: Maximum number of cached profiles. Default: 1024
+            negative_ttl_seconds: Seconds a failed fetch is remembered before
+                ElevenLabs is asked again. Default: 60
         """
-        self._cache: dict[str, dict[str, Any]] = {}
+        self._cache: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._max_size = max_size
         self._ttl = timedelta(hours=ttl_hours)
+        self._ttl_seconds = self._ttl.total_seconds()
+        self._negative_ttl_seconds = negative_ttl_seconds
+        self._inflight: dict[str, asyncio.Task[Optional[dict[str, Any]]]] = {}
 
     async def get_agent_profile(self, agent_id: str) -> Optional[dict[str, Any]]:
         """Get agent profile from cache or fetch from ElevenLabs.
 
         Checks the cache first. If the entry exists and is not expired,
         returns the cached profile. Otherwise, fetches from ElevenLabs API
-        and caches the result.
+        and caches the result. Concurrent misses for the same agent await a
+        single fetch rather than each calling ElevenLabs.
 
         Args:
             agent_id: The unique identifier of the ElevenLabs agent.
@@ -57,28 +146,58 @@ class AgentProfileCache:
                 - first_message: str
                 - system_prompt: str
                 - cached_at: str (ISO timestamp)
-            Returns None if fetching fails.
+            Returns None if fetching fails, or failed within the last
+            negative TTL.
         """
-        # Check cache first
-        if agent_id in self._cache:
-            cached_entry = self._cache[agent_id]
-            cached_at = datetime.fromisoformat(cached_entry["cached_at"])
+        # Check cache first: a float compare against a monotonic deadline
+        entry = self._cache.get(agent_id)
+        if entry is not None:
+            if entry.expires_at > time.monotonic():
+                logger.debug("Cache hit for agent %s", agent_id)
+                self._cache.move_to_end(agent_id)
+                return entry.profile
+
+            logger.debug("Cache expired for agent %s", agent_id)
+
+        # Join an in-progress fetch, or start one. shield() keeps a cancelled
+        # caller from cancelling the fetch other callers are waiting on.
+        task = self._inflight.get(agent_id)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_and_store(agent_id))
+            self._inflight[agent_id] = task
+            task.add_done_callback(lambda _: self._inflight.pop(agent_id, None))
+        else:
+            logger.debug("Joining in-flight fetch for agent %s", agent_id)
+
+        return await asyncio.shield(task)
+
+    async def _fetch_and_store(self, agent_id: str) -> Optional[dict[str, Any]]:
+        """Fetch an agent profile from ElevenLabs and cache the result.
 
-            if datetime.utcnow() - cached_at < self._ttl:
-                logger.debug(f"Cache hit for agent {agent_id}")
-                return cached_entry
-
-            logger.debug(f"Cache expired for agent {agent_id}")
+        Args:
+            agent_id: The unique identifier of the ElevenLabs agent.
 
-        # Fetch from ElevenLabs API
-        logger.info(f"Fetching agent profile from ElevenLabs: {agent_id}")
+        Returns:
+            The fetched agent profile, or None if fetching fails.
+        """
+        logger.info("Fetching agent profile from ElevenLabs: %s", agent_id)
         profile = await self._fetch_from_elevenlabs(agent_id)
 
         if profile:
-            # Add timestamp and cache
+            # Add timestamp (kept for logging) and cache with expiry deadline
             profile["cached_at"] = datetime.utcnow().isoformat()
-            self._cache[agent_id] = profile
-            logger.info(f"Cached agent profile for {agent_id}")
+            ttl_seconds = self._ttl_seconds
+            logger.info("Cached agent profile for %s", agent_id)
+        else:
+            # Remember the failure briefly so a bad agent_id doesn't hammer
+            # ElevenLabs on every webhook
+            profile = None
+            ttl_seconds = self._negative_ttl_seconds
+
+        self._cache[agent_id] = _CacheEntry(time.monotonic() + ttl_seconds, profile)
+        self._cache.move_to_end(agent_id)
+        while len(self._cache) > self._max_size:
+            self._cache.popitem(last=False)
 
         return profile
 
@@ -102,37 +221,36 @@ class AgentProfileCache:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url, headers=headers)
+            response = await _get_client().get(url, headers=headers)
 
-                if response.status_code == 404:
-                    logger.warning(f"Agent not found: {agent_id}")
-                    return None
+            if response.status_code == 404:
+                logger.warning("Agent not found: %s", agent_id)
+                return None
 
-                if response.status_code != 200:
-                    logger.error(
-                        f"ElevenLabs API error: {response.status_code} - {response.text}"
-                    )
-                    return None
+            if response.status_code != 200:
+                logger.error(
+                    "ElevenLabs API error: %s - %s", response.status_code, response.text
+                )
+                return None
 
-                data = response.json()
+            data = orjson.loads(response.content)
 
-                # Extract relevant fields from the API response
-                # The ElevenLabs API response structure may vary - adapt as needed
-                agent_config = data.get("conversation_config", {}).get("agent", {})
+            # Extract relevant fields from the API response
+            # The ElevenLabs API response structure may vary - adapt as needed
+            agent_config = data.get("conversation_config", {}).get("agent", {})
 
-                return {
-                    "agent_id": agent_id,
-                    "agent_name": data.get("name", "AI Assistant"),
-                    "first_message": agent_config.get("first_message", "Hello, how can I help you?"),
-                    "system_prompt": agent_config.get("prompt", {}).get("prompt", ""),
-                }
+            return {
+                "agent_id": agent_id,
+                "agent_name": data.get("name", "AI Assistant"),
+                "first_message": agent_config.get("first_message", "Hello, how can I help you?"),
+                "system_prompt": agent_config.get("prompt", {}).get("prompt", ""),
+            }
 
         except httpx.RequestError as e:
-            logger.error(f"HTTP error fetching agent profile: {e}")
+            logger.error("HTTP error fetching agent profile: %s", e)
             return None
         except Exception as e:
-            logger.error(f"Unexpected error fetching agent profile: {e}")
+            logger.error("Unexpected error fetching agent profile: %s", e)
             return None
 
     def invalidate(self, agent_id: str) -> None:
@@ -146,7 +264,7 @@ class AgentProfileCache:
         """
         if agent_id in self._cache:
             del self._cache[agent_id]
-            logger.info(f"Invalidated cache for agent {agent_id}")
+            logger.info("Invalidated cache for agent %s", agent_id)
 
     def invalidate_all(self) -> None:
         """Invalidate all cached entries.
@@ -155,19 +273,30 @@ class AgentProfileCache:
         """
         count = len(self._cache)
         self._cache.clear()
-        logger.info(f"Invalidated all {count} cached agent profiles")
+        logger.info("Invalidated all %s cached agent profiles", count)
 
     def get_cache_stats(self) -> dict[str, Any]:
         """Get statistics about the cache.
 
         Returns:
             Dictionary with cache statistics including:
-                - total_entries: Number of cached entries
-                - agent_ids: List of cached agent IDs
+                - total_entries: Number of cached profiles
+                - agent_ids: List of agent IDs with a cached profile
+                - negative_entries: Number of cached failed fetches
+                - negative_agent_ids: List of agent IDs whose fetch failed
         """
+        agent_ids = []
+        negative_agent_ids = []
+        for agent_id, entry in self._cache.items():
+            if entry.profile is None:
+                negative_agent_ids.append(agent_id)
+            else:
+                agent_ids.append(agent_id)
         return {
-            "total_entries": len(self._cache),
-            "agent_ids": list(self._cache.keys())
+            "total_entries": len(agent_ids),
+            "agent_ids": agent_ids,
+            "negative_entries": len(negative_agent_ids),
+            "negative_agent_ids": negative_agent_ids,
         }
 
 
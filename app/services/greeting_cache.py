@@ -0,0 +1,126 @@
+"""Exact-match cache for generated greetings.
+
+This module provides:
+- In-memory cache of OpenAI greeting results keyed by the full request
+- TTL expiry and LRU eviction so the cache stays bounded
+- make_key(): Stable SHA-256 key over model, prompt and sampling settings
+
+Only deterministic requests (temperature 0) should be cached; with sampling
+enabled a repeated prompt is expected to produce a different greeting.
+"""
+
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+
+class GreetingCache:
+    """In-memory exact-match cache for greeting generation results.
+
+    Replayed post-call webhooks rebuild the identical prompt; serving those
+    from memory skips a multi-second OpenAI call.
+
+    Results are stored serialized and decoded on every hit, so each caller
+    gets its own copy and mutating it cannot corrupt later replays.
+
+    Attributes:
+        _cache: Internal cache mapping request key to (expires_at, result
+            as JSON bytes), where expires_at is a time.monotonic() deadline
+        _ttl_seconds: Time-to-live for cache entries in seconds
+        _max_size: Maximum number of cached results
+    """
+
+    def __init__(self, ttl_seconds: float = 3600.0, max_size: int = 1024):
+        """Initialize the cache with specified TTL and size bound.
+
+        Args:
+            ttl_seconds: Seconds before cache entries expire. Default: 3600
+            max_size: Maximum number of cached results. Default: 1024
+        """
+        self._cache: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._ttl_seconds = ttl_seconds
+        self._max_size = max_size
+
+    @staticmethod
+    def make_key(model: str, prompt: str, temperature: float, max_tokens: int) -> str:
+        """Build the cache key for a greeting request.
+
+        Args:
+            model: OpenAI model name
+            prompt: The full greeting prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum response tokens
+
+        Returns:
+            Hex SHA-256 digest of the request parameters.
+        """
+        request = orjson.dumps(
+            {
+                "model": model,
+                "prompt": prompt,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+            },
+            option=orjson.OPT_SORT_KEYS,
+        )
+        return hashlib.sha256(request).hexdigest()
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        """Get a cached result if present and not expired.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            A fresh copy of the cached greeting result, or None on a miss.
+        """
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+
+        if entry[0] <= time.monotonic():
+            del self._cache[key]
+            return None
+
+        self._cache.move_to_end(key)
+        return orjson.loads(entry[1])
+
+    def set(self, key: str, result: dict[str, Any]) -> None:
+        """Cache a greeting result, evicting the least recently used if full.
+
+        Args:
+            key: Cache key from make_key()
+            result: The greeting result to cache
+        """
+        self._cache[key] = (time.monotonic() + self._ttl_seconds, orjson.dumps(result))
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._max_size:
+            self._cache.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+        self._cache.clear()
+
+
+# Module-level singleton instance
+_cache_instance: Optional[GreetingCache] = None
+
+
+def get_greeting_cache() -> GreetingCache:
+    """Get the singleton GreetingCache instance.
+
+    Creates the instance on first call (lazy initialization).
+
+    Returns:
+        The singleton GreetingCache instance.
+    """
+    global _cache_instance
+    if _cache_instance is None:
+        _cache_instance = GreetingCache()
+    return _cache_instance
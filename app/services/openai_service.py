@@ -3,22 +3,259 @@
 This module provides functions for:
 - Generating personalized next-call greetings using OpenAI
 - Processing conversation transcripts for context extraction
-- Error handling with graceful degradation
+- Error handling with graceful degradation (jittered backoff, Retry-After aware)
+- A shared, pooled HTTP client for OpenAI API calls
+- Exact-match result caching for deterministic (temperature 0) requests
+- NextGreetingDict: Typed shape of the generated greeting data
 """
 
-import json
+import asyncio
+import functools
 import logging
-from typing import Any, Optional
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Optional, TypedDict
 
 import httpx
+import orjson
 
 from app.config import settings
+from app.services.greeting_cache import GreetingCache, get_greeting_cache
 
 logger = logging.getLogger(__name__)
 
 # Retry configuration
 MAX_RETRIES = 3
 INITIAL_BACKOFF_SECONDS = 1.0
+# Longest server-requested Retry-After we wait for; asking for more ends retries
+MAX_RETRY_AFTER_SECONDS = 30.0
+# Transient statuses worth retrying; other 4xx responses won't recover
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+# Transcript budget for the greeting prompt, in model tokens (keep the tail).
+# MAX_TRANSCRIPT_CHARS is the fallback when no tokenizer can be loaded.
+MAX_TRANSCRIPT_TOKENS = 500
+MAX_TRANSCRIPT_CHARS = 2000
+TRANSCRIPT_OMITTED_MARKER = "[...earlier conversation omitted...]"
+# Upper bound on characters per token used to size the tail window that is
+# tokenized for long transcripts (English text averages ~4)
+TRANSCRIPT_WINDOW_CHARS_PER_TOKEN = 8
+
+# tiktoken encodings loaded by load_encoding(), keyed by model name
+_encodings: dict[str, Any] = {}
+# After a failed load, transcripts are truncated by characters for this long
+# before the load is attempted again
+ENCODING_RETRY_SECONDS = 300.0
+# time.monotonic() deadline before which a failed model's load is not retried
+_encoding_failures: dict[str, float] = {}
+
+# Greeting prompt, XML-structured. The per-call data goes in the user message;
+# only its placeholders vary, so the template is built once and filled with
+# str.format_map.
+_GREETING_PROMPT_TEMPLATE = """<agent_profile>
+<agent_id>{agent_id}</agent_id>
+<agent_name>{agent_name}</agent_name>
+<agent_role>{agent_role}</agent_role>
+<default_first_message>{first_message}</default_first_message>
+</agent_profile>
+
+<caller_profile>
+<name>{user_name}</name>
+<total_interactions>{total_interactions}</total_interactions>
+<last_call_date>{last_call_date}</last_call_date>
+</caller_profile>
+
+<conversation_transcript>
+{truncated_transcript}
+</conversation_transcript>
+
+<task>
+Generate a personalized greeting for this agent's next call with this caller.
+</task>"""
+
+# Static greeting instructions, sent as the system message. Every request
+# starts with this identical text, so it forms a stable prefix that
+# provider-side prompt caching can reuse across calls.
+_GREETING_SYSTEM_PROMPT = """You are a helpful assistant that generates personalized greetings for voice AI agents. Always respond with valid JSON only.
+
+<explicit_instructions>
+1. Write a natural, warm greeting (MAXIMUM 30 words, NO EXCEPTIONS)
+2. If caller's name is known, acknowledge them by name naturally
+3. Reference ONE specific topic from the conversation (be specific, not generic)
+4. Maintain the agent's personality and tone from the system_prompt
+5. Create continuity - pick up where this call ended
+6. If this was first call AND no name captured, return next_greeting as null
+7. Identify 3-5 key topics discussed (be specific, e.g., "Arbez founding story" not "business")
+8. Assess sentiment based on caller's language and tone
+9. Summarize conversation in ONE sentence focusing on the main outcome
+</explicit_instructions>
+
+<output_format>
+Return ONLY valid JSON, no markdown formatting:
+{
+    "next_greeting": "Your personalized greeting here or null",
+    "key_topics": ["topic1", "topic2", "topic3"],
+    "sentiment": "satisfied",
+    "conversation_summary": "One sentence summary."
+}
+</output_format>
+
+<constraints>
+- Do NOT use ellipses (...) as greetings will be read by text-to-speech
+- Do NOT make assumptions about topics not explicitly discussed
+- Do NOT create generic greetings like "welcome back" without specific context
+- Do NOT exceed 30 words for next_greeting under any circumstances
+</constraints>
+
+<examples>
+GOOD Example:
+{
+  "next_greeting": "Hi Stefan! I've been thinking about your Arbez founding story - ready to continue where we left off?",
+  "key_topics": ["Arbez founding details", "childhood memories", "business challenges"],
+  "sentiment": "engaged",
+  "conversation_summary": "Explored early entrepreneurial journey and formative childhood experiences."
+}
+
+BAD Example (too generic):
+{
+  "next_greeting": "Welcome back! How can I help you today?",
+  "key_topics": ["general conversation", "small talk"],
+  "sentiment": "neutral",
+  "conversation_summary": "Had a conversation."
+}
+</examples>"""
+
+
+class NextGreetingDict(TypedDict, total=False):
+    """Greeting data returned by generate_next_greeting()."""
+
+    next_greeting: Optional[str]
+    key_topics: list[str]
+    sentiment: str
+    conversation_summary: str
+
+
+# Static parts of the chat completions request, built once and shared by every
+# call; only the user message is assembled per request.
+OPENAI_CHAT_COMPLETIONS_URL = "https://api.openai.com/v1/chat/completions"
+_SYSTEM_MESSAGE = {"role": "system", "content": _GREETING_SYSTEM_PROMPT}
+_RESPONSE_FORMAT = {"type": "json_object"}
+
+# Shared client: repeat calls reuse pooled keep-alive connections instead of
+# paying a new TCP/TLS handshake per call. Created lazily, closed on shutdown.
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Get the shared OpenAI HTTP client, creating it on first use.
+
+    Returns:
+        The module-level httpx.AsyncClient.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        # The transport retries failed connection attempts itself, before
+        # the application-level retry loop in generate_next_greeting
+        _client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(
+                retries=2,
+                limits=httpx.Limits(
+                    max_connections=settings.OPENAI_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.OPENAI_MAX_KEEPALIVE,
+                    keepalive_expiry=30.0,
+                ),
+            ),
+        )
+    return _client
+
+
+async def warm_up_openai_client() -> None:
+    """Open a keep-alive connection to OpenAI ahead of the first request.
+
+    Failures are logged and ignored; the first real call just pays the
+    handshake.
+    """
+    if not settings.OPENAI_API_KEY:
+        return
+    try:
+        await _get_client().get(
+            "https://api.openai.com/v1/models",
+            headers=_build_headers(settings.OPENAI_API_KEY),
+            timeout=5.0,
+        )
+    except httpx.HTTPError as e:
+        logger.debug("OpenAI connection warm-up failed: %s", e)
+    except Exception as e:
+        # e.g. httpx.InvalidURL from a misconfigured endpoint
+        logger.warning("OpenAI connection warm-up failed: %s", e)
+
+
+async def close_openai_client() -> None:
+    """Close the shared OpenAI HTTP client on application shutdown."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+class OpenAIRetryableError(Exception):
+    """Raised for a transient OpenAI response (a status in RETRYABLE_STATUS_CODES).
+
+    Attributes:
+        retry_after: Seconds to wait from the Retry-After header, or None if
+            the header was absent or unparseable.
+    """
+
+    def __init__(self, status_code: int, retry_after: Optional[float] = None):
+        super().__init__(f"OpenAI API returned {status_code}")
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given as seconds or as an HTTP date.
+
+    Args:
+        value: The raw header value, if present.
+
+    Returns:
+        Seconds to wait (never negative), or None if absent or unparseable.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _compute_backoff(attempt: int, retry_after: Optional[float] = None) -> float:
+    """Compute how long to sleep before the next retry.
+
+    Honors the server's Retry-After when given, capped at
+    MAX_RETRY_AFTER_SECONDS (plus a little jitter so workers don't retry in
+    lockstep); otherwise uses exponential backoff scaled by a random factor
+    in [0.5, 1.5).
+
+    Args:
+        attempt: Zero-based attempt number that just failed.
+        retry_after: Seconds requested by the server, if any.
+
+    Returns:
+        Delay in seconds.
+    """
+    if retry_after is not None:
+        return min(retry_after, MAX_RETRY_AFTER_SECONDS) + random.uniform(0, INITIAL_BACKOFF_SECONDS)
+    return INITIAL_BACKOFF_SECONDS * (2 ** attempt) * random.uniform(0.5, 1.5)
 
 
 async def generate_next_greeting(
@@ -26,7 +263,7 @@ async def generate_next_greeting(
     user_profile: dict[str, Any],
     transcript: str,
     conversation_metadata: Optional[dict[str, Any]] = None
-) -> Optional[dict[str, Any]]:
+) -> Optional[NextGreetingDict]:
     """Generate personalized greeting for next call using OpenAI.
 
     Uses OpenAI's chat completions API to generate a natural, personalized
@@ -55,12 +292,31 @@ async def generate_next_greeting(
             - key_topics: List of conversation topics (List[str])
             - sentiment: Caller sentiment (str)
             - conversation_summary: One-sentence summary (str)
-        Returns None if generation fails after retries.
+        An empty transcript or an unnamed first-time caller yields a null
+        greeting without calling OpenAI. Returns None if generation fails
+        after retries.
     """
     if not settings.OPENAI_API_KEY:
         logger.warning("OPENAI_API_KEY not configured, skipping greeting generation")
         return None
 
+    # With no transcript there is nothing to greet on or summarize; answer
+    # locally. Unnamed first-time callers still go to the model, which
+    # returns a null greeting but the key topics and summary stored as
+    # agent state.
+    if not transcript.strip():
+        logger.info("No greeting needed (empty transcript)")
+        return {
+            "next_greeting": None,
+            "key_topics": [],
+            "sentiment": "neutral",
+            "conversation_summary": "",
+        }
+
+    # Make sure the tokenizer is loaded (off the event loop) before the
+    # prompt truncates the transcript with it
+    await load_encoding(settings.OPENAI_MODEL)
+
     # Build the prompt
     prompt = _build_greeting_prompt(
         agent_profile=agent_profile,
@@ -69,21 +325,54 @@ async def generate_next_greeting(
         conversation_metadata=conversation_metadata
     )
 
+    # Deterministic requests return the same greeting for the same prompt, so
+    # serve replays from the exact-match cache
+    cache_key = None
+    if settings.OPENAI_TEMPERATURE == 0:
+        cache_key = GreetingCache.make_key(
+            settings.OPENAI_MODEL, prompt, settings.OPENAI_TEMPERATURE,
+            settings.OPENAI_MAX_TOKENS
+        )
+        cached = get_greeting_cache().get(cache_key)
+        if cached is not None:
+            logger.debug("Greeting cache hit")
+            return cached
+
     # Attempt generation with retries
+    # Only transient failures are retried: transport errors and the statuses
+    # in RETRYABLE_STATUS_CODES. Other errors, and responses that came back
+    # but were unusable (None), would fail the same way again.
     for attempt in range(MAX_RETRIES):
         try:
             result = await _call_openai_api(prompt)
-            if result:
-                return result
-        except Exception as e:
-            backoff = INITIAL_BACKOFF_SECONDS * (2 ** attempt)
+        except (OpenAIRetryableError, httpx.TransportError) as e:
+            retry_after = e.retry_after if isinstance(e, OpenAIRetryableError) else None
+            if retry_after is not None and retry_after > MAX_RETRY_AFTER_SECONDS:
+                logger.error(
+                    "OpenAI API asked to retry after %.0fs (limit %.0fs), not retrying: %s",
+                    retry_after, MAX_RETRY_AFTER_SECONDS, e
+                )
+                return None
+            if attempt == MAX_RETRIES - 1:
+                logger.warning(
+                    "OpenAI API call failed (attempt %d/%d): %s",
+                    attempt + 1, MAX_RETRIES, e
+                )
+                break
+            backoff = _compute_backoff(attempt, retry_after)
             logger.warning(
-                f"OpenAI API call failed (attempt {attempt + 1}/{MAX_RETRIES}): {e}. "
-                f"Retrying in {backoff}s..."
+                "OpenAI API call failed (attempt %d/%d): %s. Retrying in %.2fs...",
+                attempt + 1, MAX_RETRIES, e, backoff
             )
-            if attempt < MAX_RETRIES - 1:
-                import asyncio
-                await asyncio.sleep(backoff)
+            await asyncio.sleep(backoff)
+            continue
+        except Exception as e:
+            logger.error("OpenAI API call failed, not retrying: %s", e)
+            return None
+
+        if result is not None and cache_key is not None:
+            get_greeting_cache().set(cache_key, result)
+        return result
 
     logger.error("Failed to generate greeting after all retries")
     return None
@@ -107,7 +396,8 @@ def _build_greeting_prompt(
         conversation_metadata: Optional conversation metadata
 
     Returns:
-        Formatted prompt string for OpenAI with XML structure
+        Formatted prompt string for OpenAI with XML structure. The static
+        instructions are sent separately as the system message.
     """
     # Extract agent details
     agent_id = agent_profile.get("agent_id", "unknown")
@@ -115,165 +405,240 @@ def _build_greeting_prompt(
     first_message = agent_profile.get("first_message", "Hello, how can I help you?")
     system_prompt = agent_profile.get("system_prompt", "")
 
-    # Extract role from system prompt if available
-    agent_role = "AI assistant"
-    if system_prompt:
-        # Try to extract a role description from the first sentence
-        first_sentence = system_prompt.split(".")[0][:100]
-        if first_sentence:
-            agent_role = first_sentence
+    agent_role = _extract_agent_role(system_prompt or "")
 
     # Extract user details
-    user_name = user_profile.get("name") or "Unknown"
+    user_name = user_profile.get("name")
+    if not user_name or user_name == "Unknown":
+        user_name = "Not yet known"
     total_interactions = user_profile.get("total_interactions", 1)
     last_call_date = conversation_metadata.get("last_call_date") if conversation_metadata else None
 
-    # Truncate transcript if too long (keep last 2000 chars for context)
-    truncated_transcript = transcript
-    if len(transcript) > 2000:
-        truncated_transcript = f"[...earlier conversation omitted...]\n{transcript[-2000:]}"
+    # Keep only the tail of long transcripts
+    truncated_transcript = _truncate_transcript(transcript)
 
-    prompt = f"""<agent_profile>
-<agent_id>{agent_id}</agent_id>
-<agent_name>{agent_name}</agent_name>
-<agent_role>{agent_role}</agent_role>
-<default_first_message>{first_message}</default_first_message>
-</agent_profile>
+    return _GREETING_PROMPT_TEMPLATE.format_map({
+        "agent_id": agent_id,
+        "agent_name": agent_name,
+        "agent_role": agent_role,
+        "first_message": first_message,
+        "user_name": user_name,
+        "total_interactions": total_interactions,
+        "last_call_date": last_call_date or "This was their first call",
+        "truncated_transcript": truncated_transcript,
+    })
 
-<caller_profile>
-<name>{user_name if user_name != "Unknown" else "Not yet known"}</name>
-<total_interactions>{total_interactions}</total_interactions>
-<last_call_date>{last_call_date or "This was their first call"}</last_call_date>
-</caller_profile>
 
-<conversation_transcript>
-{truncated_transcript}
-</conversation_transcript>
+@functools.lru_cache(maxsize=512)
+def _extract_agent_role(system_prompt: str) -> str:
+    """Derive a short agent role from the agent's system prompt.
 
-<task>
-Generate a personalized greeting for this agent's next call with this caller.
-</task>
+    Cached per prompt, since the same agents' prompts repeat across calls.
 
-<explicit_instructions>
-1. Write a natural, warm greeting (MAXIMUM 30 words, NO EXCEPTIONS)
-2. If caller's name is known, acknowledge them by name naturally
-3. Reference ONE specific topic from the conversation (be specific, not generic)
-4. Maintain the agent's personality and tone from the system_prompt
-5. Create continuity - pick up where this call ended
-6. If this was first call AND no name captured, return next_greeting as null
-7. Identify 3-5 key topics discussed (be specific, e.g., "Arbez founding story" not "business")
-8. Assess sentiment based on caller's language and tone
-9. Summarize conversation in ONE sentence focusing on the main outcome
-</explicit_instructions>
+    Args:
+        system_prompt: The agent's system prompt (may be empty)
 
-<output_format>
-Return ONLY valid JSON, no markdown formatting:
-{{
-    "next_greeting": "Your personalized greeting here or null",
-    "key_topics": ["topic1", "topic2", "topic3"],
-    "sentiment": "satisfied",
-    "conversation_summary": "One sentence summary."
-}}
-</output_format>
+    Returns:
+        The prompt's first sentence capped at 100 characters, or
+        "AI assistant" if there is none.
+    """
+    # partition stops at the first "." instead of splitting the whole prompt
+    return system_prompt.partition(".")[0][:100] or "AI assistant"
 
-<constraints>
-- Do NOT use ellipses (...) as greetings will be read by text-to-speech
-- Do NOT make assumptions about topics not explicitly discussed
-- Do NOT create generic greetings like "welcome back" without specific context
-- Do NOT exceed 30 words for next_greeting under any circumstances
-</constraints>
 
-<examples>
-GOOD Example:
-{{
-  "next_greeting": "Hi Stefan! I've been thinking about your Arbez founding story - ready to continue where we left off?",
-  "key_topics": ["Arbez founding details", "childhood memories", "business challenges"],
-  "sentiment": "engaged",
-  "conversation_summary": "Explored early entrepreneurial journey and formative childhood experiences."
-}}
+def _load_encoding(model: str) -> Optional[Any]:
+    """Load the tiktoken encoding for a model.
 
-BAD Example (too generic):
-{{
-  "next_greeting": "Welcome back! How can I help you today?",
-  "key_topics": ["general conversation", "small talk"],
-  "sentiment": "neutral",
-  "conversation_summary": "Had a conversation."
-}}
-</examples>"""
+    Unknown model names fall back to the o200k_base encoding. tiktoken
+    downloads and parses encoding files on first use, so this blocks and
+    must run off the event loop; any failure (missing package, no network)
+    is logged and returns None.
 
-    return prompt
+    Args:
+        model: The OpenAI model name.
 
+    Returns:
+        A tiktoken Encoding, or None if it cannot be loaded.
+    """
+    try:
+        import tiktoken
 
-async def _call_openai_api(prompt: str) -> Optional[dict[str, Any]]:
-    """Call the OpenAI API to generate a greeting.
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        logger.warning("tiktoken encoding unavailable, truncating transcripts by characters: %s", e)
+        return None
+
+
+async def load_encoding(model: str) -> Optional[Any]:
+    """Load a model's tiktoken encoding in a worker thread, once per model.
+
+    A failed load (e.g. no network, broken install) is remembered for
+    ENCODING_RETRY_SECONDS, during which callers fall back to character
+    truncation without another thread hop; after that it is tried again
+    rather than disabling token-based truncation for the life of the
+    process.
 
     Args:
-        prompt: The formatted prompt for OpenAI
+        model: The OpenAI model name.
 
     Returns:
-        Parsed JSON response or None on failure
+        A tiktoken Encoding, or None if it cannot be loaded.
     """
-    url = "https://api.openai.com/v1/chat/completions"
+    encoding = _encodings.get(model)
+    if encoding is not None:
+        return encoding
+    if _encoding_failures.get(model, 0.0) > time.monotonic():
+        return None
+
+    encoding = await asyncio.to_thread(_load_encoding, model)
+    if encoding is None:
+        _encoding_failures[model] = time.monotonic() + ENCODING_RETRY_SECONDS
+    else:
+        _encodings[model] = encoding
+        _encoding_failures.pop(model, None)
+    return encoding
+
+
+def _get_encoding(model: str) -> Optional[Any]:
+    """Get a model's tiktoken encoding if load_encoding() has loaded it.
+
+    Args:
+        model: The OpenAI model name.
+
+    Returns:
+        A tiktoken Encoding, or None if it has not been loaded.
+    """
+    return _encodings.get(model)
+
+
+def _truncate_transcript(transcript: str) -> str:
+    """Keep the tail of a transcript within the prompt's token budget.
+
+    Counts tokens with tiktoken for the configured model so the prompt is
+    neither over- nor under-filled; falls back to MAX_TRANSCRIPT_CHARS when
+    no encoding has been loaded by load_encoding().
+
+    Args:
+        transcript: The full conversation transcript.
+
+    Returns:
+        The transcript, or its last MAX_TRANSCRIPT_TOKENS tokens prefixed with
+        TRANSCRIPT_OMITTED_MARKER.
+    """
+    encoding = _get_encoding(settings.OPENAI_MODEL)
+    if encoding is None:
+        if len(transcript) <= MAX_TRANSCRIPT_CHARS:
+            return transcript
+        return f"{TRANSCRIPT_OMITTED_MARKER}\n{transcript[-MAX_TRANSCRIPT_CHARS:]}"
+
+    # Long transcripts: tokenize only a bounded tail window, which nearly
+    # always holds more than the budget, instead of the whole transcript
+    window = MAX_TRANSCRIPT_TOKENS * TRANSCRIPT_WINDOW_CHARS_PER_TOKEN
+    if len(transcript) > window:
+        tokens = encoding.encode(transcript[-window:], disallowed_special=())
+        if len(tokens) > MAX_TRANSCRIPT_TOKENS:
+            return f"{TRANSCRIPT_OMITTED_MARKER}\n{encoding.decode(tokens[-MAX_TRANSCRIPT_TOKENS:])}"
 
-    headers = {
+    tokens = encoding.encode(transcript, disallowed_special=())
+    if len(tokens) <= MAX_TRANSCRIPT_TOKENS:
+        return transcript
+    return f"{TRANSCRIPT_OMITTED_MARKER}\n{encoding.decode(tokens[-MAX_TRANSCRIPT_TOKENS:])}"
+
+
+@functools.lru_cache(maxsize=4)
+def _build_headers(api_key: str) -> dict[str, str]:
+    """Build the OpenAI request headers for an API key.
+
+    Cached per key so the same headers dict is reused across calls; callers
+    must not mutate it.
+
+    Args:
+        api_key: The OpenAI API key.
+
+    Returns:
+        Headers dictionary with content type and bearer authorization.
+    """
+    return {
         "Content-Type": "application/json",
-        "Authorization": f"Bearer {settings.OPENAI_API_KEY}"
+        "Authorization": f"Bearer {api_key}"
     }
 
+
+async def _call_openai_api(prompt: str) -> Optional[NextGreetingDict]:
+    """Call the OpenAI API to generate a greeting.
+
+    Args:
+        prompt: The formatted prompt for OpenAI
+
+    Returns:
+        Parsed JSON response or None on failure
+
+    Raises:
+        OpenAIRetryableError: If OpenAI responds with a status in RETRYABLE_STATUS_CODES.
+    """
     payload = {
         "model": settings.OPENAI_MODEL,
-        "messages": [
-            {
-                "role": "system",
-                "content": "You are a helpful assistant that generates personalized greetings for voice AI agents. Always respond with valid JSON only."
-            },
-            {
-                "role": "user",
-                "content": prompt
-            }
-        ],
+        "messages": [_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
         "max_tokens": settings.OPENAI_MAX_TOKENS,
         "temperature": settings.OPENAI_TEMPERATURE,
-        "response_format": {"type": "json_object"}
+        "response_format": _RESPONSE_FORMAT
     }
 
     try:
         timeout = float(settings.OPENAI_TIMEOUT)
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(url, json=payload, headers=headers)
-
-            if response.status_code != 200:
-                logger.error(f"OpenAI API error: {response.status_code} - {response.text}")
-                return None
+        response = await _get_client().post(
+            OPENAI_CHAT_COMPLETIONS_URL,
+            content=orjson.dumps(payload),
+            headers=_build_headers(settings.OPENAI_API_KEY),
+            timeout=timeout,
+        )
+
+        if response.status_code in RETRYABLE_STATUS_CODES:
+            raise OpenAIRetryableError(
+                response.status_code,
+                _parse_retry_after(response.headers.get("retry-after")),
+            )
 
-            result = response.json()
-            content = result.get("choices", [{}])[0].get("message", {}).get("content", "")
+        if response.status_code != 200:
+            logger.error("OpenAI API error: %s - %s", response.status_code, response.text)
+            return None
 
-            if not content:
-                logger.error("Empty response from OpenAI API")
-                return None
+        result = orjson.loads(response.content)
+        content = result.get("choices", [{}])[0].get("message", {}).get("content", "")
 
-            # Parse the JSON response
-            try:
-                parsed = json.loads(content)
-
-                # Validate expected fields
-                return {
-                    "next_greeting": parsed.get("next_greeting"),
-                    "key_topics": parsed.get("key_topics", []),
-                    "sentiment": parsed.get("sentiment", "neutral"),
-                    "conversation_summary": parsed.get("conversation_summary", "")
-                }
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse OpenAI response as JSON: {e}")
-                logger.debug(f"Raw response: {content}")
-                return None
+        if not content:
+            logger.error("Empty response from OpenAI API")
+            return None
 
+        # Parse the JSON response
+        try:
+            parsed = orjson.loads(content)
+        except orjson.JSONDecodeError as e:
+            logger.error("Failed to parse OpenAI response as JSON: %s", e)
+            logger.debug("Raw response: %s", content)
+            return None
+
+        if not isinstance(parsed, dict):
+            logger.error("OpenAI response is not a JSON object")
+            return None
+
+        # Fill in any missing fields in place instead of rebuilding the dict
+        parsed.setdefault("next_greeting", None)
+        parsed.setdefault("key_topics", [])
+        parsed.setdefault("sentiment", "neutral")
+        parsed.setdefault("conversation_summary", "")
+        return parsed
+
+    except OpenAIRetryableError:
+        raise
     except httpx.RequestError as e:
-        logger.error(f"HTTP error calling OpenAI API: {e}")
+        logger.error("HTTP error calling OpenAI API: %s", e)
         raise
     except Exception as e:
-        logger.error(f"Unexpected error calling OpenAI API: {e}")
+        logger.error("Unexpected error calling OpenAI API: %s", e)
         raise
 
 
@@ -290,11 +655,8 @@ def build_transcript_string(transcript_entries: list[dict[str, Any]]) -> str:
     Returns:
         Formatted transcript string.
     """
-    lines = []
-    for entry in transcript_entries:
-        role = entry.get("role", "unknown").capitalize()
-        message = entry.get("message", "")
-        if message:
-            lines.append(f"{role}: {message}")
-
-    return "\n".join(lines)
+    return "\n".join(
+        f"{entry.get('role', 'unknown').capitalize()}: {message}"
+        for entry in transcript_entries
+        if (message := entry.get("message"))
+    )
@@ -6,19 +6,23 @@ This module provides:
 - Helper functions for consistent log formatting
 """
 
+import functools
 import hashlib
-import json
 import logging
 import re
-from datetime import datetime
+import time
 from typing import Any, Optional
 
+import orjson
 
+
+@functools.lru_cache(maxsize=8192)
 def hash_phone_number(phone_number: str) -> str:
     """Hash a phone number for safe logging.
 
     Creates a consistent 8-character hash of the phone number
     that can be used to correlate logs without exposing PII.
+    Results are memoized, since one webhook logs the same caller many times.
 
     Args:
         phone_number: The phone number to hash (E.164 format)
@@ -52,6 +56,11 @@ def mask_phone_number(phone_number: str) -> str:
     return f"{'*' * (len(phone_number) - 4)}{phone_number[-4:]}"
 
 
+def _hash_phone_match(match: re.Match[str]) -> str:
+    """Replace a matched phone number with its hash (re.sub callback)."""
+    return hash_phone_number(match.group(0))
+
+
 class StructuredLogFormatter(logging.Formatter):
     """JSON formatter for structured logging.
 
@@ -72,6 +81,9 @@ class StructuredLogFormatter(logging.Formatter):
         """
         super().__init__()
         self.include_timestamp = include_timestamp
+        # (whole UTC second, "YYYY-MM-DDTHH:MM:SS") of the last record, so the
+        # date part is only rebuilt once per second
+        self._timestamp_prefix: tuple[int, str] = (-1, "")
 
     def format(self, record: logging.LogRecord) -> str:
         """Format the log record as JSON.
@@ -89,7 +101,7 @@ class StructuredLogFormatter(logging.Formatter):
         }
 
         if self.include_timestamp:
-            log_data["timestamp"] = datetime.utcnow().isoformat() + "Z"
+            log_data["timestamp"] = self._format_timestamp(record.created)
 
         # Add extra fields if present
         if hasattr(record, "agent_id"):
@@ -107,7 +119,23 @@ class StructuredLogFormatter(logging.Formatter):
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_data)
+        return orjson.dumps(log_data).decode()
+
+    def _format_timestamp(self, created: float) -> str:
+        """Format a record creation time as an ISO 8601 UTC timestamp.
+
+        Args:
+            created: Record creation time in seconds since the epoch
+
+        Returns:
+            Timestamp like "2024-01-15T10:30:00.123456Z"
+        """
+        second = int(created)
+        cached_second, prefix = self._timestamp_prefix
+        if second != cached_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._timestamp_prefix = (second, prefix)
+        return f"{prefix}.{int((created - second) * 1_000_000):06d}Z"
 
     def _sanitize_message(self, message: str) -> str:
         """Sanitize log message by hashing phone numbers.
@@ -118,10 +146,12 @@ class StructuredLogFormatter(logging.Formatter):
         Returns:
             Sanitized message with hashed phone numbers
         """
-        def replace_phone(match):
-            return hash_phone_number(match.group(0))
+        # Every E.164 number starts with "+"; most messages have none, and the
+        # substring scan is far cheaper than running the regex
+        if "+" not in message:
+            return message
 
-        return self.PHONE_PATTERN.sub(replace_phone, message)
+        return self.PHONE_PATTERN.sub(_hash_phone_match, message)
 
 
 def get_structured_logger(name: str, level: int = logging.INFO) -> logging.Logger:
@@ -171,6 +201,10 @@ def log_webhook_event(
         cache_hit: Whether agent cache was hit
         extra: Additional data to include
     """
+    # Skip hashing and message building when the record would be discarded
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     caller_hash = hash_phone_number(phone_number)
 
     # Build log record with extra fields
@@ -224,6 +258,9 @@ def log_openai_event(
         latency_ms: API latency in milliseconds
         error: Error message if failed
     """
+    if not logger.isEnabledFor(logging.INFO if success else logging.ERROR):
+        return
+
     caller_hash = hash_phone_number(phone_number)
 
     message_parts = [
@@ -268,6 +305,9 @@ def log_memory_event(
         success: Whether the operation succeeded
         error: Error message if failed
     """
+    if not logger.isEnabledFor(logging.INFO if success else logging.ERROR):
+        return
+
     caller_hash = hash_phone_number(phone_number)
 
     message_parts = [
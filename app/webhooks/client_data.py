@@ -6,8 +6,12 @@ two-tier memory architecture:
 Flow:
 1. Query Tier 1: Universal user profile (name only)
 2. Query Tier 2: Agent-specific conversation state (greeting + context)
+   (both queries run concurrently)
 3. Return appropriate response based on available data
 
+Both lookups go through a short-lived per-caller cache
+(app.memory.caller_cache), which post-call processing invalidates.
+
 Response Cases:
 - Case 1: Has agent-specific greeting → Return personalized greeting override
 - Case 2: Has name but no greeting → Return name in dynamic variables
@@ -17,23 +21,29 @@ Authentication:
 - X-Api-Key authentication required (validated against ELEVENLABS_CLIENT_DATA_KEY)
 """
 
+import asyncio
 import logging
 from typing import Any
 
+import orjson
 from fastapi import APIRouter, Depends
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
 from app.auth.hmac import verify_api_key
 from app.models.requests import ClientDataRequest
-from app.memory.profiles import (
-    get_universal_user_profile,
-    get_agent_conversation_state,
-)
+from app.webhooks.dependencies import json_body, json_body_openapi
+from app.memory.caller_cache import get_caller_lookup_cache
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# The new-caller and error response never changes, so serialize it once
+_EMPTY_RESPONSE_BYTES = orjson.dumps({"dynamic_variables": {}})
+
+# Greeting characters kept when logging a response
+_LOG_GREETING_CHARS = 50
+
 
 @router.post(
     "/client-data",
@@ -45,11 +55,12 @@ router = APIRouter()
         "Tier 2 (agent-specific state) for personalized greetings. "
         "Returns empty objects for new callers (let ElevenLabs use defaults)."
     ),
+    openapi_extra=json_body_openapi(ClientDataRequest),
 )
 async def client_data_webhook(
-    request: ClientDataRequest,
+    request: ClientDataRequest = Depends(json_body(ClientDataRequest)),
     _: None = Depends(verify_api_key),
-) -> JSONResponse:
+) -> Response:
     """Handle client-data webhook for conversation initiation.
 
     This endpoint implements the two-tier memory retrieval:
@@ -71,66 +82,104 @@ async def client_data_webhook(
     phone_number = request.caller_id
     agent_id = request.agent_id
 
-    logger.info(f"Client-data webhook called for caller: {phone_number}, agent: {agent_id}")
+    logger.info("Client-data webhook called for caller: %s, agent: %s", phone_number, agent_id)
 
     try:
-        # Tier 1: Query universal user profile (cross-agent)
-        universal_profile = await get_universal_user_profile(phone_number)
-
-        # Tier 2: Query agent-specific conversation state
-        agent_state = await get_agent_conversation_state(phone_number, agent_id)
-
-        # Build response
-        response_data: dict[str, Any] = {"dynamic_variables": {}}
+        lookup_cache = get_caller_lookup_cache()
+
+        # Recently seen number with no memories: skip both lookups
+        if lookup_cache.is_new_caller(phone_number):
+            logger.info("Known new caller %s - using agent defaults", phone_number)
+            return _empty_response()
+
+        # Tier 1 (universal profile) and Tier 2 (agent-specific state) are
+        # independent, so query them concurrently. A failed lookup counts as
+        # no data for this call, but must not mark the caller as new.
+        universal_profile, agent_state = await asyncio.gather(
+            lookup_cache.get_universal_profile(phone_number),
+            lookup_cache.get_agent_state(phone_number, agent_id),
+            return_exceptions=True,
+        )
+        lookup_failed = False
+        if isinstance(universal_profile, Exception):
+            logger.warning("Universal profile lookup failed for %s: %s", phone_number, universal_profile)
+            universal_profile = None
+            lookup_failed = True
+        if isinstance(agent_state, Exception):
+            logger.warning("Agent state lookup failed for %s: %s", phone_number, agent_state)
+            agent_state = None
+            lookup_failed = True
+
+        user_name = universal_profile.get("name") if universal_profile else None
 
         # Case 1: Has agent-specific greeting (returning caller to THIS agent)
         if agent_state and agent_state.get("next_greeting"):
-            logger.info(f"Found agent-specific greeting for {phone_number}")
+            logger.info("Found agent-specific greeting for %s", phone_number)
+
+            # Dynamic variables for agent prompt context; empty values are left out
+            key_topics = agent_state.get("key_topics")
+            dynamic_variables = {
+                name: value
+                for name, value in (
+                    ("user_name", user_name),
+                    ("last_call_summary", agent_state.get("conversation_summary")),
+                    ("user_sentiment", agent_state.get("sentiment")),
+                    ("key_topics", ", ".join(key_topics) if key_topics else None),
+                )
+                if value
+            }
 
             # Override the first message with personalized greeting
-            response_data["conversation_config_override"] = {
-                "agent": {
-                    "first_message": agent_state["next_greeting"]
-                }
+            response_data: dict[str, Any] = {
+                "dynamic_variables": dynamic_variables,
+                "conversation_config_override": {
+                    "agent": {"first_message": agent_state["next_greeting"]}
+                },
             }
 
-            # Add dynamic variables for agent prompt context
-            dv = response_data["dynamic_variables"]
-            if universal_profile and universal_profile.get("name"):
-                dv["user_name"] = universal_profile["name"]
-            if agent_state.get("conversation_summary"):
-                dv["last_call_summary"] = agent_state["conversation_summary"]
-            if agent_state.get("sentiment"):
-                dv["user_sentiment"] = agent_state["sentiment"]
-            if agent_state.get("key_topics"):
-                dv["key_topics"] = ", ".join(agent_state["key_topics"])
-
         # Case 2: Has name but no greeting (first call to THIS agent, but called others)
-        elif universal_profile and universal_profile.get("name"):
-            logger.info(f"Found universal profile for {phone_number} (first call to agent {agent_id})")
+        elif user_name:
+            logger.info("Found universal profile for %s (first call to agent %s)", phone_number, agent_id)
 
             # Only add name to dynamic variables
             # Agent uses its default first_message, but can reference {{user_name}}
-            response_data["dynamic_variables"]["user_name"] = universal_profile["name"]
+            response_data = {"dynamic_variables": {"user_name": user_name}}
 
-        # Case 3: New caller (no profile at all)
+        # Case 3: New caller (no profile at all), or a lookup failed
         else:
-            logger.info(f"New caller {phone_number} - using agent defaults")
+            logger.info("New caller %s - using agent defaults", phone_number)
+            if not lookup_failed:
+                lookup_cache.mark_new_caller(phone_number)
             # Return empty - agent uses pure default first_message
+            return _empty_response()
 
-        logger.info(f"Returning client-data response: {_safe_log_response(response_data)}")
-        return JSONResponse(content=response_data)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Returning client-data response: %s", _safe_log_response(response_data))
+        return Response(content=orjson.dumps(response_data), media_type="application/json")
 
     except Exception as e:
-        logger.error(f"Error processing client-data webhook: {e}", exc_info=True)
+        logger.error("Error processing client-data webhook: %s", e, exc_info=True)
         # Return empty response on error to allow conversation to proceed
-        return JSONResponse(content={"dynamic_variables": {}})
+        return _empty_response()
+
+
+def _empty_response() -> Response:
+    """Build the empty client-data response from its pre-serialized body.
+
+    A fresh Response is returned each time because middleware may append
+    headers to a response's header list.
+
+    Returns:
+        JSON Response with empty dynamic_variables.
+    """
+    return Response(content=_EMPTY_RESPONSE_BYTES, media_type="application/json")
 
 
 def _safe_log_response(response_data: dict[str, Any]) -> dict[str, Any]:
     """Create a safe-to-log version of the response.
 
-    Truncates long greeting messages for cleaner logs.
+    Truncates long greeting messages for cleaner logs. Responses without
+    a greeting override have nothing to truncate and are returned as-is.
 
     Args:
         response_data: The full response data
@@ -138,15 +187,17 @@ def _safe_log_response(response_data: dict[str, Any]) -> dict[str, Any]:
     Returns:
         Truncated version safe for logging
     """
-    log_data = {"dynamic_variables": response_data.get("dynamic_variables", {})}
+    override = response_data.get("conversation_config_override")
+    if override is None:
+        return response_data
 
-    if "conversation_config_override" in response_data:
-        override = response_data["conversation_config_override"]
-        if override.get("agent", {}).get("first_message"):
-            first_msg = override["agent"]["first_message"]
-            truncated = first_msg[:50] + "..." if len(first_msg) > 50 else first_msg
-            log_data["conversation_config_override"] = {
-                "agent": {"first_message": truncated}
-            }
+    log_data = {"dynamic_variables": response_data.get("dynamic_variables", {})}
+    first_msg = override.get("agent", {}).get("first_message")
+    if first_msg:
+        if len(first_msg) > _LOG_GREETING_CHARS:
+            first_msg = first_msg[:_LOG_GREETING_CHARS] + "..."
+        log_data["conversation_config_override"] = {
+            "agent": {"first_message": first_msg}
+        }
 
     return log_data
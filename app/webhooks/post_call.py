@@ -8,7 +8,8 @@ This module handles the POST /webhook/post-call endpoint:
   - post_call_transcription: Process and save transcription
   - post_call_audio: Decode base64 and save audio
   - call_initiation_failure: Save failure log
-- Implements payload storage with configurable directory
+- Implements payload storage with configurable directory (file I/O runs in
+  worker threads so it never blocks the event loop)
 - Implements memory processing for OpenMemory integration
 - TWO-TIER MEMORY ARCHITECTURE:
   - Tier 1: Updates universal user profile (name, interactions)
@@ -16,23 +17,41 @@ This module handles the POST /webhook/post-call endpoint:
 """
 
 import asyncio
-import base64
-import json
+import binascii
+import functools
 import logging
+from collections.abc import Awaitable, Callable
 from pathlib import Path
 from typing import Any
 
+import msgspec
+import orjson
+import pybase64
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status
 
 from app.config import settings
 from app.auth.hmac import verify_hmac_signature
-from app.models.requests import PostCallWebhookRequest
+from app.models.fast import (
+    AudioWebhook,
+    decode_audio_webhook,
+    extract_audio_base64,
+    decode_webhook_envelope,
+)
+from app.models.requests import (
+    POST_CALL_WEBHOOK_ADAPTER,
+    PostCallData,
+    PostCallFailureRequest,
+    PostCallWebhook,
+    PostCallWebhookRequest,
+)
 from app.memory.extraction import (
     extract_user_info,
     extract_user_messages,
-    create_profile_memories,
-    store_conversation_memories,
+    build_profile_memory_payloads,
+    build_conversation_memory_payloads,
+    store_memories_bulk,
 )
+from app.memory.caller_cache import get_caller_lookup_cache
 from app.memory.profiles import (
     get_universal_user_profile,
     store_universal_user_profile,
@@ -46,6 +65,14 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Base64 characters decoded per write in _save_audio; a multiple of 4 so each
+# chunk decodes independently (48 KiB of audio per chunk)
+AUDIO_DECODE_CHUNK_CHARS = 64 * 1024
+
+# Line breaks in MIME-wrapped base64 would shift the 4-character alignment
+# of the decode chunks, so they are removed before decoding
+_BASE64_LINE_BREAKS = str.maketrans("", "", "\r\n")
+
 
 def _get_storage_path(conversation_id: str) -> Path:
     """Get the storage directory path for a conversation.
@@ -56,8 +83,32 @@ def _get_storage_path(conversation_id: str) -> Path:
     Returns:
         Path object for the conversation's storage directory.
     """
-    base_path = Path(settings.PAYLOAD_STORAGE_PATH)
-    return base_path / conversation_id
+    return _storage_path(settings.PAYLOAD_STORAGE_PATH, conversation_id)
+
+
+@functools.lru_cache(maxsize=10_000)
+def _storage_path(base_path: str, conversation_id: str) -> Path:
+    """Build (and cache) a conversation's storage directory path.
+
+    Transcription, audio and failure payloads for one conversation arrive
+    as separate webhooks; caching reuses the same Path for each of them.
+
+    Args:
+        base_path: The configured payload storage directory.
+        conversation_id: The unique conversation identifier.
+
+    Returns:
+        Path object for the conversation's storage directory.
+    """
+    return Path(base_path) / conversation_id
+
+
+# Directories this process has already created, so later payloads for the
+# same conversation skip the mkdir syscall. A racing duplicate mkdir is
+# harmless (exist_ok=True), so no lock is needed. Payload directories are
+# never removed by the service; the set is reset once it reaches the bound.
+_KNOWN_DIRS: set[Path] = set()
+_KNOWN_DIRS_MAX_SIZE = 10_000
 
 
 def _ensure_directory_exists(dir_path: Path) -> None:
@@ -69,22 +120,29 @@ def _ensure_directory_exists(dir_path: Path) -> None:
     Raises:
         IOError: If directory creation fails.
     """
+    if dir_path in _KNOWN_DIRS:
+        return
     try:
         dir_path.mkdir(parents=True, exist_ok=True)
     except Exception as e:
         logger.error(f"Failed to create directory {dir_path}: {e}")
         raise IOError(f"Failed to create directory: {e}")
+    if len(_KNOWN_DIRS) >= _KNOWN_DIRS_MAX_SIZE:
+        _KNOWN_DIRS.clear()
+    _KNOWN_DIRS.add(dir_path)
 
 
 def _save_transcription(
     conversation_id: str,
-    payload: dict[str, Any]
+    body: bytes
 ) -> Path:
     """Save transcription payload to JSON file.
 
+    The raw request body is written as received; it is already JSON.
+
     Args:
         conversation_id: The unique conversation identifier.
-        payload: The full webhook payload as a dictionary.
+        body: The raw webhook request body.
 
     Returns:
         Path to the saved file.
@@ -98,8 +156,7 @@ def _save_transcription(
     file_path = storage_dir / f"{conversation_id}_transcription.json"
 
     try:
-        with open(file_path, "w") as f:
-            json.dump(payload, f, indent=2)
+        file_path.write_bytes(body)
         logger.info(f"Saved transcription to {file_path}")
         return file_path
     except Exception as e:
@@ -109,13 +166,18 @@ def _save_transcription(
 
 def _save_audio(
     conversation_id: str,
-    audio_base64: str
+    audio_base64: str | memoryview
 ) -> Path:
     """Decode base64 audio and save as MP3 file.
 
+    The audio is decoded (with pybase64's SIMD decoder) and written in
+    fixed-size chunks, so only one chunk of decoded bytes is held in memory
+    alongside the base64 data.
+
     Args:
         conversation_id: The unique conversation identifier.
-        audio_base64: Base64 encoded audio data.
+        audio_base64: Base64 encoded audio data, as a str or as a view of
+            the ASCII bytes in the request body.
 
     Returns:
         Path to the saved file.
@@ -129,13 +191,21 @@ def _save_audio(
 
     file_path = storage_dir / f"{conversation_id}_audio.mp3"
 
+    # A view into the JSON body cannot hold raw line breaks (JSON escapes them)
+    if isinstance(audio_base64, str) and "\n" in audio_base64:
+        audio_base64 = audio_base64.translate(_BASE64_LINE_BREAKS)
+
     try:
-        audio_bytes = base64.b64decode(audio_base64)
         with open(file_path, "wb") as f:
-            f.write(audio_bytes)
+            for start in range(0, len(audio_base64), AUDIO_DECODE_CHUNK_CHARS):
+                f.write(pybase64.b64decode(
+                    audio_base64[start:start + AUDIO_DECODE_CHUNK_CHARS]
+                ))
         logger.info(f"Saved audio to {file_path}")
         return file_path
-    except base64.binascii.Error as e:
+    except binascii.Error as e:
+        # Don't leave a truncated recording behind
+        file_path.unlink(missing_ok=True)
         logger.error(f"Failed to decode base64 audio: {e}")
         raise ValueError(f"Invalid base64 audio data: {e}")
     except Exception as e:
@@ -145,13 +215,15 @@ def _save_audio(
 
 def _save_failure(
     conversation_id: str,
-    payload: dict[str, Any]
+    body: bytes
 ) -> Path:
     """Save failure payload to JSON file.
 
+    The raw request body is written as received; it is already JSON.
+
     Args:
         conversation_id: The unique conversation identifier.
-        payload: The full webhook payload as a dictionary.
+        body: The raw webhook request body.
 
     Returns:
         Path to the saved file.
@@ -165,8 +237,7 @@ def _save_failure(
     file_path = storage_dir / f"{conversation_id}_failure.json"
 
     try:
-        with open(file_path, "w") as f:
-            json.dump(payload, f, indent=2)
+        file_path.write_bytes(body)
         logger.info(f"Saved failure log to {file_path}")
         return file_path
     except Exception as e:
@@ -174,6 +245,34 @@ def _save_failure(
         raise IOError(f"Failed to save failure log: {e}")
 
 
+def _save_error(
+    conversation_id: str,
+    error: str,
+    body: bytes
+) -> Path:
+    """Save a payload that failed processing, with its error, to JSON file.
+
+    Args:
+        conversation_id: The unique conversation identifier.
+        error: Description of the processing error.
+        body: The raw webhook request body.
+
+    Returns:
+        Path to the saved file.
+    """
+    storage_dir = _get_storage_path(conversation_id)
+    _ensure_directory_exists(storage_dir)
+
+    file_path = storage_dir / f"{conversation_id}_error.json"
+    with open(file_path, "wb") as f:
+        f.write(orjson.dumps({
+            "error": error,
+            "payload": orjson.loads(body)
+        }, option=orjson.OPT_INDENT_2))
+    logger.info(f"Saved error payload to {file_path}")
+    return file_path
+
+
 def _extract_caller_phone(request_data: PostCallWebhookRequest) -> str | None:
     """Extract caller phone number from webhook data.
 
@@ -363,80 +462,156 @@ async def _process_memories(request_data: PostCallWebhookRequest) -> None:
         user_info = extract_user_info(request_data.data.analysis.data_collection_results)
         logger.debug(f"Extracted user info: {user_info}")
 
-    # Store profile facts as memories
+    # Profile facts and user messages are written as one concurrent batch
+    payloads = []
     if user_info:
+        payloads.extend(
+            build_profile_memory_payloads(user_info, phone_number, conversation_context)
+        )
+    if request_data.data.transcript:
+        user_messages = extract_user_messages(request_data.data.transcript)
+        payloads.extend(
+            build_conversation_memory_payloads(user_messages, phone_number, conversation_context)
+        )
+
+    if payloads:
         try:
-            results = await create_profile_memories(user_info, phone_number, conversation_context)
-            logger.info(f"Stored {len(results)} profile memories for {phone_number}")
+            await store_memories_bulk(payloads, phone_number)
         except Exception as e:
-            logger.error(f"Failed to store profile memories: {e}")
+            logger.error(f"Failed to store memories: {e}")
+
+
+def _parse_webhook_request(body: bytes) -> PostCallWebhook:
+    """Parse a raw post-call payload into the request model matching its type.
+
+    Validation is dispatched on `type`, so audio and failure payloads only
+    validate their lean data models, and pydantic-core parses the bytes
+    directly without an intermediate dict. When TRUST_SIGNED_PAYLOAD is
+    enabled, transcription entries are validated by msgspec rather than
+    Pydantic (the payload has already passed HMAC verification); otherwise
+    the full model is validated by Pydantic.
+
+    Args:
+        body: The raw webhook request body.
+
+    Returns:
+        The parsed webhook request.
+    """
+    if settings.TRUST_SIGNED_PAYLOAD:
+        payload_dict = orjson.loads(body)
+        if payload_dict.get("type") == "post_call_transcription":
+            data = PostCallData.construct_trusted(payload_dict.get("data", {}))
+            return PostCallWebhookRequest.model_validate({**payload_dict, "data": data})
+        return POST_CALL_WEBHOOK_ADAPTER.validate_python(payload_dict)
+    return POST_CALL_WEBHOOK_ADAPTER.validate_json(body)
+
+
+async def _handle_transcription(
+    conversation_id: str,
+    body: bytes,
+    request_data: PostCallWebhookRequest
+) -> None:
+    """Save a transcription payload and process its memories.
+
+    Args:
+        conversation_id: The unique conversation identifier.
+        body: The raw webhook request body.
+        request_data: The parsed transcription webhook.
+    """
+    # Save transcription (file I/O runs off the event loop)
+    await asyncio.to_thread(_save_transcription, conversation_id, body)
+    # Process memories
+    await _process_memories(request_data)
+    # The next client-data call must see the memories just written
+    phone_number = _extract_caller_phone(request_data)
+    if phone_number:
+        get_caller_lookup_cache().invalidate_caller(
+            phone_number, request_data.data.agent_id
+        )
+    logger.info(f"Completed transcription processing for {conversation_id}")
+
+
+async def _handle_audio(
+    conversation_id: str,
+    body: bytes,
+    request_data: AudioWebhook
+) -> None:
+    """Decode and save the recording from an audio payload.
+
+    Args:
+        conversation_id: The unique conversation identifier.
+        body: The raw webhook request body.
+        request_data: The decoded audio webhook; its full_audio still
+            references `body`.
+    """
+    recording = extract_audio_base64(request_data.data.full_audio)
+    if recording:
+        await asyncio.to_thread(_save_audio, conversation_id, recording)
+        logger.info(f"Completed audio processing for {conversation_id}")
+    else:
+        logger.warning(f"No full_audio found in post_call_audio webhook for {conversation_id}")
+
+
+async def _handle_failure(
+    conversation_id: str,
+    body: bytes,
+    request_data: PostCallFailureRequest
+) -> None:
+    """Save a call initiation failure payload.
+
+    Args:
+        conversation_id: The unique conversation identifier.
+        body: The raw webhook request body.
+        request_data: The parsed failure webhook.
+    """
+    await asyncio.to_thread(_save_failure, conversation_id, body)
+    logger.info(f"Saved failure log for {conversation_id}")
 
-    # Extract and store user messages
-    if request_data.data.transcript:
-        user_messages = extract_user_messages(request_data.data.transcript)
-        if user_messages:
-            try:
-                results = await store_conversation_memories(user_messages, phone_number, conversation_context)
-                logger.info(f"Stored {len(results)} conversation memories for {phone_number}")
-            except Exception as e:
-                logger.error(f"Failed to store conversation memories: {e}")
 
+# Background handler for each post-call webhook type
+_WEBHOOK_HANDLERS: dict[str, Callable[[str, bytes, Any], Awaitable[None]]] = {
+    "post_call_transcription": _handle_transcription,
+    "post_call_audio": _handle_audio,
+    "call_initiation_failure": _handle_failure,
+}
 
-async def _process_webhook_payload(payload_dict: dict[str, Any]) -> None:
+
+async def _process_webhook_payload(body: bytes) -> None:
     """Process webhook payload in background.
 
     This function handles all webhook types asynchronously after
-    the immediate 200 response has been sent to ElevenLabs.
+    the immediate 200 response has been sent to ElevenLabs, dispatching
+    to the type's handler in _WEBHOOK_HANDLERS.
 
     Args:
-        payload_dict: The raw webhook payload as a dictionary.
+        body: The raw webhook request body.
     """
     try:
-        # Parse the request
-        request_data = PostCallWebhookRequest(**payload_dict)
+        # Parse the request. Audio payloads are decoded with msgspec so the
+        # multi-megabyte recording stays a view into `body` instead of being
+        # copied into a str.
+        if decode_webhook_envelope(body).type == "post_call_audio":
+            request_data = decode_audio_webhook(body)
+        else:
+            request_data = _parse_webhook_request(body)
         webhook_type = request_data.type
         conversation_id = request_data.data.conversation_id
 
         logger.info(f"Background processing webhook: type={webhook_type}, conversation_id={conversation_id}")
 
-        if webhook_type == "post_call_transcription":
-            # Save transcription
-            _save_transcription(conversation_id, payload_dict)
-            # Process memories
-            await _process_memories(request_data)
-            logger.info(f"Completed transcription processing for {conversation_id}")
-
-        elif webhook_type == "post_call_audio":
-            # Extract and save audio
-            audio_base64 = payload_dict.get("data", {}).get("full_audio")
-            if audio_base64:
-                _save_audio(conversation_id, audio_base64)
-                logger.info(f"Completed audio processing for {conversation_id}")
-            else:
-                logger.warning(f"No full_audio found in post_call_audio webhook for {conversation_id}")
-
-        elif webhook_type == "call_initiation_failure":
-            # Save failure log
-            _save_failure(conversation_id, payload_dict)
-            logger.info(f"Saved failure log for {conversation_id}")
-
-        else:
+        handler = _WEBHOOK_HANDLERS.get(webhook_type)
+        if handler is None:
             logger.warning(f"Unknown webhook type: {webhook_type}")
+            return
+
+        await handler(conversation_id, body, request_data)
 
     except Exception as e:
         logger.error(f"Error in background webhook processing: {e}", exc_info=True)
         # Save raw payload for debugging
         try:
-            conversation_id = payload_dict.get("data", {}).get("conversation_id", "unknown")
-            storage_dir = _get_storage_path(conversation_id)
-            _ensure_directory_exists(storage_dir)
-            error_file = storage_dir / f"{conversation_id}_error.json"
-            with open(error_file, "w") as f:
-                json.dump({
-                    "error": str(e),
-                    "payload": payload_dict
-                }, f, indent=2)
-            logger.info(f"Saved error payload to {error_file}")
+            conversation_id = decode_webhook_envelope(body).data.conversation_id
+            await asyncio.to_thread(_save_error, conversation_id, str(e), body)
         except Exception as save_error:
             logger.error(f"Failed to save error payload: {save_error}")
 
@@ -478,11 +653,12 @@ async def post_call_webhook(
     Returns:
         Immediate success response acknowledging webhook receipt
     """
-    # Parse JSON body - minimal validation here for fast response
+    # Decode only the routing fields for a fast response; the full payload is
+    # parsed and validated from the raw bytes in the background task
+    body = await request.body()
     try:
-        body = await request.body()
-        payload_dict = json.loads(body)
-    except json.JSONDecodeError as e:
+        envelope = decode_webhook_envelope(body)
+    except msgspec.DecodeError as e:
         logger.error(f"Failed to parse JSON payload: {e}")
         # Still return 200 but log the error - don't block ElevenLabs
         return {
@@ -490,14 +666,13 @@ async def post_call_webhook(
             "message": f"Invalid JSON payload: {e}"
         }
 
-    # Extract basic info for logging (without full Pydantic validation)
-    webhook_type = payload_dict.get("type", "unknown")
-    conversation_id = payload_dict.get("data", {}).get("conversation_id", "unknown")
+    webhook_type = envelope.type
+    conversation_id = envelope.data.conversation_id
 
     logger.info(f"Post-call webhook received: type={webhook_type}, conversation_id={conversation_id}")
 
     # Queue background processing - this runs after response is sent
-    background_tasks.add_task(_process_webhook_payload, payload_dict)
+    background_tasks.add_task(_process_webhook_payload, body)
 
     # Return immediately - processing continues in background
     return {
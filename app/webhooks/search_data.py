@@ -11,7 +11,8 @@ This module handles the POST /webhook/search-data endpoint:
 import logging
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import Response
 
 from app.config import settings
 from app.models.requests import SearchDataRequest
@@ -21,6 +22,7 @@ from app.models.responses import (
     MemoryItem,
 )
 from app.memory.extraction import search_memories
+from app.webhooks.dependencies import json_body, json_body_openapi
 
 logger = logging.getLogger(__name__)
 
@@ -35,8 +37,11 @@ router = APIRouter()
         "Webhook triggered when ElevenLabs agent invokes a server tool during "
         "conversation. Returns relevant memories and profile data for the caller."
     ),
+    openapi_extra=json_body_openapi(SearchDataRequest),
 )
-async def search_data_webhook(request: SearchDataRequest) -> SearchDataResponse:
+async def search_data_webhook(
+    request: SearchDataRequest = Depends(json_body(SearchDataRequest)),
+) -> Response:
     """Handle search-data webhook for memory retrieval.
 
     This endpoint:
@@ -48,7 +53,9 @@ async def search_data_webhook(request: SearchDataRequest) -> SearchDataResponse:
         request: SearchDataRequest with query, user_id, agent_id, etc.
 
     Returns:
-        SearchDataResponse with profile and memories array
+        SearchDataResponse with profile and memories array, serialized by
+        pydantic-core (model_dump_json) instead of FastAPI's jsonable_encoder
+        + json.dumps path
     """
     query = request.query
     phone_number = request.user_id
@@ -83,18 +90,32 @@ async def search_data_webhook(request: SearchDataRequest) -> SearchDataResponse:
             )
             memories.append(memory_item)
 
-        response = SearchDataResponse(
-            profile=profile,
-            memories=memories,
-        )
+        response = SearchDataResponse.build(profile=profile, memories=memories)
 
         logger.info(f"Returning {len(memories)} memories for user {phone_number}")
-        return response
+        return _json_response(response)
 
     except Exception as e:
         logger.error(f"Error processing search-data webhook: {e}")
         # Return empty response on error
-        return SearchDataResponse(
-            profile=None,
-            memories=[],
-        )
\ No newline at end of file
+        return _json_response(
+            SearchDataResponse.build(profile=None, memories=[])
+        )
+
+
+def _json_response(response: SearchDataResponse) -> Response:
+    """Serialize a SearchDataResponse straight to a JSON response.
+
+    Returning a Response bypasses FastAPI's response_model re-validation and
+    jsonable_encoder walk; datetimes are written as ISO 8601 by pydantic-core.
+
+    Args:
+        response: The response model to send.
+
+    Returns:
+        JSON Response containing the serialized model.
+    """
+    return Response(
+        content=response.model_dump_json(),
+        media_type="application/json",
+    )
\ No newline at end of file
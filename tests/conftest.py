@@ -80,13 +80,22 @@ def sample_greeting_data():
     }
 
 
+@pytest.fixture(autouse=True)
+def clear_caller_lookup_cache():
+    """Keep cached caller lookups from leaking between tests."""
+    from app.memory.caller_cache import get_caller_lookup_cache
+
+    get_caller_lookup_cache().clear()
+    yield
+    get_caller_lookup_cache().clear()
+
+
 @pytest.fixture
 def mock_httpx_client():
-    """Mock httpx AsyncClient for testing HTTP calls."""
-    with patch("httpx.AsyncClient") as mock_client:
-        mock_instance = AsyncMock()
-        mock_client.return_value.__aenter__.return_value = mock_instance
-        mock_client.return_value.__aexit__.return_value = None
+    """Mock the shared OpenMemory httpx client for testing HTTP calls."""
+    mock_instance = AsyncMock()
+    with patch("app.memory.profiles.get_openmemory_http_client", return_value=mock_instance), \
+         patch("app.memory.extraction.get_openmemory_http_client", return_value=mock_instance):
         yield mock_instance
 
 
@@ -1,10 +1,20 @@
 """Tests for agent profile caching service."""
 
+import asyncio
+import json
+import time
+
+import httpx
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, timedelta
 
-from app.services.agent_cache import AgentProfileCache, get_agent_profile_cache
+from app.services.agent_cache import (
+    AgentProfileCache,
+    _CacheEntry,
+    get_agent_profile_cache,
+    warm_up_elevenlabs_client,
+)
 
 
 class TestAgentProfileCache:
@@ -25,10 +35,9 @@ class TestAgentProfileCache:
         """Should return cached profile if not expired."""
         cache = AgentProfileCache()
 
-        # Manually add to cache with recent timestamp
-        from datetime import datetime
+        # Manually add to cache with a future expiry
         profile_with_recent_timestamp = {**sample_agent_profile, "cached_at": datetime.utcnow().isoformat()}
-        cache._cache["agent_test123"] = profile_with_recent_timestamp
+        cache._cache["agent_test123"] = _CacheEntry(time.monotonic() + 3600, profile_with_recent_timestamp)
 
         result = await cache.get_agent_profile("agent_test123")
         assert result == profile_with_recent_timestamp
@@ -40,7 +49,7 @@ class TestAgentProfileCache:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "name": "Test Assistant",
             "conversation_config": {
                 "agent": {
@@ -48,16 +57,15 @@ class TestAgentProfileCache:
                     "prompt": {"prompt": "You are helpful."}
                 }
             }
-        }
+        }).encode()
 
-        with patch("httpx.AsyncClient") as mock_client, \
+        with patch("app.services.agent_cache._get_client") as mock_get_client, \
              patch("app.services.agent_cache.settings") as mock_settings:
             mock_settings.ELEVENLABS_API_KEY = "test_key"
 
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_instance
-            mock_client.return_value.__aexit__.return_value = None
+            mock_get_client.return_value = mock_instance
 
             result = await cache.get_agent_profile("agent_new")
 
@@ -74,11 +82,14 @@ class TestAgentProfileCache:
 
         # Add expired entry
         expired_time = (datetime.utcnow() - timedelta(hours=2)).isoformat()
-        cache._cache["agent_test123"] = {**sample_agent_profile, "cached_at": expired_time}
+        cache._cache["agent_test123"] = _CacheEntry(
+            time.monotonic() - 1,
+            {**sample_agent_profile, "cached_at": expired_time},
+        )
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "name": "Updated Assistant",
             "conversation_config": {
                 "agent": {
@@ -86,22 +97,39 @@ class TestAgentProfileCache:
                     "prompt": {"prompt": "You are updated."}
                 }
             }
-        }
+        }).encode()
 
-        with patch("httpx.AsyncClient") as mock_client, \
+        with patch("app.services.agent_cache._get_client") as mock_get_client, \
              patch("app.services.agent_cache.settings") as mock_settings:
             mock_settings.ELEVENLABS_API_KEY = "test_key"
 
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_instance
-            mock_client.return_value.__aexit__.return_value = None
+            mock_get_client.return_value = mock_instance
 
             result = await cache.get_agent_profile("agent_test123")
 
             # Should have updated name from fresh fetch
             assert result["agent_name"] == "Updated Assistant"
 
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_fetch(self, sample_agent_profile):
+        """Should issue a single upstream fetch for concurrent cache misses."""
+        cache = AgentProfileCache()
+
+        async def slow_fetch(agent_id):
+            await asyncio.sleep(0.01)
+            return dict(sample_agent_profile)
+
+        with patch.object(cache, "_fetch_from_elevenlabs", side_effect=slow_fetch) as mock_fetch:
+            results = await asyncio.gather(
+                *(cache.get_agent_profile("agent_test123") for _ in range(5))
+            )
+
+        assert mock_fetch.call_count == 1
+        assert all(r is results[0] for r in results)
+        assert cache._inflight == {}
+
     @pytest.mark.asyncio
     async def test_api_404_returns_none(self):
         """Should return None for non-existent agent."""
@@ -110,19 +138,50 @@ class TestAgentProfileCache:
         mock_response = MagicMock()
         mock_response.status_code = 404
 
-        with patch("httpx.AsyncClient") as mock_client, \
+        with patch("app.services.agent_cache._get_client") as mock_get_client, \
              patch("app.services.agent_cache.settings") as mock_settings:
             mock_settings.ELEVENLABS_API_KEY = "test_key"
 
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_instance
-            mock_client.return_value.__aexit__.return_value = None
+            mock_get_client.return_value = mock_instance
 
             result = await cache.get_agent_profile("nonexistent_agent")
 
             assert result is None
 
+    @pytest.mark.asyncio
+    async def test_failed_fetch_is_negatively_cached(self):
+        """Should not refetch a failed agent until the negative TTL expires."""
+        cache = AgentProfileCache(negative_ttl_seconds=60)
+
+        with patch.object(cache, "_fetch_from_elevenlabs", new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.return_value = None
+
+            assert await cache.get_agent_profile("bad_agent") is None
+            assert await cache.get_agent_profile("bad_agent") is None
+            assert mock_fetch.await_count == 1
+
+            cache._cache["bad_agent"].expires_at = time.monotonic() - 1
+            assert await cache.get_agent_profile("bad_agent") is None
+            assert mock_fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used_beyond_max_size(self, sample_agent_profile):
+        """Should evict the least recently used entry when full."""
+        cache = AgentProfileCache(max_size=2)
+
+        async def fetch(agent_id):
+            return {**sample_agent_profile, "agent_id": agent_id}
+
+        with patch.object(cache, "_fetch_from_elevenlabs", side_effect=fetch):
+            await cache.get_agent_profile("agent_1")
+            await cache.get_agent_profile("agent_2")
+            await cache.get_agent_profile("agent_1")  # hit: agent_1 most recent
+            await cache.get_agent_profile("agent_3")
+
+        assert list(cache._cache) == ["agent_1", "agent_3"]
+
     def test_invalidate_removes_entry(self, sample_agent_profile):
         """Should remove specific entry from cache."""
         cache = AgentProfileCache()
@@ -148,14 +207,18 @@ class TestAgentProfileCache:
     def test_get_cache_stats(self, sample_agent_profile):
         """Should return cache statistics."""
         cache = AgentProfileCache()
-        cache._cache["agent_1"] = sample_agent_profile
-        cache._cache["agent_2"] = {"agent_id": "agent_2"}
+        expires_at = time.monotonic() + 3600
+        cache._cache["agent_1"] = _CacheEntry(expires_at, sample_agent_profile)
+        cache._cache["agent_2"] = _CacheEntry(expires_at, {"agent_id": "agent_2"})
+        cache._cache["agent_3"] = _CacheEntry(expires_at, None)
 
         stats = cache.get_cache_stats()
 
         assert stats["total_entries"] == 2
         assert "agent_1" in stats["agent_ids"]
         assert "agent_2" in stats["agent_ids"]
+        assert stats["negative_entries"] == 1
+        assert stats["negative_agent_ids"] == ["agent_3"]
 
 
 class TestGetAgentProfileCache:
@@ -181,3 +244,31 @@ class TestGetAgentProfileCache:
 
         assert cache is not None
         assert isinstance(cache, AgentProfileCache)
+
+
+class TestWarmUpElevenLabsClient:
+    """Tests for warm_up_elevenlabs_client function."""
+
+    @pytest.mark.asyncio
+    async def test_ignores_connection_errors(self):
+        """Should swallow HTTP errors during warm-up."""
+        with patch("app.services.agent_cache._get_client") as mock_get_client:
+            mock_instance = AsyncMock()
+            mock_instance.get.side_effect = httpx.ConnectError("unreachable")
+            mock_get_client.return_value = mock_instance
+
+            await warm_up_elevenlabs_client()
+
+            mock_instance.get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_ignores_invalid_url(self):
+        """Should swallow non-HTTP errors such as a malformed URL."""
+        with patch("app.services.agent_cache._get_client") as mock_get_client:
+            mock_instance = AsyncMock()
+            mock_instance.get.side_effect = httpx.InvalidURL("bad url")
+            mock_get_client.return_value = mock_instance
+
+            await warm_up_elevenlabs_client()
+
+            mock_instance.get.assert_awaited_once()
@@ -0,0 +1,108 @@
+"""Tests for the per-caller memory lookup cache."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.memory.caller_cache import CallerLookupCache
+
+
+class TestCallerLookupCache:
+    """Tests for CallerLookupCache class."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_lookup_served_from_cache(self, sample_user_profile):
+        """Should query OpenMemory once for repeated lookups."""
+        cache = CallerLookupCache()
+
+        with patch(
+            "app.memory.caller_cache.get_universal_user_profile",
+            new_callable=AsyncMock,
+            return_value=sample_user_profile,
+        ) as mock_get:
+            first = await cache.get_universal_profile("+16125551234")
+            second = await cache.get_universal_profile("+16125551234")
+
+        assert first == second == sample_user_profile
+        mock_get.assert_awaited_once_with("+16125551234", raise_errors=True)
+
+    @pytest.mark.asyncio
+    async def test_new_caller_is_not_cached(self):
+        """Should query again when the previous lookup found nothing."""
+        cache = CallerLookupCache()
+
+        with patch(
+            "app.memory.caller_cache.get_agent_conversation_state",
+            new_callable=AsyncMock,
+            return_value=None,
+        ) as mock_get:
+            await cache.get_agent_state("+16125551234", "agent_123")
+            await cache.get_agent_state("+16125551234", "agent_123")
+
+        assert mock_get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_lookup(self, sample_agent_state):
+        """Should coalesce concurrent misses for the same key."""
+        cache = CallerLookupCache()
+
+        async def slow_get(phone_number, agent_id, **kwargs):
+            await asyncio.sleep(0)
+            return sample_agent_state
+
+        with patch(
+            "app.memory.caller_cache.get_agent_conversation_state",
+            new_callable=AsyncMock,
+            side_effect=slow_get,
+        ) as mock_get:
+            results = await asyncio.gather(
+                cache.get_agent_state("+16125551234", "agent_123"),
+                cache.get_agent_state("+16125551234", "agent_123"),
+            )
+
+        assert results == [sample_agent_state, sample_agent_state]
+        mock_get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_invalidate_caller_forces_fresh_lookup(
+        self, sample_user_profile, sample_agent_state
+    ):
+        """Should drop the caller's profile and agent state entries."""
+        cache = CallerLookupCache()
+
+        with patch(
+            "app.memory.caller_cache.get_universal_user_profile",
+            new_callable=AsyncMock,
+            return_value=sample_user_profile,
+        ) as mock_profile, patch(
+            "app.memory.caller_cache.get_agent_conversation_state",
+            new_callable=AsyncMock,
+            return_value=sample_agent_state,
+        ) as mock_state:
+            await cache.get_universal_profile("+16125551234")
+            await cache.get_agent_state("+16125551234", "agent_123")
+            cache.invalidate_caller("+16125551234", "agent_123")
+            await cache.get_universal_profile("+16125551234")
+            await cache.get_agent_state("+16125551234", "agent_123")
+
+        assert mock_profile.await_count == 2
+        assert mock_state.await_count == 2
+
+    def test_new_caller_remembered_until_invalidated(self):
+        """Should remember new callers until their memories change."""
+        cache = CallerLookupCache()
+
+        assert not cache.is_new_caller("+16125551234")
+        cache.mark_new_caller("+16125551234")
+        assert cache.is_new_caller("+16125551234")
+
+        cache.invalidate_caller("+16125551234")
+        assert not cache.is_new_caller("+16125551234")
+
+    def test_new_caller_entry_expires(self):
+        """Should forget new callers after the new caller TTL."""
+        cache = CallerLookupCache(new_caller_ttl_seconds=0)
+        cache.mark_new_caller("+16125551234")
+
+        assert not cache.is_new_caller("+16125551234")
@@ -0,0 +1,55 @@
+"""Tests for the greeting result cache."""
+
+import time
+
+from app.services.greeting_cache import GreetingCache
+
+
+class TestGreetingCache:
+    """Tests for GreetingCache class."""
+
+    def test_make_key_is_stable_and_parameter_sensitive(self):
+        """Should produce the same key for the same request only."""
+        key = GreetingCache.make_key("gpt-4o-mini", "prompt", 0.0, 150)
+
+        assert key == GreetingCache.make_key("gpt-4o-mini", "prompt", 0.0, 150)
+        assert key != GreetingCache.make_key("gpt-4o-mini", "other prompt", 0.0, 150)
+        assert key != GreetingCache.make_key("gpt-4o", "prompt", 0.0, 150)
+
+    def test_returns_cached_result(self, sample_greeting_data):
+        """Should return a stored result before it expires."""
+        cache = GreetingCache()
+        cache.set("key", sample_greeting_data)
+
+        assert cache.get("key") == sample_greeting_data
+        assert cache.get("missing") is None
+
+    def test_mutating_a_hit_leaves_cache_unchanged(self, sample_greeting_data):
+        """Should return a copy that callers can mutate safely."""
+        cache = GreetingCache()
+        cache.set("key", sample_greeting_data)
+
+        hit = cache.get("key")
+        hit["next_greeting"] = "changed"
+        hit["key_topics"].append("changed")
+
+        assert cache.get("key") == sample_greeting_data
+
+    def test_expired_entry_is_a_miss(self, sample_greeting_data):
+        """Should drop entries past their TTL."""
+        cache = GreetingCache()
+        cache.set("key", sample_greeting_data)
+        cache._cache["key"] = (time.monotonic() - 1, cache._cache["key"][1])
+
+        assert cache.get("key") is None
+        assert "key" not in cache._cache
+
+    def test_evicts_least_recently_used_beyond_max_size(self, sample_greeting_data):
+        """Should evict the least recently used entry when full."""
+        cache = GreetingCache(max_size=2)
+        cache.set("a", sample_greeting_data)
+        cache.set("b", sample_greeting_data)
+        cache.get("a")  # hit: a most recent
+        cache.set("c", sample_greeting_data)
+
+        assert list(cache._cache) == ["a", "c"]
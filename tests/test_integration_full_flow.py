@@ -33,8 +33,8 @@ class TestFirstTimeCallerFlow:
         agent_id = "agent_test123"
 
         # --- Step 1: Client-data webhook (call initiation) ---
-        with patch("app.webhooks.client_data.get_universal_user_profile", new_callable=AsyncMock) as mock_get_universal, \
-             patch("app.webhooks.client_data.get_agent_conversation_state", new_callable=AsyncMock) as mock_get_agent:
+        with patch("app.memory.caller_cache.get_universal_user_profile", new_callable=AsyncMock) as mock_get_universal, \
+             patch("app.memory.caller_cache.get_agent_conversation_state", new_callable=AsyncMock) as mock_get_agent:
 
             # Simulate no existing data
             mock_get_universal.return_value = None
@@ -67,8 +67,7 @@ class TestFirstTimeCallerFlow:
              patch("app.webhooks.post_call.store_agent_conversation_state", new_callable=AsyncMock) as mock_store_state, \
              patch("app.webhooks.post_call.generate_next_greeting", new_callable=AsyncMock) as mock_generate, \
              patch("app.webhooks.post_call.get_agent_profile_cache") as mock_cache, \
-             patch("app.webhooks.post_call.create_profile_memories", new_callable=AsyncMock), \
-             patch("app.webhooks.post_call.store_conversation_memories", new_callable=AsyncMock):
+             patch("app.webhooks.post_call.store_memories_bulk", new_callable=AsyncMock):
 
             # First call returns None (new user), second call returns the created profile
             mock_get_profile.side_effect = [None, {"name": "Sarah", "phone_number": phone_number, "total_interactions": 1}]
@@ -126,8 +125,8 @@ class TestReturningCallerSameAgentFlow:
         agent_id = "agent_test123"
 
         # --- Step 1: Client-data webhook ---
-        with patch("app.webhooks.client_data.get_universal_user_profile", new_callable=AsyncMock) as mock_get_universal, \
-             patch("app.webhooks.client_data.get_agent_conversation_state", new_callable=AsyncMock) as mock_get_agent:
+        with patch("app.memory.caller_cache.get_universal_user_profile", new_callable=AsyncMock) as mock_get_universal, \
+             patch("app.memory.caller_cache.get_agent_conversation_state", new_callable=AsyncMock) as mock_get_agent:
 
             mock_get_universal.return_value = sample_user_profile
             mock_get_agent.return_value = sample_agent_state
@@ -163,8 +162,7 @@ class TestReturningCallerSameAgentFlow:
              patch("app.webhooks.post_call.store_agent_conversation_state", new_callable=AsyncMock) as mock_store_state, \
              patch("app.webhooks.post_call.generate_next_greeting", new_callable=AsyncMock) as mock_generate, \
              patch("app.webhooks.post_call.get_agent_profile_cache") as mock_cache, \
-             patch("app.webhooks.post_call.create_profile_memories", new_callable=AsyncMock), \
-             patch("app.webhooks.post_call.store_conversation_memories", new_callable=AsyncMock):
+             patch("app.webhooks.post_call.store_memories_bulk", new_callable=AsyncMock):
 
             # Existing profile with name
             mock_get_profile.return_value = sample_user_profile
@@ -225,8 +223,8 @@ class TestMultiAgentFlow:
         agent_b_id = "agent_sarah"
 
         # --- Call to Agent B (after having called Agent A) ---
-        with patch("app.webhooks.client_data.get_universal_user_profile", new_callable=AsyncMock) as mock_get_universal, \
-             patch("app.webhooks.client_data.get_agent_conversation_state", new_callable=AsyncMock) as mock_get_agent:
+        with patch("app.memory.caller_cache.get_universal_user_profile", new_callable=AsyncMock) as mock_get_universal, \
+             patch("app.memory.caller_cache.get_agent_conversation_state", new_callable=AsyncMock) as mock_get_agent:
 
             # Tier 1 exists (from Agent A call)
             mock_get_universal.return_value = sample_user_profile
@@ -286,8 +284,8 @@ class TestMultiAgentFlow:
         }
 
         # --- Test Agent A ---
-        with patch("app.webhooks.client_data.get_universal_user_profile", new_callable=AsyncMock) as mock_universal, \
-             patch("app.webhooks.client_data.get_agent_conversation_state", new_callable=AsyncMock) as mock_agent:
+        with patch("app.memory.caller_cache.get_universal_user_profile", new_callable=AsyncMock) as mock_universal, \
+             patch("app.memory.caller_cache.get_agent_conversation_state", new_callable=AsyncMock) as mock_agent:
 
             mock_universal.return_value = sample_user_profile
             mock_agent.return_value = agent_a_state
@@ -308,8 +306,8 @@ class TestMultiAgentFlow:
             assert "founding story" in data_a["conversation_config_override"]["agent"]["first_message"]
 
         # --- Test Agent B ---
-        with patch("app.webhooks.client_data.get_universal_user_profile", new_callable=AsyncMock) as mock_universal, \
-             patch("app.webhooks.client_data.get_agent_conversation_state", new_callable=AsyncMock) as mock_agent:
+        with patch("app.memory.caller_cache.get_universal_user_profile", new_callable=AsyncMock) as mock_universal, \
+             patch("app.memory.caller_cache.get_agent_conversation_state", new_callable=AsyncMock) as mock_agent:
 
             mock_universal.return_value = sample_user_profile
             mock_agent.return_value = agent_b_state
@@ -359,8 +357,7 @@ class TestErrorHandlingFlow:
              patch("app.webhooks.post_call.store_agent_conversation_state", new_callable=AsyncMock) as mock_store_state, \
              patch("app.webhooks.post_call.generate_next_greeting", new_callable=AsyncMock) as mock_generate, \
              patch("app.webhooks.post_call.get_agent_profile_cache") as mock_cache, \
-             patch("app.webhooks.post_call.create_profile_memories", new_callable=AsyncMock), \
-             patch("app.webhooks.post_call.store_conversation_memories", new_callable=AsyncMock):
+             patch("app.webhooks.post_call.store_memories_bulk", new_callable=AsyncMock):
 
             mock_get_profile.side_effect = [None, {"name": "Test", "phone_number": phone_number, "total_interactions": 1}]
             mock_store_profile.return_value = True
@@ -399,7 +396,7 @@ class TestErrorHandlingFlow:
         - No exception raised
         - Agent uses default greeting
         """
-        with patch("app.webhooks.client_data.get_universal_user_profile", new_callable=AsyncMock) as mock_universal:
+        with patch("app.memory.caller_cache.get_universal_user_profile", new_callable=AsyncMock) as mock_universal:
             mock_universal.side_effect = Exception("OpenMemory connection failed")
 
             from app.webhooks.client_data import client_data_webhook
@@ -446,8 +443,7 @@ class TestNameExtractionFlow:
              patch("app.webhooks.post_call.store_agent_conversation_state", new_callable=AsyncMock), \
              patch("app.webhooks.post_call.generate_next_greeting", new_callable=AsyncMock) as mock_generate, \
              patch("app.webhooks.post_call.get_agent_profile_cache") as mock_cache, \
-             patch("app.webhooks.post_call.create_profile_memories", new_callable=AsyncMock), \
-             patch("app.webhooks.post_call.store_conversation_memories", new_callable=AsyncMock):
+             patch("app.webhooks.post_call.store_memories_bulk", new_callable=AsyncMock):
 
             # New user - no profile
             mock_get_profile.side_effect = [None, {"name": "Sarah", "phone_number": phone_number, "total_interactions": 1}]
@@ -499,8 +495,7 @@ class TestNameExtractionFlow:
              patch("app.webhooks.post_call.store_agent_conversation_state", new_callable=AsyncMock), \
              patch("app.webhooks.post_call.generate_next_greeting", new_callable=AsyncMock) as mock_generate, \
              patch("app.webhooks.post_call.get_agent_profile_cache") as mock_cache, \
-             patch("app.webhooks.post_call.create_profile_memories", new_callable=AsyncMock), \
-             patch("app.webhooks.post_call.store_conversation_memories", new_callable=AsyncMock):
+             patch("app.webhooks.post_call.store_memories_bulk", new_callable=AsyncMock):
 
             # Existing profile with name "John"
             mock_get_profile.return_value = sample_user_profile
@@ -4,6 +4,7 @@ import json
 import logging
 import pytest
 from io import StringIO
+from unittest.mock import patch
 
 from app.utils.logging import (
     hash_phone_number,
@@ -101,6 +102,23 @@ class TestStructuredLogFormatter:
         data = json.loads(output)
         assert "timestamp" in data
 
+    def test_timestamp_is_record_time_in_utc(self):
+        """Should format the record creation time as ISO 8601 UTC."""
+        formatter = StructuredLogFormatter(include_timestamp=True)
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=1,
+            msg="Test",
+            args=(),
+            exc_info=None
+        )
+        record.created = 1705314600.25
+
+        data = json.loads(formatter.format(record))
+        assert data["timestamp"] == "2024-01-15T10:30:00.250000Z"
+
     def test_sanitizes_phone_numbers(self):
         """Should hash phone numbers in message."""
         formatter = StructuredLogFormatter()
@@ -287,3 +305,21 @@ class TestLogMemoryEvent:
 
         assert caplog.records[0].levelno == logging.ERROR
         assert "error=Connection timeout" in caplog.text
+
+    def test_skips_event_below_logger_level(self, caplog):
+        """Should not log or hash when the level is disabled."""
+        logger = logging.getLogger("test_memory_disabled")
+        logger.setLevel(logging.WARNING)
+
+        with caplog.at_level(logging.WARNING, logger="test_memory_disabled"), \
+             patch("app.utils.logging.hash_phone_number") as mock_hash:
+            log_memory_event(
+                logger=logger,
+                event_type="query",
+                phone_number="+16125551234",
+                tier=1,
+                success=True
+            )
+
+        assert caplog.records == []
+        mock_hash.assert_not_called()
@@ -9,8 +9,19 @@ from app.memory.profiles import (
     get_agent_conversation_state,
     store_agent_conversation_state,
     extract_name_from_transcript,
+    OpenMemoryLookupError,
 )
 
+OPENMEMORY_URL = "http://openmemory.test:8080"
+OPENMEMORY_HEADERS = {"Content-Type": "application/json", "Authorization": "Bearer test_key"}
+
+
+def _assert_openmemory_post(mock_post, endpoint):
+    """Assert the last OpenMemory POST used the configured URL and headers."""
+    call = mock_post.call_args
+    assert call.args[0] == f"{OPENMEMORY_URL}{endpoint}"
+    assert call.kwargs["headers"] == OPENMEMORY_HEADERS
+
 
 class TestExtractNameFromTranscript:
     """Tests for extract_name_from_transcript function."""
@@ -73,18 +84,16 @@ class TestGetUniversalUserProfile:
         mock_response.status_code = 200
         mock_response.json.return_value = {"matches": []}
 
-        with patch("httpx.AsyncClient") as mock_client, \
-             patch("app.memory.profiles.settings") as mock_settings:
-            mock_settings.openmemory_url = "http://localhost:8080"
-            mock_settings.OPENMEMORY_KEY = "test_key"
-
+        with patch("app.memory.profiles.get_openmemory_http_client") as mock_client, \
+             patch("app.memory.profiles._OPENMEMORY_URL", OPENMEMORY_URL), \
+             patch("app.memory.profiles._OPENMEMORY_HEADERS", OPENMEMORY_HEADERS):
             mock_instance = AsyncMock()
             mock_instance.post.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_instance
-            mock_client.return_value.__aexit__.return_value = None
+            mock_client.return_value = mock_instance
 
             result = await get_universal_user_profile("+16125551234")
 
+            _assert_openmemory_post(mock_instance.post, "/memory/query")
             assert result is None
 
     @pytest.mark.asyncio
@@ -100,18 +109,16 @@ class TestGetUniversalUserProfile:
             ]
         }
 
-        with patch("httpx.AsyncClient") as mock_client, \
-             patch("app.memory.profiles.settings") as mock_settings:
-            mock_settings.openmemory_url = "http://localhost:8080"
-            mock_settings.OPENMEMORY_KEY = "test_key"
-
+        with patch("app.memory.profiles.get_openmemory_http_client") as mock_client, \
+             patch("app.memory.profiles._OPENMEMORY_URL", OPENMEMORY_URL), \
+             patch("app.memory.profiles._OPENMEMORY_HEADERS", OPENMEMORY_HEADERS):
             mock_instance = AsyncMock()
             mock_instance.post.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_instance
-            mock_client.return_value.__aexit__.return_value = None
+            mock_client.return_value = mock_instance
 
             result = await get_universal_user_profile("+16125551234")
 
+            _assert_openmemory_post(mock_instance.post, "/memory/query")
             assert result is not None
             assert result["name"] == "John"
             assert result["total_interactions"] == 5
@@ -119,20 +126,32 @@ class TestGetUniversalUserProfile:
     @pytest.mark.asyncio
     async def test_handles_api_error(self):
         """Should return None on API error."""
-        with patch("httpx.AsyncClient") as mock_client, \
-             patch("app.memory.profiles.settings") as mock_settings:
-            mock_settings.openmemory_url = "http://localhost:8080"
-            mock_settings.OPENMEMORY_KEY = "test_key"
-
+        with patch("app.memory.profiles.get_openmemory_http_client") as mock_client, \
+             patch("app.memory.profiles._OPENMEMORY_URL", OPENMEMORY_URL), \
+             patch("app.memory.profiles._OPENMEMORY_HEADERS", OPENMEMORY_HEADERS):
             mock_instance = AsyncMock()
             mock_instance.post.side_effect = Exception("Connection failed")
-            mock_client.return_value.__aenter__.return_value = mock_instance
-            mock_client.return_value.__aexit__.return_value = None
+            mock_client.return_value = mock_instance
 
             result = await get_universal_user_profile("+16125551234")
 
+            _assert_openmemory_post(mock_instance.post, "/memory/query")
             assert result is None
 
+    @pytest.mark.asyncio
+    async def test_raises_on_api_error_when_requested(self):
+        """Should tell a failed query apart from a missing profile."""
+        mock_response = MagicMock()
+        mock_response.status_code = 503
+
+        with patch("app.memory.profiles.get_openmemory_http_client") as mock_client:
+            mock_instance = AsyncMock()
+            mock_instance.post.return_value = mock_response
+            mock_client.return_value = mock_instance
+
+            with pytest.raises(OpenMemoryLookupError):
+                await get_universal_user_profile("+16125551234", raise_errors=True)
+
 
 class TestStoreUniversalUserProfile:
     """Tests for store_universal_user_profile function."""
@@ -145,20 +164,19 @@ class TestStoreUniversalUserProfile:
         mock_response.json.return_value = {"id": "memory_123"}
 
         # Mock get_universal_user_profile to return None (new user)
-        with patch("httpx.AsyncClient") as mock_client, \
-             patch("app.memory.profiles.settings") as mock_settings, \
+        with patch("app.memory.profiles.get_openmemory_http_client") as mock_client, \
+             patch("app.memory.profiles._OPENMEMORY_URL", OPENMEMORY_URL), \
+             patch("app.memory.profiles._OPENMEMORY_HEADERS", OPENMEMORY_HEADERS), \
              patch("app.memory.profiles.get_universal_user_profile", new_callable=AsyncMock) as mock_get:
-            mock_settings.openmemory_url = "http://localhost:8080"
-            mock_settings.OPENMEMORY_KEY = "test_key"
             mock_get.return_value = None
 
             mock_instance = AsyncMock()
             mock_instance.post.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_instance
-            mock_client.return_value.__aexit__.return_value = None
+            mock_client.return_value = mock_instance
 
             result = await store_universal_user_profile("+16125551234", name="John")
 
+            _assert_openmemory_post(mock_instance.post, "/memory/add")
             assert result is True
             # Should have made POST calls for each field
             assert mock_instance.post.call_count >= 2
@@ -170,17 +188,15 @@ class TestStoreUniversalUserProfile:
         mock_response.status_code = 200
         mock_response.json.return_value = {"id": "memory_123"}
 
-        with patch("httpx.AsyncClient") as mock_client, \
-             patch("app.memory.profiles.settings") as mock_settings, \
+        with patch("app.memory.profiles.get_openmemory_http_client") as mock_client, \
+             patch("app.memory.profiles._OPENMEMORY_URL", OPENMEMORY_URL), \
+             patch("app.memory.profiles._OPENMEMORY_HEADERS", OPENMEMORY_HEADERS), \
              patch("app.memory.profiles.get_universal_user_profile", new_callable=AsyncMock) as mock_get:
-            mock_settings.openmemory_url = "http://localhost:8080"
-            mock_settings.OPENMEMORY_KEY = "test_key"
             mock_get.return_value = sample_user_profile
 
             mock_instance = AsyncMock()
             mock_instance.post.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_instance
-            mock_client.return_value.__aexit__.return_value = None
+            mock_client.return_value = mock_instance
 
             result = await store_universal_user_profile(
                 "+16125551234",
@@ -188,6 +204,7 @@ class TestStoreUniversalUserProfile:
                 increment_interactions=True
             )
 
+            _assert_openmemory_post(mock_instance.post, "/memory/add")
             assert result is True
 
 
@@ -201,18 +218,16 @@ class TestGetAgentConversationState:
         mock_response.status_code = 200
         mock_response.json.return_value = {"matches": []}
 
-        with patch("httpx.AsyncClient") as mock_client, \
-             patch("app.memory.profiles.settings") as mock_settings:
-            mock_settings.openmemory_url = "http://localhost:8080"
-            mock_settings.OPENMEMORY_KEY = "test_key"
-
+        with patch("app.memory.profiles.get_openmemory_http_client") as mock_client, \
+             patch("app.memory.profiles._OPENMEMORY_URL", OPENMEMORY_URL), \
+             patch("app.memory.profiles._OPENMEMORY_HEADERS", OPENMEMORY_HEADERS):
             mock_instance = AsyncMock()
             mock_instance.post.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_instance
-            mock_client.return_value.__aexit__.return_value = None
+            mock_client.return_value = mock_instance
 
             result = await get_agent_conversation_state("+16125551234", "agent_123")
 
+            _assert_openmemory_post(mock_instance.post, "/memory/query")
             assert result is None
 
     @pytest.mark.asyncio
@@ -235,18 +250,16 @@ class TestGetAgentConversationState:
             ]
         }
 
-        with patch("httpx.AsyncClient") as mock_client, \
-             patch("app.memory.profiles.settings") as mock_settings:
-            mock_settings.openmemory_url = "http://localhost:8080"
-            mock_settings.OPENMEMORY_KEY = "test_key"
-
+        with patch("app.memory.profiles.get_openmemory_http_client") as mock_client, \
+             patch("app.memory.profiles._OPENMEMORY_URL", OPENMEMORY_URL), \
+             patch("app.memory.profiles._OPENMEMORY_HEADERS", OPENMEMORY_HEADERS):
             mock_instance = AsyncMock()
             mock_instance.post.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_instance
-            mock_client.return_value.__aexit__.return_value = None
+            mock_client.return_value = mock_instance
 
             result = await get_agent_conversation_state("+16125551234", "agent_123")
 
+            _assert_openmemory_post(mock_instance.post, "/memory/query")
             assert result is not None
             assert result["next_greeting"] == sample_agent_state["next_greeting"]
             assert result["sentiment"] == "satisfied"
@@ -262,17 +275,15 @@ class TestStoreAgentConversationState:
         mock_response.status_code = 200
         mock_response.json.return_value = {"id": "memory_456"}
 
-        with patch("httpx.AsyncClient") as mock_client, \
-             patch("app.memory.profiles.settings") as mock_settings, \
+        with patch("app.memory.profiles.get_openmemory_http_client") as mock_client, \
+             patch("app.memory.profiles._OPENMEMORY_URL", OPENMEMORY_URL), \
+             patch("app.memory.profiles._OPENMEMORY_HEADERS", OPENMEMORY_HEADERS), \
              patch("app.memory.profiles.get_agent_conversation_state", new_callable=AsyncMock) as mock_get:
-            mock_settings.openmemory_url = "http://localhost:8080"
-            mock_settings.OPENMEMORY_KEY = "test_key"
             mock_get.return_value = None
 
             mock_instance = AsyncMock()
             mock_instance.post.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_instance
-            mock_client.return_value.__aexit__.return_value = None
+            mock_client.return_value = mock_instance
 
             result = await store_agent_conversation_state(
                 phone_number="+16125551234",
@@ -280,6 +291,7 @@ class TestStoreAgentConversationState:
                 greeting_data=sample_greeting_data
             )
 
+            _assert_openmemory_post(mock_instance.post, "/memory/add")
             assert result is True
             mock_instance.post.assert_called_once()
 
@@ -290,17 +302,15 @@ class TestStoreAgentConversationState:
         mock_response.status_code = 200
         mock_response.json.return_value = {"id": "memory_456"}
 
-        with patch("httpx.AsyncClient") as mock_client, \
-             patch("app.memory.profiles.settings") as mock_settings, \
+        with patch("app.memory.profiles.get_openmemory_http_client") as mock_client, \
+             patch("app.memory.profiles._OPENMEMORY_URL", OPENMEMORY_URL), \
+             patch("app.memory.profiles._OPENMEMORY_HEADERS", OPENMEMORY_HEADERS), \
              patch("app.memory.profiles.get_agent_conversation_state", new_callable=AsyncMock) as mock_get:
-            mock_settings.openmemory_url = "http://localhost:8080"
-            mock_settings.OPENMEMORY_KEY = "test_key"
             mock_get.return_value = sample_agent_state
 
             mock_instance = AsyncMock()
             mock_instance.post.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_instance
-            mock_client.return_value.__aexit__.return_value = None
+            mock_client.return_value = mock_instance
 
             result = await store_agent_conversation_state(
                 phone_number="+16125551234",
@@ -308,6 +318,7 @@ class TestStoreAgentConversationState:
                 greeting_data=sample_greeting_data
             )
 
+            _assert_openmemory_post(mock_instance.post, "/memory/add")
             assert result is True
             # Check that conversation_count was incremented
             call_args = mock_instance.post.call_args
@@ -0,0 +1,41 @@
+"""Tests for request model validation."""
+
+import pytest
+
+from app.models.requests import TranscriptEntry, validate_e164_phone_number
+
+
+class TestValidateE164PhoneNumber:
+    """Tests for validate_e164_phone_number function."""
+
+    def test_accepts_valid_number(self):
+        """Should return a valid E.164 number unchanged."""
+        assert validate_e164_phone_number("+16125551234") == "+16125551234"
+
+    @pytest.mark.parametrize("phone_number", ["+١٢٣٤٥", "+１２３４５"])
+    def test_rejects_non_ascii_digits(self, phone_number):
+        """Should reject Unicode digits that str.isdecimal() accepts."""
+        with pytest.raises(ValueError):
+            validate_e164_phone_number(phone_number)
+
+
+class TestTranscriptEntry:
+    """Tests for TranscriptEntry model."""
+
+    def test_dump_round_trips_wire_names(self):
+        """Should dump lazily validated fields under their wire names."""
+        raw = {
+            "role": "user",
+            "message": "Hi",
+            "time_in_call_secs": 3,
+            "conversation_turn_metrics": {"metrics": {"latency": 1}},
+            "agent_metadata": {"agent_id": "agent_123"},
+        }
+        entry = TranscriptEntry.model_validate(raw)
+
+        dumped = entry.model_dump()
+
+        assert dumped["conversation_turn_metrics"] == raw["conversation_turn_metrics"]
+        assert dumped["agent_metadata"] == raw["agent_metadata"]
+        assert "agent_metadata_raw" not in dumped
+        assert TranscriptEntry.model_validate(dumped) == entry
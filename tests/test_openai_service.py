@@ -1,14 +1,22 @@
 """Tests for OpenAI service greeting generation."""
 
 import json
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 
+from app.services.greeting_cache import GreetingCache
 from app.services.openai_service import (
+    MAX_TRANSCRIPT_TOKENS,
     generate_next_greeting,
     build_transcript_string,
     _build_greeting_prompt,
     _call_openai_api,
+    _parse_retry_after,
+    load_encoding,
 )
 
 
@@ -71,8 +79,8 @@ class TestBuildGreetingPrompt:
         assert "5" in prompt  # total_interactions
 
     def test_truncates_long_transcript(self, sample_agent_profile, sample_user_profile):
-        """Should truncate transcripts longer than 2000 chars."""
-        long_transcript = "A" * 3000
+        """Should truncate transcripts longer than the transcript budget."""
+        long_transcript = "word " * 1000
         prompt = _build_greeting_prompt(
             agent_profile=sample_agent_profile,
             user_profile=sample_user_profile,
@@ -80,6 +88,24 @@ class TestBuildGreetingPrompt:
         )
         assert "[...earlier conversation omitted...]" in prompt
 
+    def test_token_truncation_encodes_only_tail_window(self, sample_agent_profile, sample_user_profile):
+        """Should tokenize a bounded tail of long transcripts and keep the budget."""
+        encoding = MagicMock()
+        encoding.encode.side_effect = lambda text, **kwargs: [ord(c) for c in text]
+        encoding.decode.side_effect = lambda tokens: "".join(map(chr, tokens))
+        long_transcript = "a" * 10000 + "b" * MAX_TRANSCRIPT_TOKENS
+
+        with patch("app.services.openai_service._get_encoding", return_value=encoding):
+            prompt = _build_greeting_prompt(
+                agent_profile=sample_agent_profile,
+                user_profile=sample_user_profile,
+                transcript=long_transcript
+            )
+
+        encoded = encoding.encode.call_args.args[0]
+        assert len(encoded) < len(long_transcript)
+        assert f"[...earlier conversation omitted...]\n{'b' * MAX_TRANSCRIPT_TOKENS}\n" in prompt
+
     def test_handles_missing_user_name(self, sample_agent_profile, sample_transcript):
         """Should handle user profile without name."""
         user_profile = {"name": None, "phone_number": "+1234", "total_interactions": 1}
@@ -92,6 +118,27 @@ class TestBuildGreetingPrompt:
         assert "Name: None" in prompt or "Not yet known" in prompt
 
 
+class TestLoadEncoding:
+    """Tests for load_encoding function."""
+
+    @pytest.mark.asyncio
+    async def test_failed_load_is_remembered_until_retry(self):
+        """Should not reload right after a failure, and keep a successful load."""
+        encoding = MagicMock()
+        with patch("app.services.openai_service._encodings", {}), \
+             patch("app.services.openai_service._encoding_failures", {}) as failures, \
+             patch("app.services.openai_service._load_encoding", side_effect=[None, encoding]) as mock_load:
+            assert await load_encoding("gpt-test") is None
+            assert await load_encoding("gpt-test") is None
+            assert mock_load.call_count == 1
+
+            failures["gpt-test"] = 0.0  # retry window elapsed
+            assert await load_encoding("gpt-test") is encoding
+            assert await load_encoding("gpt-test") is encoding
+
+        assert mock_load.call_count == 2
+
+
 class TestGenerateNextGreeting:
     """Tests for generate_next_greeting function."""
 
@@ -107,21 +154,57 @@ class TestGenerateNextGreeting:
             )
             assert result is None
 
+    @pytest.mark.asyncio
+    async def test_skips_api_for_empty_transcript(self, sample_agent_profile, sample_user_profile):
+        """Should return a null greeting without calling OpenAI."""
+        with patch("app.services.openai_service.settings") as mock_settings, \
+             patch("app.services.openai_service._call_openai_api", new_callable=AsyncMock) as mock_call:
+            mock_settings.OPENAI_API_KEY = "test_key"
+
+            result = await generate_next_greeting(
+                agent_profile=sample_agent_profile,
+                user_profile=sample_user_profile,
+                transcript="  \n"
+            )
+
+            assert result["next_greeting"] is None
+            mock_call.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_calls_api_for_unnamed_first_time_caller(self, sample_agent_profile, sample_transcript, sample_greeting_data):
+        """Should still ask the model for topics and summary of an unnamed caller."""
+        user_profile = {"name": None, "phone_number": "+16125551234", "total_interactions": 1}
+
+        with patch("app.services.openai_service.settings") as mock_settings, \
+             patch("app.services.openai_service._call_openai_api", new_callable=AsyncMock) as mock_call:
+            mock_settings.OPENAI_API_KEY = "test_key"
+            mock_settings.OPENAI_TEMPERATURE = 0.7
+            mock_call.return_value = sample_greeting_data
+
+            result = await generate_next_greeting(
+                agent_profile=sample_agent_profile,
+                user_profile=user_profile,
+                transcript=sample_transcript
+            )
+
+            assert result == sample_greeting_data
+            mock_call.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_successful_greeting_generation(self, sample_agent_profile, sample_user_profile, sample_transcript, sample_greeting_data):
         """Should return greeting data on successful API call."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "choices": [{
                 "message": {
                     "content": json.dumps(sample_greeting_data)
                 }
             }]
-        }
+        }).encode()
 
         with patch("app.services.openai_service.settings") as mock_settings, \
-             patch("httpx.AsyncClient") as mock_client:
+             patch("app.services.openai_service._get_client") as mock_get_client:
             mock_settings.OPENAI_API_KEY = "test_key"
             mock_settings.OPENAI_MODEL = "gpt-4o-mini"
             mock_settings.OPENAI_MAX_TOKENS = 150
@@ -129,8 +212,7 @@ class TestGenerateNextGreeting:
 
             mock_instance = AsyncMock()
             mock_instance.post.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_instance
-            mock_client.return_value.__aexit__.return_value = None
+            mock_get_client.return_value = mock_instance
 
             result = await generate_next_greeting(
                 agent_profile=sample_agent_profile,
@@ -143,12 +225,84 @@ class TestGenerateNextGreeting:
             assert "key_topics" in result
             assert "sentiment" in result
 
+    @pytest.mark.asyncio
+    async def test_deterministic_requests_use_greeting_cache(self, sample_agent_profile, sample_user_profile, sample_transcript, sample_greeting_data):
+        """Should serve a repeated temperature-0 request from the cache."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({
+            "choices": [{
+                "message": {
+                    "content": json.dumps(sample_greeting_data)
+                }
+            }]
+        }).encode()
+
+        with patch("app.services.openai_service.settings") as mock_settings, \
+             patch("app.services.openai_service._get_client") as mock_get_client, \
+             patch("app.services.openai_service.get_greeting_cache", return_value=GreetingCache()):
+            mock_settings.OPENAI_API_KEY = "test_key"
+            mock_settings.OPENAI_MODEL = "gpt-4o-mini"
+            mock_settings.OPENAI_MAX_TOKENS = 150
+            mock_settings.OPENAI_TEMPERATURE = 0.0
+
+            mock_instance = AsyncMock()
+            mock_instance.post.return_value = mock_response
+            mock_get_client.return_value = mock_instance
+
+            for _ in range(2):
+                result = await generate_next_greeting(
+                    agent_profile=sample_agent_profile,
+                    user_profile=sample_user_profile,
+                    transcript=sample_transcript
+                )
+                assert result["next_greeting"] == sample_greeting_data["next_greeting"]
+
+            assert mock_instance.post.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_fills_defaults_for_missing_fields(self, sample_agent_profile, sample_user_profile, sample_transcript):
+        """Should default fields the model omitted."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({
+            "choices": [{
+                "message": {
+                    "content": json.dumps({"next_greeting": "Hi John!"})
+                }
+            }]
+        }).encode()
+
+        with patch("app.services.openai_service.settings") as mock_settings, \
+             patch("app.services.openai_service._get_client") as mock_get_client:
+            mock_settings.OPENAI_API_KEY = "test_key"
+            mock_settings.OPENAI_MODEL = "gpt-4o-mini"
+            mock_settings.OPENAI_MAX_TOKENS = 150
+            mock_settings.OPENAI_TEMPERATURE = 0.7
+
+            mock_instance = AsyncMock()
+            mock_instance.post.return_value = mock_response
+            mock_get_client.return_value = mock_instance
+
+            result = await generate_next_greeting(
+                agent_profile=sample_agent_profile,
+                user_profile=sample_user_profile,
+                transcript=sample_transcript
+            )
+
+            assert result == {
+                "next_greeting": "Hi John!",
+                "key_topics": [],
+                "sentiment": "neutral",
+                "conversation_summary": "",
+            }
+
     @pytest.mark.asyncio
     async def test_handles_api_error_with_retry(self, sample_agent_profile, sample_user_profile, sample_transcript):
-        """Should retry on API error."""
+        """Should retry on transport errors."""
         with patch("app.services.openai_service.settings") as mock_settings, \
-             patch("httpx.AsyncClient") as mock_client, \
-             patch("asyncio.sleep", new_callable=AsyncMock):
+             patch("app.services.openai_service._get_client") as mock_get_client, \
+             patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
 
             mock_settings.OPENAI_API_KEY = "test_key"
             mock_settings.OPENAI_MODEL = "gpt-4o-mini"
@@ -156,9 +310,8 @@ class TestGenerateNextGreeting:
             mock_settings.OPENAI_TEMPERATURE = 0.7
 
             mock_instance = AsyncMock()
-            mock_instance.post.side_effect = Exception("API Error")
-            mock_client.return_value.__aenter__.return_value = mock_instance
-            mock_client.return_value.__aexit__.return_value = None
+            mock_instance.post.side_effect = httpx.ConnectError("API Error")
+            mock_get_client.return_value = mock_instance
 
             result = await generate_next_greeting(
                 agent_profile=sample_agent_profile,
@@ -170,22 +323,111 @@ class TestGenerateNextGreeting:
             assert result is None
             # Should have attempted 3 times
             assert mock_instance.post.call_count == 3
+            # No backoff after the final attempt
+            assert mock_sleep.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_does_not_retry_client_error(self, sample_agent_profile, sample_user_profile, sample_transcript):
+        """Should give up immediately on a non-retryable 4xx response."""
+        mock_response = MagicMock()
+        mock_response.status_code = 400
+        mock_response.text = "Bad Request"
+
+        with patch("app.services.openai_service.settings") as mock_settings, \
+             patch("app.services.openai_service._get_client") as mock_get_client, \
+             patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            mock_settings.OPENAI_API_KEY = "test_key"
+            mock_settings.OPENAI_MODEL = "gpt-4o-mini"
+            mock_settings.OPENAI_MAX_TOKENS = 150
+            mock_settings.OPENAI_TEMPERATURE = 0.7
+
+            mock_instance = AsyncMock()
+            mock_instance.post.return_value = mock_response
+            mock_get_client.return_value = mock_instance
+
+            result = await generate_next_greeting(
+                agent_profile=sample_agent_profile,
+                user_profile=sample_user_profile,
+                transcript=sample_transcript
+            )
+
+            assert result is None
+            assert mock_instance.post.call_count == 1
+            mock_sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_honors_retry_after(self, sample_agent_profile, sample_user_profile, sample_transcript):
+        """Should wait at least the Retry-After delay on a 429."""
+        mock_response = MagicMock()
+        mock_response.status_code = 429
+        mock_response.headers = {"retry-after": "7"}
+
+        with patch("app.services.openai_service.settings") as mock_settings, \
+             patch("app.services.openai_service._get_client") as mock_get_client, \
+             patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            mock_settings.OPENAI_API_KEY = "test_key"
+            mock_settings.OPENAI_MODEL = "gpt-4o-mini"
+            mock_settings.OPENAI_MAX_TOKENS = 150
+            mock_settings.OPENAI_TEMPERATURE = 0.7
+
+            mock_instance = AsyncMock()
+            mock_instance.post.return_value = mock_response
+            mock_get_client.return_value = mock_instance
+
+            result = await generate_next_greeting(
+                agent_profile=sample_agent_profile,
+                user_profile=sample_user_profile,
+                transcript=sample_transcript
+            )
+
+            assert result is None
+            assert mock_instance.post.call_count == 3
+            assert all(call.args[0] >= 7 for call in mock_sleep.call_args_list)
+
+    @pytest.mark.asyncio
+    async def test_stops_when_retry_after_exceeds_limit(self, sample_agent_profile, sample_user_profile, sample_transcript):
+        """Should give up instead of sleeping for an excessive Retry-After."""
+        mock_response = MagicMock()
+        mock_response.status_code = 429
+        mock_response.headers = {"retry-after": "3600"}
+
+        with patch("app.services.openai_service.settings") as mock_settings, \
+             patch("app.services.openai_service._get_client") as mock_get_client, \
+             patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            mock_settings.OPENAI_API_KEY = "test_key"
+            mock_settings.OPENAI_MODEL = "gpt-4o-mini"
+            mock_settings.OPENAI_MAX_TOKENS = 150
+            mock_settings.OPENAI_TEMPERATURE = 0.7
+
+            mock_instance = AsyncMock()
+            mock_instance.post.return_value = mock_response
+            mock_get_client.return_value = mock_instance
+
+            result = await generate_next_greeting(
+                agent_profile=sample_agent_profile,
+                user_profile=sample_user_profile,
+                transcript=sample_transcript
+            )
+
+            assert result is None
+            assert mock_instance.post.call_count == 1
+            mock_sleep.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_handles_invalid_json_response(self, sample_agent_profile, sample_user_profile, sample_transcript):
         """Should handle invalid JSON in API response."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "choices": [{
                 "message": {
                     "content": "Not valid JSON"
                 }
             }]
-        }
+        }).encode()
 
         with patch("app.services.openai_service.settings") as mock_settings, \
-             patch("httpx.AsyncClient") as mock_client:
+             patch("app.services.openai_service._get_client") as mock_get_client:
             mock_settings.OPENAI_API_KEY = "test_key"
             mock_settings.OPENAI_MODEL = "gpt-4o-mini"
             mock_settings.OPENAI_MAX_TOKENS = 150
@@ -193,8 +435,7 @@ class TestGenerateNextGreeting:
 
             mock_instance = AsyncMock()
             mock_instance.post.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_instance
-            mock_client.return_value.__aexit__.return_value = None
+            mock_get_client.return_value = mock_instance
 
             result = await generate_next_greeting(
                 agent_profile=sample_agent_profile,
@@ -204,3 +445,21 @@ class TestGenerateNextGreeting:
 
             # Should return None for invalid JSON
             assert result is None
+
+
+class TestParseRetryAfter:
+    """Tests for _parse_retry_after function."""
+
+    def test_parses_seconds(self):
+        """Should parse delta-seconds values."""
+        assert _parse_retry_after("2.5") == 2.5
+
+    def test_parses_http_date(self):
+        """Should convert an HTTP date into seconds from now."""
+        future = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+        assert 25 <= _parse_retry_after(future) <= 30
+
+    def test_returns_none_for_missing_or_invalid(self):
+        """Should return None when absent or unparseable."""
+        assert _parse_retry_after(None) is None
+        assert _parse_retry_after("soon") is None
@@ -1,5 +1,7 @@
 """Tests for webhook handlers."""
 
+import json
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from fastapi.testclient import TestClient
@@ -11,8 +13,8 @@ class TestClientDataWebhook:
     @pytest.mark.asyncio
     async def test_returns_greeting_for_returning_caller(self, sample_user_profile, sample_agent_state):
         """Should return personalized greeting for returning caller."""
-        with patch("app.webhooks.client_data.get_universal_user_profile", new_callable=AsyncMock) as mock_universal, \
-             patch("app.webhooks.client_data.get_agent_conversation_state", new_callable=AsyncMock) as mock_agent:
+        with patch("app.memory.caller_cache.get_universal_user_profile", new_callable=AsyncMock) as mock_universal, \
+             patch("app.memory.caller_cache.get_agent_conversation_state", new_callable=AsyncMock) as mock_agent:
             mock_universal.return_value = sample_user_profile
             mock_agent.return_value = sample_agent_state
 
@@ -37,13 +39,18 @@ class TestClientDataWebhook:
 
             assert "conversation_config_override" in data
             assert data["conversation_config_override"]["agent"]["first_message"] == sample_agent_state["next_greeting"]
-            assert data["dynamic_variables"]["user_name"] == sample_user_profile["name"]
+            assert data["dynamic_variables"] == {
+                "user_name": sample_user_profile["name"],
+                "last_call_summary": sample_agent_state["conversation_summary"],
+                "user_sentiment": sample_agent_state["sentiment"],
+                "key_topics": "account settings, password reset, notifications",
+            }
 
     @pytest.mark.asyncio
     async def test_returns_name_only_for_first_call_to_agent(self, sample_user_profile):
         """Should return name in dynamic_variables for first call to this agent."""
-        with patch("app.webhooks.client_data.get_universal_user_profile", new_callable=AsyncMock) as mock_universal, \
-             patch("app.webhooks.client_data.get_agent_conversation_state", new_callable=AsyncMock) as mock_agent:
+        with patch("app.memory.caller_cache.get_universal_user_profile", new_callable=AsyncMock) as mock_universal, \
+             patch("app.memory.caller_cache.get_agent_conversation_state", new_callable=AsyncMock) as mock_agent:
             mock_universal.return_value = sample_user_profile
             mock_agent.return_value = None  # No previous interaction with this agent
 
@@ -68,8 +75,8 @@ class TestClientDataWebhook:
     @pytest.mark.asyncio
     async def test_returns_empty_for_new_caller(self):
         """Should return empty response for new caller."""
-        with patch("app.webhooks.client_data.get_universal_user_profile", new_callable=AsyncMock) as mock_universal, \
-             patch("app.webhooks.client_data.get_agent_conversation_state", new_callable=AsyncMock) as mock_agent:
+        with patch("app.memory.caller_cache.get_universal_user_profile", new_callable=AsyncMock) as mock_universal, \
+             patch("app.memory.caller_cache.get_agent_conversation_state", new_callable=AsyncMock) as mock_agent:
             mock_universal.return_value = None
             mock_agent.return_value = None
 
@@ -91,11 +98,18 @@ class TestClientDataWebhook:
             assert "conversation_config_override" not in data
             assert data["dynamic_variables"] == {}
 
+            # A repeat call from the same new caller skips both lookups
+            await client_data_webhook(request, _=None)
+            mock_universal.assert_awaited_once()
+            mock_agent.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_handles_error_gracefully(self):
         """Should return empty response on error."""
-        with patch("app.webhooks.client_data.get_universal_user_profile", new_callable=AsyncMock) as mock_universal:
+        with patch("app.memory.caller_cache.get_universal_user_profile", new_callable=AsyncMock) as mock_universal, \
+             patch("app.memory.caller_cache.get_agent_conversation_state", new_callable=AsyncMock) as mock_agent:
             mock_universal.side_effect = Exception("Database connection failed")
+            mock_agent.return_value = None
 
             from app.webhooks.client_data import client_data_webhook
             from app.models.requests import ClientDataRequest
@@ -115,6 +129,48 @@ class TestClientDataWebhook:
             # Should return empty but valid response
             assert data == {"dynamic_variables": {}}
 
+            # A failed lookup must not mark the caller as new
+            await client_data_webhook(request, _=None)
+            assert mock_universal.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_uses_agent_state_when_profile_lookup_fails(self, sample_agent_state):
+        """Should still return the greeting if only the profile lookup fails."""
+        with patch("app.memory.caller_cache.get_universal_user_profile", new_callable=AsyncMock) as mock_universal, \
+             patch("app.memory.caller_cache.get_agent_conversation_state", new_callable=AsyncMock) as mock_agent:
+            mock_universal.side_effect = Exception("Database connection failed")
+            mock_agent.return_value = sample_agent_state
+
+            from app.webhooks.client_data import client_data_webhook
+            from app.models.requests import ClientDataRequest
+
+            request = ClientDataRequest(
+                caller_id="+16125551234",
+                agent_id="agent_test123",
+                called_number="+16125559999",
+                call_sid="CA123456789"
+            )
+
+            response = await client_data_webhook(request, _=None)
+
+            data = json.loads(response.body.decode())
+
+            assert data["conversation_config_override"]["agent"]["first_message"] == sample_agent_state["next_greeting"]
+            assert "user_name" not in data["dynamic_variables"]
+
+    def test_safe_log_response_truncates_greeting(self):
+        """Should truncate long greetings and pass other responses through."""
+        from app.webhooks.client_data import _safe_log_response
+
+        plain = {"dynamic_variables": {"user_name": "Stefan"}}
+        assert _safe_log_response(plain) is plain
+
+        logged = _safe_log_response({
+            "dynamic_variables": {},
+            "conversation_config_override": {"agent": {"first_message": "x" * 80}},
+        })
+        assert logged["conversation_config_override"]["agent"]["first_message"] == "x" * 50 + "..."
+
 
 class TestPostCallWebhook:
     """Tests for post-call webhook handler processing."""
@@ -127,14 +183,12 @@ class TestPostCallWebhook:
              patch("app.webhooks.post_call.store_agent_conversation_state", new_callable=AsyncMock) as mock_store_state, \
              patch("app.webhooks.post_call.generate_next_greeting", new_callable=AsyncMock) as mock_generate, \
              patch("app.webhooks.post_call.get_agent_profile_cache") as mock_cache, \
-             patch("app.webhooks.post_call.create_profile_memories", new_callable=AsyncMock) as mock_create_memories, \
-             patch("app.webhooks.post_call.store_conversation_memories", new_callable=AsyncMock) as mock_store_memories:
+             patch("app.webhooks.post_call.store_memories_bulk", new_callable=AsyncMock) as mock_store_memories:
 
             mock_get_profile.return_value = {"name": None, "phone_number": "+16125551234", "total_interactions": 0}
             mock_store_profile.return_value = True
             mock_store_state.return_value = True
             mock_generate.return_value = sample_greeting_data
-            mock_create_memories.return_value = []
             mock_store_memories.return_value = []
 
             cache_instance = MagicMock()
@@ -170,8 +224,7 @@ class TestPostCallWebhook:
              patch("app.webhooks.post_call.store_agent_conversation_state", new_callable=AsyncMock), \
              patch("app.webhooks.post_call.generate_next_greeting", new_callable=AsyncMock) as mock_generate, \
              patch("app.webhooks.post_call.get_agent_profile_cache") as mock_cache, \
-             patch("app.webhooks.post_call.create_profile_memories", new_callable=AsyncMock), \
-             patch("app.webhooks.post_call.store_conversation_memories", new_callable=AsyncMock):
+             patch("app.webhooks.post_call.store_memories_bulk", new_callable=AsyncMock):
 
             mock_get_profile.return_value = None  # New user
             mock_store_profile.return_value = True
@@ -207,14 +260,12 @@ class TestPostCallWebhook:
              patch("app.webhooks.post_call.store_agent_conversation_state", new_callable=AsyncMock), \
              patch("app.webhooks.post_call.generate_next_greeting", new_callable=AsyncMock) as mock_generate, \
              patch("app.webhooks.post_call.get_agent_profile_cache") as mock_cache, \
-             patch("app.webhooks.post_call.create_profile_memories", new_callable=AsyncMock) as mock_create_memories, \
-             patch("app.webhooks.post_call.store_conversation_memories", new_callable=AsyncMock) as mock_store_memories:
+             patch("app.webhooks.post_call.store_memories_bulk", new_callable=AsyncMock) as mock_store_memories:
 
             mock_get_profile.return_value = {"name": "Sarah", "phone_number": "+16125551234", "total_interactions": 1}
             mock_store_profile.return_value = True
             mock_generate.return_value = None  # Greeting generation failed
-            mock_create_memories.return_value = [{"id": "mem_1"}]
-            mock_store_memories.return_value = [{"id": "mem_2"}]
+            mock_store_memories.return_value = [{"id": "mem_1"}, {"id": "mem_2"}]
 
             cache_instance = MagicMock()
             cache_instance.get_agent_profile = AsyncMock(return_value={
@@ -233,9 +284,11 @@ class TestPostCallWebhook:
             # Should not raise exception
             await _process_memories(request)
 
-            # Should still process legacy memories
-            mock_create_memories.assert_called_once()
+            # Should still process legacy memories, profile facts and user
+            # messages in a single batch
             mock_store_memories.assert_called_once()
+            payloads = mock_store_memories.call_args.args[0]
+            assert {p["tags"][0] for p in payloads} == {"profile", "conversation"}
 
     @pytest.mark.asyncio
     async def test_skips_processing_without_phone_number(self, sample_post_call_payload):
@@ -254,3 +307,149 @@ class TestPostCallWebhook:
 
             # Should not try to get profile
             mock_get_profile.assert_not_called()
+
+    def test_trusted_parse_matches_validated_parse(self, sample_post_call_payload):
+        """Should build the same pydantic transcript entries as full validation."""
+        import warnings
+
+        from app.models.requests import TranscriptEntry
+
+        body = json.dumps(sample_post_call_payload).encode()
+        with patch("app.webhooks.post_call.settings") as mock_settings:
+            from app.webhooks.post_call import _parse_webhook_request
+
+            mock_settings.TRUST_SIGNED_PAYLOAD = True
+            trusted = _parse_webhook_request(body)
+            mock_settings.TRUST_SIGNED_PAYLOAD = False
+            validated = _parse_webhook_request(body)
+
+        assert all(isinstance(entry, TranscriptEntry) for entry in trusted.data.transcript)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert trusted.data.model_dump() == validated.data.model_dump()
+
+    @pytest.mark.asyncio
+    async def test_processes_trusted_payload(self, sample_post_call_payload, sample_greeting_data):
+        """Should process memories from a payload parsed on the trusted path."""
+        with patch("app.webhooks.post_call.settings") as mock_settings, \
+             patch("app.webhooks.post_call.get_universal_user_profile", new_callable=AsyncMock) as mock_get_profile, \
+             patch("app.webhooks.post_call.store_universal_user_profile", new_callable=AsyncMock), \
+             patch("app.webhooks.post_call.store_agent_conversation_state", new_callable=AsyncMock) as mock_store_state, \
+             patch("app.webhooks.post_call.generate_next_greeting", new_callable=AsyncMock) as mock_generate, \
+             patch("app.webhooks.post_call.get_agent_profile_cache") as mock_cache, \
+             patch("app.webhooks.post_call.store_memories_bulk", new_callable=AsyncMock) as mock_store_memories:
+            mock_settings.TRUST_SIGNED_PAYLOAD = True
+            mock_get_profile.return_value = None
+            mock_generate.return_value = sample_greeting_data
+            mock_store_memories.return_value = []
+            cache_instance = MagicMock()
+            cache_instance.get_agent_profile = AsyncMock(return_value={"agent_id": "agent_test123"})
+            mock_cache.return_value = cache_instance
+
+            from app.webhooks.post_call import _parse_webhook_request, _process_memories
+
+            request = _parse_webhook_request(json.dumps(sample_post_call_payload).encode())
+            await _process_memories(request)
+
+            assert "Sarah" in mock_generate.call_args.kwargs["transcript"]
+            mock_store_state.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_saves_failure_payload(self, tmp_path):
+        """Should save call initiation failure payloads to storage."""
+        payload = {
+            "type": "call_initiation_failure",
+            "event_timestamp": 1705315800,
+            "data": {
+                "agent_id": "agent_test123",
+                "conversation_id": "conv_failed",
+                "failure_reason": "busy",
+            },
+        }
+
+        with patch("app.webhooks.post_call.settings") as mock_settings:
+            mock_settings.PAYLOAD_STORAGE_PATH = str(tmp_path)
+            mock_settings.TRUST_SIGNED_PAYLOAD = False
+            from app.webhooks.post_call import _process_webhook_payload
+
+            await _process_webhook_payload(json.dumps(payload).encode())
+
+        saved = tmp_path / "conv_failed" / "conv_failed_failure.json"
+        assert saved.exists()
+        assert json.loads(saved.read_text())["data"]["failure_reason"] == "busy"
+
+    @pytest.mark.asyncio
+    async def test_saves_audio_payload_from_raw_body(self, tmp_path):
+        """Should decode full_audio straight from the body, escaped or not."""
+        import base64
+
+        audio = bytes(range(256)) * 64
+        encoded = base64.b64encode(audio).decode()
+        for conversation_id, full_audio in (
+            ("conv_plain", encoded),
+            ("conv_escaped", encoded.replace("/", "\\/")),
+        ):
+            body = (
+                '{"type": "post_call_audio", "event_timestamp": 1705315800, '
+                f'"data": {{"agent_id": "agent_test123", "conversation_id": "{conversation_id}", '
+                f'"full_audio": "{full_audio}"}}}}'
+            ).encode()
+
+            with patch("app.webhooks.post_call.settings") as mock_settings:
+                mock_settings.PAYLOAD_STORAGE_PATH = str(tmp_path)
+                from app.webhooks.post_call import _process_webhook_payload
+
+                await _process_webhook_payload(body)
+
+            saved = tmp_path / conversation_id / f"{conversation_id}_audio.mp3"
+            assert saved.read_bytes() == audio
+
+    def test_saves_audio_in_chunks(self, tmp_path):
+        """Should decode multi-chunk base64 audio to the original bytes."""
+        import base64
+
+        audio = bytes(range(256)) * 1024  # spans several decode chunks
+        with patch("app.webhooks.post_call.settings") as mock_settings:
+            mock_settings.PAYLOAD_STORAGE_PATH = str(tmp_path)
+            from app.webhooks.post_call import _save_audio
+
+            path = _save_audio("conv_audio", base64.b64encode(audio).decode())
+
+        assert path.read_bytes() == audio
+
+    def test_saves_line_wrapped_audio(self, tmp_path):
+        """Should decode MIME-wrapped base64 audio across chunk boundaries."""
+        import base64
+
+        audio = bytes(range(256)) * 1024
+        with patch("app.webhooks.post_call.settings") as mock_settings:
+            mock_settings.PAYLOAD_STORAGE_PATH = str(tmp_path)
+            from app.webhooks.post_call import _save_audio
+
+            path = _save_audio("conv_wrapped", base64.encodebytes(audio).decode())
+
+        assert path.read_bytes() == audio
+
+    def test_rejects_invalid_audio_without_leaving_a_file(self, tmp_path):
+        """Should raise ValueError and remove the partial file on bad base64."""
+        with patch("app.webhooks.post_call.settings") as mock_settings:
+            mock_settings.PAYLOAD_STORAGE_PATH = str(tmp_path)
+            from app.webhooks.post_call import _save_audio
+
+            with pytest.raises(ValueError):
+                _save_audio("conv_bad", "QUJ")
+
+        assert not (tmp_path / "conv_bad" / "conv_bad_audio.mp3").exists()
+
+    def test_creates_conversation_directory_once(self, tmp_path):
+        """Should skip mkdir for a directory this process already created."""
+        from app.webhooks.post_call import _ensure_directory_exists
+
+        dir_path = tmp_path / "conv_dirs"
+        _ensure_directory_exists(dir_path)
+        assert dir_path.is_dir()
+
+        with patch.object(type(dir_path), "mkdir") as mock_mkdir:
+            _ensure_directory_exists(dir_path)
+
+        mock_mkdir.assert_not_called()